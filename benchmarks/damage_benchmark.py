@@ -0,0 +1,127 @@
+import contextlib
+import statistics
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+from rich.table import Table
+
+from benchmarks.damage_golden import build_cases, create_service
+from nuzlocke_tool.constants import CONSOLE, MATCHUP_CACHE_LIMIT
+from nuzlocke_tool.container import Container
+from nuzlocke_tool.damage import MatchupMatrix
+from nuzlocke_tool.models.models import DamageEngineType, MoveEffect, Pokemon
+from nuzlocke_tool.services.best_moves_service import BestMovesService
+
+CASE_COUNT = 200
+MATCHUP_CASE_COUNT = 50
+PERCENTILES = (50, 95, 99)
+REPEATS = 3
+
+
+def _calculate_cold_matchup_matrix(
+    container: Container,
+    attackers: list[tuple[Pokemon, int, int, int]],
+) -> MatchupMatrix:
+    return BestMovesService(container, container.game_state()).calculate_matchup_matrix(attackers)
+
+
+def _time_calls(calls: list[Callable[[], object]], repeats: int = REPEATS) -> list[float]:
+    latencies = []
+    for _ in range(repeats):
+        for call in calls:
+            start = time.perf_counter_ns()
+            with contextlib.suppress(ZeroDivisionError):
+                call()
+            latencies.append((time.perf_counter_ns() - start) / 1000)
+    return latencies
+
+
+def benchmark_calls(name: str, calls: list[Callable[[], object]], table: Table) -> None:
+    latencies = _time_calls(calls)
+    percentiles = np.percentile(latencies, PERCENTILES)
+    ops_per_second = 1_000_000 / statistics.fmean(latencies)
+    table.add_row(
+        name, str(len(latencies)), f"{ops_per_second:,.0f}", *(f"{value:,.1f}" for value in percentiles)
+    )
+
+
+def main() -> None:
+    container, service = create_service()
+    cases = build_cases(container, CASE_COUNT)
+    move_repository = container.move_repository()
+    stat_cache = container.stat_cache()
+    end_to_end = {
+        engine: [
+            partial(
+                service.calculate_best_moves_for_target,
+                case.species,
+                case.level,
+                case.stat_stages,
+                case.effects,
+                case.attackers,
+                engine,
+            )
+            for case in cases
+        ]
+        for engine in DamageEngineType
+    }
+    cold_matchups = [
+        partial(_calculate_cold_matchup_matrix, container, case.attackers)
+        for case in cases[:MATCHUP_CASE_COUNT]
+    ]
+    cached_matchups = [
+        partial(service.calculate_matchup_matrix, case.attackers) for case in cases[:MATCHUP_CACHE_LIMIT]
+    ]
+    attacker_stats = []
+    defender_stats = []
+    move_damage = []
+    special_moves = []
+    for case in cases:
+        defender_stats.append(
+            partial(service._compute_defender_stats, case.species, case.level, case.stat_stages),
+        )
+        defender = service._compute_defender_stats(case.species, case.level, case.stat_stages)
+        for pokemon, *stages in case.attackers:
+            attacker_stats.append(partial(service._compute_attacker_stats, pokemon, tuple(stages)))
+            attacker = service._compute_attacker_stats(pokemon, tuple(stages))
+            for move_name in pokemon.moves:
+                move_damage.append(
+                    partial(
+                        service._calculate_move_damage,
+                        pokemon,
+                        move_name,
+                        attacker,
+                        defender,
+                        case.effects,
+                    ),
+                )
+                move_record = move_repository.get_record(move_name)
+                if move_record.has_effect(MoveEffect.OHKO | MoveEffect.STATIC_DAMAGE):
+                    special_moves.append(
+                        partial(service._handle_special_damage_moves, move_record, pokemon, defender),
+                    )
+    table = Table(title=f"Damage engine ({CASE_COUNT} synthetic matchups x {REPEATS} repeats)")
+    table.add_column("Benchmark")
+    table.add_column("Calls", justify="right")
+    table.add_column("Ops/s", justify="right")
+    for percentile in PERCENTILES:
+        table.add_column(f"p{percentile} (us)", justify="right")
+    stat_cache.invalidate()
+    for engine, calls in end_to_end.items():
+        benchmark_calls(f"best moves ({engine.name.lower()})", calls, table)
+    benchmark_calls("matchup matrix (cold)", cold_matchups, table)
+    for call in cached_matchups:
+        call()
+    benchmark_calls("matchup matrix (cached)", cached_matchups, table)
+    benchmark_calls("_compute_attacker_stats", attacker_stats, table)
+    benchmark_calls("_compute_defender_stats", defender_stats, table)
+    benchmark_calls("_calculate_move_damage", move_damage, table)
+    benchmark_calls("_handle_special_damage_moves", special_moves, table)
+    CONSOLE.print(table)
+    CONSOLE.print(f"Stat cache: {stat_cache.hits} hits, {stat_cache.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+import argparse
+import json
+import math
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from nuzlocke_tool.constants import (
+    CONSOLE,
+    POKEMON_DV_MAX,
+    POKEMON_DV_MIN,
+    POKEMON_LEVEL_MAX,
+    POKEMON_LEVEL_MIN,
+    POKEMON_MOVES_LIMIT,
+    POKEMON_STAT_STAGE_MAX,
+    POKEMON_STAT_STAGE_MIN,
+)
+from nuzlocke_tool.container import Container
+from nuzlocke_tool.models.models import DamageEngineType, Pokemon, PokemonStatus
+from nuzlocke_tool.services.best_moves_service import BestMovesService
+
+CASE_COUNT = 200
+EFFECT_CHANCE = 0.3
+FIXTURE_FOLDER = Path(__file__).parent / "fixtures"
+GENERATION = "1"
+GOLDEN_FILE = FIXTURE_FOLDER / "damage_golden.json"
+SEED = 1234
+SNAPSHOT_FILE = FIXTURE_FOLDER / "damage_snapshots.json"
+TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class DamageCase:
+    species: str
+    level: int
+    stat_stages: tuple[int, int]
+    effects: tuple[bool, bool]
+    attackers: list[tuple[Pokemon, int, int, int]]
+
+
+def _find_mismatches(outputs: list[dict], golden: list[dict], snapshots: list[dict]) -> list[int]:
+    mismatches = []
+    for i, (output, golden_case, snapshot) in enumerate(zip(outputs, golden, snapshots, strict=True)):
+        engines_match = all(
+            _matches(output[engine.name.lower()], golden_case["best_moves"]) for engine in DamageEngineType
+        )
+        if not (
+            engines_match
+            and _matches(output.get("defender"), golden_case.get("defender"))
+            and _matches(output["snapshot"], snapshot)
+        ):
+            mismatches.append(i)
+    return mismatches
+
+
+def _find_matchup_mismatches(service: BestMovesService, cases: list[DamageCase]) -> list[int]:
+    mismatches = []
+    for i, case in enumerate(cases):
+        try:
+            _, move_results = service.calculate_best_moves_for_target(
+                case.species,
+                case.level,
+                (0, 0),
+                case.effects,
+                case.attackers,
+            )
+        except ZeroDivisionError:
+            continue
+        matchup_matrix = service.calculate_matchup_matrix(
+            case.attackers,
+            range(case.level, case.level + 1),
+            case.effects,
+        )
+        best_move = matchup_matrix.best_move(case.species, case.level)
+        expected = move_results[0] if move_results else None
+        if best_move is None or expected is None:
+            if best_move != expected:
+                mismatches.append(i)
+            continue
+        lta, _, _, dmg_min, dmg_max = best_move
+        if not (_matches(lta, expected[0]) and (dmg_min, dmg_max) == tuple(expected[3:])):
+            mismatches.append(i)
+    return mismatches
+
+
+def _load_fixture(fixture_file: Path) -> list[dict]:
+    with fixture_file.open("r") as f:
+        return json.load(f)
+
+
+def _matches(output: object, golden: object) -> bool:
+    if isinstance(output, float) and isinstance(golden, float | int):
+        return math.isclose(output, golden, rel_tol=TOLERANCE, abs_tol=TOLERANCE)
+    if isinstance(output, list) and isinstance(golden, list):
+        return len(output) == len(golden) and all(map(_matches, output, golden))
+    if isinstance(output, dict) and isinstance(golden, dict):
+        return output.keys() == golden.keys() and all(_matches(output[key], golden[key]) for key in output)
+    return output == golden
+
+
+def _random_stage(rng: random.Random) -> int:
+    return rng.randint(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
+
+
+def _run_case(service: BestMovesService, case: DamageCase) -> dict:
+    arguments = (case.species, case.level, case.stat_stages, case.effects, case.attackers)
+    output = {}
+    for engine in DamageEngineType:
+        try:
+            defender_stats, move_results = service.calculate_best_moves_for_target(*arguments, engine)
+        except ZeroDivisionError:
+            output[engine.name.lower()] = "ZeroDivisionError"
+            continue
+        output["defender"] = defender_stats
+        output[engine.name.lower()] = move_results
+    output["snapshot"] = {}
+    if isinstance(output.get(DamageEngineType.VECTORIZED.name.lower()), list):
+        output["snapshot"] = {
+            "ko_chances": service.calculate_ko_chances_for_target(*arguments)[1],
+            "turns_to_ko": service.calculate_turns_to_ko_for_target(*arguments)[1],
+        }
+    return json.loads(json.dumps(output))
+
+
+def build_cases(container: Container, count: int = CASE_COUNT, seed: int = SEED) -> list[DamageCase]:
+    rng = random.Random(seed)
+    pokemon_repository = container.pokemon_repository()
+    move_records = container.game_data_loader().move_records
+    species_names = pokemon_repository.get_all_species()
+    cases = []
+    for _ in range(count):
+        attackers = []
+        for i in range(rng.randint(1, 6)):
+            species = rng.choice(species_names)
+            learnset = [
+                move for move in pokemon_repository.get_moves_for_species(species) if move in move_records
+            ]
+            moves = rng.sample(learnset, min(POKEMON_MOVES_LIMIT, len(learnset)))
+            dvs = {stat: rng.randint(POKEMON_DV_MIN, POKEMON_DV_MAX) for stat in ("Atk", "Def", "Spd", "Spe")}
+            dvs["HP"] = POKEMON_DV_MIN
+            level = rng.randint(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX)
+            pokemon = Pokemon(f"P{i}", species, level, level, moves, dvs, "", PokemonStatus.ACTIVE)
+            attackers.append((pokemon, _random_stage(rng), _random_stage(rng), _random_stage(rng)))
+        cases.append(
+            DamageCase(
+                rng.choice(species_names),
+                rng.randint(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX),
+                (_random_stage(rng), _random_stage(rng)),
+                (rng.random() < EFFECT_CHANCE, rng.random() < EFFECT_CHANCE),
+                attackers,
+            ),
+        )
+    return cases
+
+
+def create_service() -> tuple[Container, BestMovesService]:
+    container = Container()
+    container.game_data_loader().load_generation(GENERATION)
+    return container, BestMovesService(container, container.game_state())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Check best-move damage against golden fixtures recorded from the original scalar engine, "
+            "the matchup matrix against the scalar engine, and KO chances and turns to KO against regression "
+            "snapshots."
+        ),
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Rewrite the regression snapshots from the current engine, the golden fixtures are never rewritten",
+    )
+    args = parser.parse_args(argv)
+    container, service = create_service()
+    cases = build_cases(container)
+    outputs = [_run_case(service, case) for case in cases]
+    if args.update:
+        with SNAPSHOT_FILE.open("w") as f:
+            json.dump([output["snapshot"] for output in outputs], f)
+        CONSOLE.print(f"Wrote {len(outputs)} regression snapshots to {SNAPSHOT_FILE}")
+        return 0
+    mismatches = _find_mismatches(outputs, _load_fixture(GOLDEN_FILE), _load_fixture(SNAPSHOT_FILE))
+    matchup_mismatches = _find_matchup_mismatches(service, cases)
+    if matchup_mismatches:
+        CONSOLE.print(
+            f"[red]{len(matchup_mismatches)} of {len(cases)} matchup matrix best moves differ from the "
+            f"scalar engine: {matchup_mismatches[:10]}[/red]",
+        )
+    if mismatches:
+        CONSOLE.print(f"[red]{len(mismatches)} of {len(outputs)} cases differ: {mismatches[:10]}[/red]")
+    if mismatches or matchup_mismatches:
+        return 1
+    CONSOLE.print(
+        f"All {len(outputs)} cases match the golden best moves, the matchup matrix and the regression snapshots",
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
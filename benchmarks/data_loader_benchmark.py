@@ -0,0 +1,48 @@
+import statistics
+import time
+from pathlib import Path
+
+from rich.table import Table
+
+from nuzlocke_tool.config import PathConfig
+from nuzlocke_tool.constants import CONSOLE
+from nuzlocke_tool.yaml_loader import get_yaml_cache_file, load_yaml_file
+
+REPEATS = 20
+RESOURCE_FILES = ("gen1_pokemon.yaml", "gen1_moves.yaml", "locations.yaml")
+
+
+def _time_load(file_path: Path) -> float:
+    start = time.perf_counter()
+    load_yaml_file(file_path)
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark_file(file_path: Path, repeats: int = REPEATS) -> tuple[float, float]:
+    cold_times = []
+    warm_times = []
+    for _ in range(repeats):
+        get_yaml_cache_file(file_path).unlink(missing_ok=True)
+        cold_times.append(_time_load(file_path))
+        warm_times.append(_time_load(file_path))
+    return statistics.median(cold_times), statistics.median(warm_times)
+
+
+def main() -> None:
+    table = Table(title=f"YAML load time (median of {REPEATS})")
+    table.add_column("File")
+    table.add_column("Cold (ms)", justify="right")
+    table.add_column("Warm (ms)", justify="right")
+    table.add_column("Speedup", justify="right")
+    total_cold = total_warm = 0.0
+    for filename in RESOURCE_FILES:
+        cold, warm = benchmark_file(PathConfig.resources_folder() / filename)
+        total_cold += cold
+        total_warm += warm
+        table.add_row(filename, f"{cold:.2f}", f"{warm:.2f}", f"{cold / warm:.1f}x")
+    table.add_row("Total", f"{total_cold:.2f}", f"{total_warm:.2f}", f"{total_cold / total_warm:.1f}x")
+    CONSOLE.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import yaml
+from rich.table import Table
+
+from nuzlocke_tool.constants import (
+    CONSOLE,
+    POKEMON_DV_MAX,
+    POKEMON_DV_MIN,
+    POKEMON_LEVEL_MAX,
+    POKEMON_LEVEL_MIN,
+    POKEMON_MOVES_LIMIT,
+)
+from nuzlocke_tool.models.models import PokemonStatus, SaveFormat
+from nuzlocke_tool.save_codec import YAML_DUMPER, YAML_LOADER, decode_save, encode_save
+from nuzlocke_tool.services.operation_log import SaveOperation
+from nuzlocke_tool.services.save_service import SaveService
+from nuzlocke_tool.services.sqlite_save_service import SqliteSaveService
+
+FAILED_ENCOUNTER_RATIO = 4
+LOCATION_COUNT = 120
+MOVE_COUNT = 165
+PARTY_SIZES = (10, 1_000, 10_000)
+REPEATS = 3
+SEED = 1234
+SPECIES_COUNT = 151
+
+
+def _time_call(call: Callable[[], object], repeats: int = REPEATS) -> float:
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000
+
+
+def _time_sqlite(folder: Path, snapshot: dict) -> tuple[float, float, float]:
+    folder.mkdir()
+    save_file = folder / "snapshot.sav"
+    save_file.write_bytes(encode_save(snapshot, SaveFormat.BINARY))
+    game_state = SaveService().load_session(save_file)
+    save_service = SqliteSaveService(folder / "runs.db")
+    game_state.save_file = save_service.create_save_file(game_state.game, game_state.ruleset)
+    pokemon = game_state.pokemon[-1]
+
+    def record() -> None:
+        pokemon.level = POKEMON_LEVEL_MAX if pokemon.level == POKEMON_LEVEL_MIN else POKEMON_LEVEL_MIN
+        save_service.record(game_state, SaveOperation.update_pokemon(game_state, pokemon))
+        save_service.wait_for_writes()
+
+    def save() -> None:
+        save_service.save_session(game_state)
+        save_service.wait_for_writes()
+
+    return (
+        _time_call(save),
+        _time_call(partial(save_service.load_session, game_state.save_file)),
+        _time_call(record),
+    )
+
+
+def build_snapshot(pokemon_count: int, seed: int = SEED) -> dict:
+    rng = random.Random(seed)
+    species = [f"Species{i}" for i in range(SPECIES_COUNT)]
+    moves = [f"Move{i}" for i in range(MOVE_COUNT)]
+    locations = [f"Location{i}" for i in range(LOCATION_COUNT)]
+    pokemon = [
+        {
+            "nickname": f"Mon{i}",
+            "species": rng.choice(species),
+            "level": rng.randint(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX),
+            "caught_level": rng.randint(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX),
+            "moves": rng.sample(moves, POKEMON_MOVES_LIMIT),
+            "dvs": {
+                stat: rng.randint(POKEMON_DV_MIN, POKEMON_DV_MAX)
+                for stat in ("HP", "Atk", "Def", "Spd", "Spe")
+            },
+            "encountered": rng.choice(locations),
+            "status": rng.choice(list(PokemonStatus)).name,
+        }
+        for i in range(pokemon_count)
+    ]
+    failed_encounters = [
+        {
+            "location": rng.choice(locations),
+            "species": rng.choice(species),
+            "level": rng.randint(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX),
+        }
+        for _ in range(pokemon_count // FAILED_ENCOUNTER_RATIO)
+    ]
+    return {
+        "game": "Red",
+        "ruleset": "Standard",
+        "sub_region_clause": False,
+        "journal_file": "journal/Red_Standard_1.journal",
+        "save_file": "saves/Red_Standard_1.sav",
+        "log_sequence": 0,
+        "pokemon": pokemon,
+        "encounters": [entry["encountered"] for entry in pokemon],
+        "failed_encounters": failed_encounters,
+        "decisions": {"starter": "Bulbasaur", "fossil": "Dome Fossil"},
+    }
+
+
+def main() -> None:
+    table = Table(title=f"Save formats (median of {REPEATS} repeats)")
+    table.add_column("Pokemon", justify="right")
+    table.add_column("Format")
+    table.add_column("Size (KiB)", justify="right")
+    table.add_column("Save (ms)", justify="right")
+    table.add_column("Load (ms)", justify="right")
+    for pokemon_count in PARTY_SIZES:
+        snapshot = build_snapshot(pokemon_count)
+        yaml_payload = encode_save(snapshot, SaveFormat.YAML)
+        binary_payload = encode_save(snapshot, SaveFormat.BINARY)
+        formats = [
+            (
+                f"yaml ({yaml.SafeLoader.__name__})",
+                partial(yaml.dump, snapshot, Dumper=yaml.SafeDumper),
+                partial(yaml.load, yaml_payload, Loader=yaml.SafeLoader),
+                yaml_payload,
+            ),
+            (
+                f"yaml ({YAML_LOADER.__name__})",
+                partial(encode_save, snapshot, SaveFormat.YAML),
+                partial(decode_save, yaml_payload),
+                yaml_payload,
+            ),
+            (
+                "binary",
+                partial(encode_save, snapshot, SaveFormat.BINARY),
+                partial(decode_save, binary_payload),
+                binary_payload,
+            ),
+        ]
+        for name, save, load, payload in formats:
+            table.add_row(
+                f"{pokemon_count:,}",
+                name,
+                f"{len(payload) / 1024:,.1f}",
+                f"{_time_call(save):,.2f}",
+                f"{_time_call(load):,.2f}",
+            )
+    CONSOLE.print(table)
+    sqlite_table = Table(title=f"SQLite run store (median of {REPEATS} repeats)")
+    sqlite_table.add_column("Pokemon", justify="right")
+    sqlite_table.add_column("Snapshot (ms)", justify="right")
+    sqlite_table.add_column("Load (ms)", justify="right")
+    sqlite_table.add_column("Row update (ms)", justify="right")
+    with tempfile.TemporaryDirectory() as folder:
+        for pokemon_count in PARTY_SIZES:
+            snapshot_ms, load_ms, record_ms = _time_sqlite(
+                Path(folder) / str(pokemon_count),
+                build_snapshot(pokemon_count),
+            )
+            sqlite_table.add_row(
+                f"{pokemon_count:,}",
+                f"{snapshot_ms:,.2f}",
+                f"{load_ms:,.2f}",
+                f"{record_ms:,.2f}",
+            )
+    CONSOLE.print(sqlite_table)
+    CONSOLE.print(f"Save files use {YAML_DUMPER.__name__} and {YAML_LOADER.__name__}")
+
+
+if __name__ == "__main__":
+    main()
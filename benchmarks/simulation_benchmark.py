@@ -0,0 +1,74 @@
+import os
+
+from rich.table import Table
+
+from nuzlocke_tool.constants import CONSOLE
+from nuzlocke_tool.data_loader import GameDataLoader
+from nuzlocke_tool.simulation import BattleSimulator, Combatant
+from nuzlocke_tool.sweep import SweepTables
+
+GENERATION = "1"
+MATCHUPS = (
+    (("Charmeleon", 25, ("Ember", "Slash", "Scratch", "Leer")), ("Onix", 14, ("Tackle", "Screech", "Bind"))),
+    (
+        ("Ivysaur", 24, ("Vine Whip", "Razor Leaf", "Tackle", "Leech Seed")),
+        ("Starmie", 21, ("Tackle", "Water Gun")),
+    ),
+    (
+        ("Pikachu", 26, ("Thundershock", "Quick Attack", "Thunder Wave")),
+        ("Raichu", 28, ("Thunderbolt", "Mega Punch")),
+    ),
+    (
+        ("Wartortle", 36, ("Bite", "Water Gun", "Skull Bash")),
+        ("Golem", 40, ("Explosion", "Earthquake", "Rock Slide")),
+    ),
+)
+SEED = 2024
+TRIALS = 20000
+
+
+def _build_matchups() -> list[tuple[Combatant, Combatant]]:
+    dvs = {"HP": 8, "Atk": 8, "Def": 8, "Spd": 8, "Spe": 8}
+    return [
+        (Combatant(species, level, dvs, moves), Combatant.wild(*defender))
+        for (species, level, moves), defender in MATCHUPS
+    ]
+
+
+def main() -> None:
+    tables = SweepTables.from_generation_data(GameDataLoader().load_generation(GENERATION))
+    matchups = _build_matchups()
+    results = Table(title=f"Battle outcomes ({TRIALS:,} trials per matchup, seed {SEED})")
+    results.add_column("Matchup")
+    results.add_column("Win %", justify="right")
+    results.add_column("HP left", justify="right")
+    results.add_column("Turns", justify="right")
+    results.add_column("DV samples", justify="right")
+    reports = BattleSimulator(tables, 1).run(matchups, TRIALS, SEED)
+    for (attacker, defender), report in zip(matchups, reports, strict=True):
+        results.add_row(
+            f"{attacker.species} Lv{attacker.level} vs {defender.species} Lv{defender.level}",
+            f"{report.win_probability:.1%}",
+            f"{report.expected_hp_remaining:.1f}",
+            f"{report.mean_turns:.2f}",
+            str(report.dv_samples),
+        )
+    CONSOLE.print(results)
+    throughput = Table(title="Simulation throughput")
+    throughput.add_column("Workers", justify="right")
+    throughput.add_column("Simulations/s", justify="right")
+    throughput.add_column("Speedup", justify="right")
+    baseline = None
+    for max_workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        report = BattleSimulator(tables, max_workers).run(matchups, TRIALS, SEED)[0]
+        baseline = baseline or report.simulations_per_second
+        throughput.add_row(
+            str(max_workers),
+            f"{report.simulations_per_second:,.0f}",
+            f"{report.simulations_per_second / baseline:.2f}x",
+        )
+    CONSOLE.print(throughput)
+
+
+if __name__ == "__main__":
+    main()
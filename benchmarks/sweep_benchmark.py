@@ -0,0 +1,50 @@
+import os
+import time
+
+from rich.table import Table
+
+from nuzlocke_tool.constants import CONSOLE
+from nuzlocke_tool.data_loader import GameDataLoader
+from nuzlocke_tool.sweep import SweepAttacker, SweepRunner, SweepTables, expand_evolutions
+
+GENERATION = "1"
+PARTY = (
+    ("Bulbasaur", ("Vine Whip", "Razor Leaf", "Body Slam", "Swords Dance")),
+    ("Charmander", ("Ember", "Slash", "Flamethrower", "Fire Spin")),
+    ("Squirtle", ("Bubblebeam", "Surf", "Bite", "Ice Beam")),
+    ("Pidgey", ("Gust", "Wing Attack", "Quick Attack", "Sky Attack")),
+    ("Abra", ("Psychic", "Seismic Toss", "Thunder Wave", "Reflect")),
+    ("Geodude", ("Rock Throw", "Earthquake", "Explosion", "Rock Slide")),
+)
+
+
+def _build_attackers(loader: GameDataLoader) -> list[SweepAttacker]:
+    dvs = {"HP": 8, "Atk": 8, "Def": 8, "Spd": 8, "Spe": 8}
+    attackers = [SweepAttacker(species, species, 50, dvs, moves) for species, moves in PARTY]
+    return expand_evolutions(attackers, loader.pokemon_data)
+
+
+def benchmark_workers(tables: SweepTables, attackers: list[SweepAttacker], max_workers: int) -> float:
+    start = time.perf_counter()
+    cells = sum(chunk.long_term_average.size for chunk in SweepRunner(tables, max_workers).run(attackers))
+    return cells / (time.perf_counter() - start)
+
+
+def main() -> None:
+    loader = GameDataLoader()
+    tables = SweepTables.from_generation_data(loader.load_generation(GENERATION))
+    attackers = _build_attackers(loader)
+    table = Table(title=f"Sweep throughput ({len(attackers)} attackers x dex x levels 1-100)")
+    table.add_column("Workers", justify="right")
+    table.add_column("Matchups/s", justify="right")
+    table.add_column("Speedup", justify="right")
+    baseline = None
+    for max_workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        throughput = benchmark_workers(tables, attackers, max_workers)
+        baseline = baseline or throughput
+        table.add_row(str(max_workers), f"{throughput:,.0f}", f"{throughput / baseline:.2f}x")
+    CONSOLE.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,11 @@ from platform import python_version
 from PyQt6.QtWidgets import QApplication
 
 from nuzlocke_tool import __version__
+from nuzlocke_tool.constants import DAMAGE_ENGINE_ENV, SAVE_BACKEND_ENV
 from nuzlocke_tool.container import Container
 from nuzlocke_tool.gui.main_window import NuzlockeTrackerMainWindow
 from nuzlocke_tool.logs import setup_logging
+from nuzlocke_tool.models.models import DamageEngineType, SaveBackend
 
 LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +19,12 @@ def main() -> None:
     LOGGER.info("Python v%s", python_version())
     LOGGER.info("Nuzlocke Tool v%s", __version__)
     container = Container()
+    container.config.damage_engine.from_env(
+        DAMAGE_ENGINE_ENV, default=DamageEngineType.SCALAR.name.lower(), as_=str.lower
+    )
+    container.config.save_backend.from_env(
+        SAVE_BACKEND_ENV, default=SaveBackend.FILE.name.lower(), as_=str.lower
+    )
     app = QApplication(sys.argv)
     window = NuzlockeTrackerMainWindow(container)
     window.showMaximized()
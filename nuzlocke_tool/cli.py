@@ -0,0 +1,201 @@
+import argparse
+import json
+import logging
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
+
+from nuzlocke_tool import __version__
+from nuzlocke_tool.constants import (
+    CALC_QUERY_BEST_MOVES,
+    CALC_QUERY_KO_CHANCES,
+    CALC_QUERY_TURNS_TO_KO,
+    DAMAGE_ENGINE_ENV,
+    KO_TURN_LIMIT,
+)
+from nuzlocke_tool.container import Container
+from nuzlocke_tool.models.models import DamageEngineType, Pokemon, SaveBackend
+from nuzlocke_tool.services.best_moves_service import BestMovesService
+from nuzlocke_tool.services.game_service import GameService
+from nuzlocke_tool.services.pokemon_service import PokemonService
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _build_attackers(
+    party: list[Pokemon],
+    query: dict,
+) -> list[tuple[Pokemon, int, int, int]]:
+    party_stages = query.get("party_stages", {})
+    nicknames = query.get("party")
+    attackers = []
+    for pokemon in party:
+        if nicknames is not None and pokemon.nickname not in nicknames:
+            continue
+        atk_stage, spe_stage, spd_stage = party_stages.get(pokemon.nickname, (0, 0, 0))
+        attackers.append((pokemon, int(atk_stage), int(spe_stage), int(spd_stage)))
+    return attackers
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="NuzlockeTool-calc",
+        description="Run damage calculations for a saved session and stream JSON Lines results.",
+    )
+    parser.add_argument("save_file", type=Path, help="Path to a .sav file, or a run name in the database")
+    parser.add_argument(
+        "queries",
+        nargs="?",
+        type=argparse.FileType("r"),
+        default="-",
+        help="JSON Lines file of matchup queries, or - to read from stdin",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=[engine.name.lower() for engine in DamageEngineType],
+        help=f"Damage engine for best-move queries, defaults to {DAMAGE_ENGINE_ENV} or scalar",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=[backend.name.lower() for backend in SaveBackend],
+        default=SaveBackend.FILE.name.lower(),
+        help="Where the saved session is stored",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    return parser.parse_args(argv)
+
+
+def _process_query(
+    best_moves_service: BestMovesService,
+    party: list[Pokemon],
+    query: dict,
+    engine: DamageEngineType,
+) -> dict:
+    try:
+        return _run_query(best_moves_service, party, query, engine)
+    except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def _read_queries(stream: TextIO) -> Iterator[tuple[int, dict | None, str | None]]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            query = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"invalid JSON: {e.msg}"
+            continue
+        if not isinstance(query, dict):
+            yield line_number, None, "query must be a JSON object"
+            continue
+        yield line_number, query, None
+
+
+def _run_query(
+    best_moves_service: BestMovesService,
+    party: list[Pokemon],
+    query: dict,
+    engine: DamageEngineType,
+) -> dict:
+    kind = query.get("kind", CALC_QUERY_BEST_MOVES)
+    species = query["species"]
+    level = int(query["level"])
+    def_stage, spe_stage = query.get("stat_stages", (0, 0))
+    stat_stages = (int(def_stage), int(spe_stage))
+    reflect_active, light_screen_active = query.get("effects", (False, False))
+    effects = (bool(reflect_active), bool(light_screen_active))
+    attackers = _build_attackers(party, query)
+    if kind == CALC_QUERY_BEST_MOVES:
+        defender_stats, move_results = best_moves_service.calculate_best_moves_for_target(
+            species,
+            level,
+            stat_stages,
+            effects,
+            attackers,
+            engine,
+        )
+        results = [
+            {
+                "nickname": nickname,
+                "move": move_name,
+                "long_term_average": long_term_avg,
+                "damage_min": dmg_min,
+                "damage_max": dmg_max,
+            }
+            for long_term_avg, nickname, move_name, dmg_min, dmg_max in move_results
+        ]
+    elif kind == CALC_QUERY_KO_CHANCES:
+        defender_stats, ko_results = best_moves_service.calculate_ko_chances_for_target(
+            species,
+            level,
+            stat_stages,
+            effects,
+            attackers,
+        )
+        results = [
+            {"nickname": nickname, "move": move_name, "ko_probability": ko_probability}
+            for ko_probability, nickname, move_name in ko_results
+        ]
+    elif kind == CALC_QUERY_TURNS_TO_KO:
+        defender_stats, turn_results = best_moves_service.calculate_turns_to_ko_for_target(
+            species,
+            level,
+            stat_stages,
+            effects,
+            attackers,
+            int(query.get("max_turns", KO_TURN_LIMIT)),
+        )
+        results = [
+            {"nickname": nickname, "move": move_name, "turn_probabilities": list(probabilities)}
+            for probabilities, nickname, move_name in turn_results
+        ]
+    else:
+        err_msg = f"Unknown query kind: {kind}"
+        raise ValueError(err_msg)
+    return {"kind": kind, "defender": defender_stats, "results": results}
+
+
+def _write_line(output: TextIO, line: dict) -> None:
+    output.write(json.dumps(line))
+    output.write("\n")
+    output.flush()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(
+        format="[%(levelname)s] {%(name)s} | %(message)s",
+        level=logging.WARNING,
+        stream=sys.stderr,
+    )
+    container = Container()
+    container.config.damage_engine.from_env(
+        DAMAGE_ENGINE_ENV, default=DamageEngineType.SCALAR.name.lower(), as_=str.lower
+    )
+    if args.engine is not None:
+        container.config.damage_engine.from_value(args.engine)
+    container.config.save_backend.from_value(args.backend)
+    GameService(container).load_game(args.save_file)
+    game_state = container.game_state()
+    best_moves_service = BestMovesService(container, game_state)
+    party = PokemonService(container, game_state).active_pokemon
+    engine = DamageEngineType[container.config.damage_engine().upper()]
+    failures = 0
+    with args.queries as stream:
+        for line_number, query, error in _read_queries(stream):
+            line = (
+                _process_query(best_moves_service, party, query, engine)
+                if error is None
+                else {"error": error}
+            )
+            if "error" in line:
+                failures += 1
+                LOGGER.warning("Query on line %s failed: %s", line_number, line["error"])
+            _write_line(sys.stdout, {"line": line_number, **line})
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
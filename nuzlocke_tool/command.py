@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from nuzlocke_tool.container import Container
 from nuzlocke_tool.models.models import EventType, GameState, Pokemon, PokemonStatus
 from nuzlocke_tool.models.view_models import PokemonCardViewModel
+from nuzlocke_tool.services.operation_log import SaveOperation
 from nuzlocke_tool.services.pokemon_service import PokemonService
 
 
@@ -56,9 +57,15 @@ class EditPokemonCommand(Command):
             "encountered": self._view_model.encountered,
         }
 
+    def _invalidate_stats(self) -> None:
+        stat_cache = self._container.stat_cache()
+        stat_cache.invalidate(self._original_pokemon.species)
+        stat_cache.invalidate(self._pokemon.species)
+
     def execute(self) -> bool:
         success = self._pokemon_service.edit_pokemon(self._pokemon, self._original_pokemon.species)
         if success:
+            self._invalidate_stats()
             self._view_model.nickname = self._pokemon.nickname
             self._view_model.species = self._pokemon.species
             self._view_model.level = self._pokemon.level
@@ -98,7 +105,10 @@ class EditPokemonCommand(Command):
             self._view_model.evolution_options = original_view_model.evolution_options.copy()
             self._view_model.available_moves = original_view_model.available_moves.copy()
             self._view_model.image_path = original_view_model.image_path
-        self._save_service.save_session(self._game_state)
+        self._invalidate_stats()
+        self._save_service.record(
+            self._game_state, SaveOperation.update_pokemon(self._game_state, self._pokemon)
+        )
         self._container.event_manager().publish(EventType.POKEMON_EDITED, {"pokemon": self._pokemon})
         return True
 
@@ -127,7 +137,10 @@ class TransferPokemonCommand(Command):
     def undo(self) -> bool:
         previous_status = self._pokemon.status
         self._pokemon.status = self._original_status
-        self._save_service.save_session(self._game_state)
+        self._save_service.record(
+            self._game_state,
+            SaveOperation.transfer_pokemon(self._game_state, self._pokemon),
+        )
         self._container.event_manager().publish(
             EventType.POKEMON_TRANSFERRED,
             {"previous_status": previous_status, "new_status": self._original_status},
@@ -170,7 +183,10 @@ class UpdateMoveCommand(Command):
     def undo(self) -> bool:
         self._pokemon.moves[self._move_index] = self._old_move
         self._view_model.moves[self._move_index] = self._old_move
-        self._save_service.save_session(self._game_state)
+        self._save_service.record(
+            self._game_state,
+            SaveOperation.learn_move(self._game_state, self._pokemon, self._move_index),
+        )
         self._container.event_manager().publish(EventType.MOVE_UPDATED, {"pokemon": self._pokemon})
         return True
 
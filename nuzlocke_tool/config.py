@@ -5,6 +5,15 @@ LOGGER = logging.getLogger(__name__)
 
 
 class PathConfig:
+    @staticmethod
+    def cache_folder() -> Path:
+        folder = PathConfig.get_project_root() / "cache"
+        if not folder.exists():
+            LOGGER.warning("Cache folder does not exist: %s", folder)
+            folder.mkdir(parents=True, exist_ok=True)
+            LOGGER.info("Cache folder created.")
+        return folder
+
     @staticmethod
     def decisions_file() -> Path:
         file = PathConfig.resources_folder() / "decisions.yaml"
@@ -53,6 +62,10 @@ class PathConfig:
             LOGGER.critical("Rules file does not exist: %s", file)
         return file
 
+    @staticmethod
+    def save_database() -> Path:
+        return PathConfig.save_folder() / "runs.db"
+
     @staticmethod
     def save_folder() -> Path:
         folder = PathConfig.get_project_root() / "save"
@@ -1,7 +1,5 @@
 import logging
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QDialogButtonBox
 from rich.console import Console
 from rich.theme import Theme
 
@@ -17,8 +15,26 @@ THEME = Theme(
 CONSOLE = Console(theme=THEME)
 LOG_FILE_LIMIT = 20
 LOGGER = logging.getLogger(__name__)
+YAML_CACHE_PATH_HASH_LENGTH = 16
+YAML_CACHE_VERSION = 1
 
 ACTIVE_PARTY_LIMIT = 6
+BATTLE_TURN_LIMIT = 100
+BEST_MOVE_RESULTS_LIMIT = 5
+CALC_QUERY_BEST_MOVES = "best_moves"
+CALC_QUERY_KO_CHANCES = "ko_chances"
+CALC_QUERY_TURNS_TO_KO = "turns_to_ko"
+DAMAGE_ENGINE_ENV = "NUZLOCKE_DAMAGE_ENGINE"
+DAMAGE_ROLL_MAX = 255
+DAMAGE_ROLL_MIN = 217
+GENERATION_CACHE_LIMIT = 3
+KO_PROBABILITY_TOLERANCE = 1e-9
+KO_THRESHOLD_CACHE_LIMIT = 256
+KO_THRESHOLD_PROBABILITY = 0.9
+KO_TURN_LIMIT = 5
+MATCHUP_CACHE_LIMIT = 8
+MATCHUP_LEVEL_CHUNK = 10
+MOVE_CATEGORY_SPECIAL = "Special"
 ONE_BYTE = 255
 POKEMON_DV_MIN = 0
 POKEMON_DV_MAX = 15
@@ -27,27 +43,19 @@ POKEMON_LEVEL_MIN = 1
 POKEMON_MOVES_LIMIT = 4
 POKEMON_STAT_STAGE_MAX = 6
 POKEMON_STAT_STAGE_MIN = -6
-
-DOUBLE_ATTACK_MOVES = {"Bonemerang", "Double Kick", "Twineedle"}
-FLINCH_10_MOVES = {"Bite", "Bone Club", "Hyper Fang"}
-FLINCH_30_MOVES = {"Headbutt", "Low Kick", "Rolling Kick", "Stomp"}
-HIGH_CRIT_MOVES = {"Crabhammer", "Karate Chop", "Razor Leaf", "Slash"}
-MULTI_HIT_MOVES = {
-    "Barrage",
-    "Bind",
-    "Clamp",
-    "Comet Punch",
-    "Doubleslap",
-    "Fire Spin",
-    "Fury Attack",
-    "Fury Swipes",
-    "Pin Missile",
-    "Spike Cannon",
-    "Wrap",
-}
-OHKO_MOVES = {"Fissure", "Guillotine", "Horn Drill"}
-SELFDESTRUCT_MOVES = {"Explosion", "Selfdestruct"}
-SPECIAL_TYPES = {"Dragon", "Electric", "Fire", "Grass", "Ice", "Psychic", "Water"}
+SAVE_BACKEND_ENV = "NUZLOCKE_SAVE_BACKEND"
+SAVE_BACKUP_COUNT = 3
+SAVE_BINARY_MAGIC = b"NZSV"
+SAVE_BINARY_VERSION = 1
+SAVE_LOG_COMPACT_LIMIT = 200
+SIMULATION_TRIAL_CHUNK = 2500
+SIMULATION_TRIALS = 10000
+STAT_CACHE_LIMIT = 1024
+SWEEP_LEVEL_CHUNK = 25
+THREAT_RESULTS_LIMIT = 10
+WORST_MATCHUP_RESULTS_LIMIT = 10
+
+MULTI_HIT_WEIGHTS = {2: 3 / 8, 3: 3 / 8, 4: 1 / 8, 5: 1 / 8}
 STAT_STAGE_MULTIPLIER = {
     -6: 0.25,
     -5: 0.28,
@@ -63,60 +71,8 @@ STAT_STAGE_MULTIPLIER = {
     5: 3.5,
     6: 4,
 }
-STATIC_DAMAGE_MOVES = {"Dragon Rage", "Night Shade", "Psywave", "Seismic Toss", "Sonicboom"}
-SWIFT_MOVES = {"Swift"}
-TYPE_CHART = {
-    "Normal": {"Rock": 0.5, "Ghost": 0},
-    "Fighting": {
-        "Normal": 2,
-        "Flying": 0.5,
-        "Poison": 0.5,
-        "Rock": 2,
-        "Bug": 0.5,
-        "Ghost": 0,
-        "Psychic": 0.5,
-        "Ice": 2,
-    },
-    "Flying": {"Fighting": 2, "Rock": 0.5, "Bug": 2, "Grass": 2, "Electric": 0.5},
-    "Poison": {"Poison": 0.5, "Ground": 0.5, "Rock": 0.5, "Bug": 2, "Ghost": 0.5, "Grass": 2},
-    "Ground": {"Flying": 0, "Poison": 2, "Rock": 2, "Bug": 0.5, "Fire": 2, "Grass": 0.5, "Electric": 2},
-    "Rock": {"Fighting": 0.5, "Flying": 2, "Ground": 0.5, "Bug": 2, "Fire": 2, "Ice": 2},
-    "Bug": {
-        "Fighting": 0.5,
-        "Flying": 0.5,
-        "Poison": 2,
-        "Ghost": 0.5,
-        "Fire": 0.5,
-        "Grass": 2,
-        "Psychic": 2,
-    },
-    "Ghost": {"Normal": 0, "Ghost": 2, "Psychic": 0},
-    "Fire": {"Rock": 0.5, "Bug": 2, "Fire": 0.5, "Water": 0.5, "Grass": 2, "Ice": 2, "Dragon": 0.5},
-    "Water": {"Ground": 2, "Rock": 2, "Fire": 2, "Water": 0.5, "Grass": 0.5, "Dragon": 0.5},
-    "Grass": {
-        "Flying": 0.5,
-        "Poison": 0.5,
-        "Ground": 2,
-        "Rock": 2,
-        "Bug": 0.5,
-        "Fire": 0.5,
-        "Water": 2,
-        "Grass": 0.5,
-        "Dragon": 0.5,
-    },
-    "Electric": {"Flying": 2, "Ground": 0, "Water": 2, "Grass": 0.5, "Electric": 0.5, "Dragon": 0.5},
-    "Psychic": {"Fighting": 2, "Poison": 2, "Psychic": 0.5},
-    "Ice": {"Flying": 2, "Ground": 2, "Water": 0.5, "Grass": 2, "Ice": 0.5, "Dragon": 2},
-    "Dragon": {"Dragon": 2},
-}
-
-ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
-ALIGN_H_CENTER = Qt.AlignmentFlag.AlignHCenter
-ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft
-ALIGN_TOP = Qt.AlignmentFlag.AlignTop
-BUTTON_CANCEL = QDialogButtonBox.StandardButton.Cancel
-BUTTON_OK = QDialogButtonBox.StandardButton.Ok
 
+AUTOSAVE_DELAY = 500
 SPACING = 5
 IMAGE_SIZE_POKEMON = 56
 LABEL_POKEMON_CARD_WIDTH = 60
@@ -138,6 +94,7 @@ TABLE_COLOR_DEAD = "#424242"
 
 DIALOG_ADD_POKEMON_TITLE = "Add New Pokemon"
 DIALOG_FAILED_ENCOUNTER_TITLE = "Add Failed Encounter"
+DIALOG_LOAD_SESSION_TITLE = "Select Save File"
 DIALOG_NEW_SESSION_TITLE = "Start New Session"
 MAIN_WINDOW_TITLE = "Nuzlocke Tracker"
 
@@ -159,9 +116,14 @@ TAB_TOOLS_NAME = "Tools"
 
 BUTTON_ADD_POKEMON = "Add Pokemon"
 BUTTON_CALC_MOVE = "Calculate Best Moves"
+BUTTON_CALC_THREATS = "Calculate Threats"
+BUTTON_WORST_MATCHUPS = "Show Worst Matchups"
 
 LABEL_ATTACK = "Attack"
 LABEL_ATTACK_SHORT = "Atk"
+LABEL_ATTACK_STAGE = "Attack Stage:"
+LABEL_ATTACKING_POKEMON = "Select Attacking Pokemon:"
+LABEL_CALCULATING = "Calculating..."
 LABEL_CHECKBOX_LIGHT_SCREEN = "Light Screen"
 LABEL_CHECKBOX_REFLECT = "Reflect"
 LABEL_CHECKBOX_SUBREGIONS = "Enable Multiple Floors Clause"
@@ -173,6 +135,7 @@ LABEL_DECISION_MAGIKARP = "Buying Magikarp or Wild Encounter"
 LABEL_DECISION_SAFFRON_GIFT = "Fighting Dojo or Silph Co. gift"
 LABEL_DECISION_STARTER = "a Starter"
 LABEL_DEFENDING_POKEMON = "Select Defending Pokemon:"
+LABEL_DEFENSE = "Defense"
 LABEL_DEFENSE_SHORT = "Def"
 LABEL_DEFENSE_STAGE = "Defense Stage:"
 LABEL_DETERMINANT_VALUES_SHORT = "DVs:"
@@ -186,18 +149,24 @@ LABEL_LEVEL = "Level:"
 LABEL_LOCATION = f"{LABEL_HEADER_LOCATION}:"
 LABEL_MOVES = "Moves:"
 LABEL_NICKNAME = "Nickname:"
+LABEL_NO_ATTACKING_POKEMON = "No data for attacking Pokemon."
 LABEL_NO_DEFENDING_POKEMON = "No data for defending Pokemon."
 LABEL_NO_MOVES = "No valid moves found."
+LABEL_NO_OHKO = "no OHKO at any stage or level"
+LABEL_NO_THREATS = "No threatening moves found."
 LABEL_PARTY_MEMBER = "Party Member"
 LABEL_RULESET = "Ruleset:"
+LABEL_SAVE_FILE = "Save File:"
 LABEL_SPECIAL = "Special"
 LABEL_SPECIAL_SHORT = "Spe"
 LABEL_SPECIAL_STAGE = "Special Stage:"
 LABEL_SPECIES = "Species:"
 LABEL_SPEED = "Speed"
 LABEL_SPEED_SHORT = "Spd"
+LABEL_SPEED_STAGE = "Speed Stage:"
 LABEL_TOOL_BEST_MOVE = "Best Move"
 LABEL_TOOL_RANDOM_DECISION = "Randomize a Decision"
+LABEL_TOOL_THREAT_ANALYSIS = "Threat Analysis"
 
 MSG_BOX_TITLE_INPUT_ERR = "Input Error"
 MSG_BOX_TITLE_NO_FILE = "File Not Found"
@@ -2,13 +2,21 @@ from dependency_injector import containers, providers
 
 from nuzlocke_tool.data_loader import GameDataLoader
 from nuzlocke_tool.events import EventManager
-from nuzlocke_tool.models.models import GameState
-from nuzlocke_tool.repositories import LocationRepository, MoveRepository, PokemonRepository
+from nuzlocke_tool.models.models import DamageEngineType, GameState, SaveBackend
+from nuzlocke_tool.repositories import LocationRepository, MoveRepository, PokemonRepository, TypeRepository
 from nuzlocke_tool.services.journal_service import JournalService
 from nuzlocke_tool.services.save_service import SaveService
+from nuzlocke_tool.services.sqlite_save_service import SqliteSaveService
+from nuzlocke_tool.services.stat_cache import StatCache
 
 
 class Container(containers.DeclarativeContainer):
+    config = providers.Configuration(
+        default={
+            "damage_engine": DamageEngineType.SCALAR.name.lower(),
+            "save_backend": SaveBackend.FILE.name.lower(),
+        },
+    )
     event_manager = providers.Singleton(EventManager)
     game_data_loader = providers.Singleton(GameDataLoader)
     game_state = providers.Singleton(GameState, "", "", False, None, None, None, [], [], [], {})
@@ -16,4 +24,10 @@ class Container(containers.DeclarativeContainer):
     location_repository = providers.Singleton(LocationRepository, game_data_loader=game_data_loader)
     move_repository = providers.Singleton(MoveRepository, game_data_loader=game_data_loader)
     pokemon_repository = providers.Singleton(PokemonRepository, game_data_loader=game_data_loader)
-    save_service = providers.Singleton(SaveService)
+    save_service = providers.Selector(
+        config.save_backend,
+        file=providers.Singleton(SaveService),
+        sqlite=providers.Singleton(SqliteSaveService),
+    )
+    stat_cache = providers.Singleton(StatCache)
+    type_repository = providers.Singleton(TypeRepository, game_data_loader=game_data_loader)
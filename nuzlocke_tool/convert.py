@@ -0,0 +1,77 @@
+import argparse
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+
+from nuzlocke_tool import __version__
+from nuzlocke_tool.models.models import SaveBackend, SaveFormat
+from nuzlocke_tool.services.save_service import SaveService
+from nuzlocke_tool.services.sqlite_save_service import SqliteSaveService
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="NuzlockeTool-convert",
+        description="Convert a save file between the YAML and binary formats, or the run database.",
+    )
+    parser.add_argument(
+        "save_file",
+        type=Path,
+        help="Path to a .sav file in either format, or a run name when converting from the database",
+    )
+    parser.add_argument(
+        "--from",
+        dest="source",
+        choices=[backend.name.lower() for backend in SaveBackend],
+        default=SaveBackend.FILE.name.lower(),
+        help="Where the session is read from",
+    )
+    parser.add_argument(
+        "--to",
+        choices=[
+            *(save_format.name.lower() for save_format in SaveFormat),
+            SaveBackend.SQLITE.name.lower(),
+        ],
+        required=True,
+        help="Format to write, or sqlite to import the save file into the run database",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Path to write the converted save to, defaults to converting in place",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    args = parser.parse_args(argv)
+    if args.source == args.to == SaveBackend.SQLITE.name.lower():
+        parser.error("--to sqlite imports a save file, so it cannot be combined with --from sqlite")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(
+        format="[%(levelname)s] {%(name)s} | %(message)s",
+        level=logging.WARNING,
+        stream=sys.stderr,
+    )
+    source = SaveBackend[args.source.upper()]
+    try:
+        if args.to == SaveBackend.SQLITE.name.lower():
+            target = SqliteSaveService().import_session(args.save_file)
+        else:
+            save_service = SqliteSaveService() if source == SaveBackend.SQLITE else SaveService()
+            target = save_service.convert_session(args.save_file, SaveFormat[args.to.upper()], args.output)
+    except (OSError, KeyError, TypeError, ValueError, sqlite3.Error):
+        LOGGER.exception("Unable to convert %s", args.save_file)
+        return 1
+    sys.stdout.write(f"Converted {args.save_file} to {args.to} at {target}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
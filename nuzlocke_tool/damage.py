@@ -0,0 +1,645 @@
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from nuzlocke_tool.constants import (
+    DAMAGE_ROLL_MAX,
+    DAMAGE_ROLL_MIN,
+    KO_TURN_LIMIT,
+    MULTI_HIT_WEIGHTS,
+    ONE_BYTE,
+    POKEMON_STAT_STAGE_MIN,
+    STAT_STAGE_MULTIPLIER,
+)
+from nuzlocke_tool.models.models import MoveEffect
+from nuzlocke_tool.models.tables import MoveRecord, SpeciesStatTable, SymbolTable
+
+DAMAGE_ROLLS = np.arange(DAMAGE_ROLL_MIN, DAMAGE_ROLL_MAX + 1, dtype=np.int64)
+HIT_COUNTS = np.arange(1, max(MULTI_HIT_WEIGHTS) + 1, dtype=np.int64)
+STAGE_MULTIPLIERS = np.array(
+    [STAT_STAGE_MULTIPLIER[stage] for stage in sorted(STAT_STAGE_MULTIPLIER)],
+    dtype=np.float64,
+)
+
+
+@dataclass(frozen=True)
+class AttackerArrays:
+    level: np.ndarray
+    attack: np.ndarray
+    special: np.ndarray
+    speed: np.ndarray
+    base_attack: np.ndarray
+    base_special: np.ndarray
+    base_speed: np.ndarray
+    type1: np.ndarray
+    type2: np.ndarray
+
+
+@dataclass(frozen=True)
+class DefenderArrays:
+    hp: np.ndarray
+    defense: np.ndarray
+    special: np.ndarray
+    base_defense: np.ndarray
+    base_special: np.ndarray
+    type1: np.ndarray
+    type2: np.ndarray
+
+
+@dataclass(frozen=True)
+class MoveArrays:
+    power: np.ndarray
+    type_id: np.ndarray
+    accuracy: np.ndarray
+    is_special: np.ndarray
+    effects: np.ndarray
+    static_min: np.ndarray
+    static_min_level: np.ndarray
+    static_max: np.ndarray
+    static_max_level: np.ndarray
+
+    def has_effect(self, effect: MoveEffect) -> np.ndarray:
+        return (self.effects & effect) != 0
+
+
+@dataclass(frozen=True)
+class DamageMatrix:
+    long_term_average: np.ndarray
+    damage_min: np.ndarray
+    damage_max: np.ndarray
+    normal_damage: np.ndarray
+    crit_damage: np.ndarray
+    crit_chance: np.ndarray
+    accuracy_rate: np.ndarray
+    valid: np.ndarray
+    undefined: np.ndarray
+
+
+@dataclass(frozen=True)
+class DamageGrid:
+    levels: tuple[int, ...]
+    stat_stages: tuple[int, ...]
+    hp: np.ndarray
+    long_term_average: np.ndarray
+    damage_min: np.ndarray
+    damage_max: np.ndarray
+    valid: np.ndarray
+
+    def hits_to_ko(self, *, guaranteed: bool = True) -> np.ndarray:
+        damage = self.damage_min if guaranteed else self.damage_max
+        hp = self.hp.reshape(-1, *(1,) * (damage.ndim - 1))
+        hits = -(-hp // np.maximum(damage, 1))
+        return np.where(self.valid & (damage > 0), hits, -1)
+
+    def max_level_for_hits(self, hits: int, *, guaranteed: bool = True) -> np.ndarray:
+        hits_to_ko = self.hits_to_ko(guaranteed=guaranteed)
+        within = (hits_to_ko > 0) & (hits_to_ko <= hits)
+        levels = np.array(self.levels, dtype=np.int64).reshape(-1, *(1,) * (hits_to_ko.ndim - 1))
+        return np.where(within, levels, 0).max(axis=0, initial=0)
+
+
+@dataclass(frozen=True)
+class KoThreshold:
+    value: int | None
+    ko_probability: float
+    probes: int
+
+    @property
+    def found(self) -> bool:
+        return self.value is not None
+
+
+@dataclass(frozen=True)
+class MatchupMatrix:
+    species: tuple[str, ...]
+    levels: tuple[int, ...]
+    nicknames: tuple[str, ...]
+    move_names: tuple[str, ...]
+    best_pair: np.ndarray
+    long_term_average: np.ndarray
+    damage_min: np.ndarray
+    damage_max: np.ndarray
+
+    def best_move(self, species: str, level: int) -> tuple[float, str, str, int, int] | None:
+        species_index = self.species.index(species)
+        level_index = self.levels.index(level)
+        pair = int(self.best_pair[species_index, level_index])
+        if pair < 0:
+            return None
+        return (
+            float(self.long_term_average[species_index, level_index]),
+            self.nicknames[pair],
+            self.move_names[pair],
+            int(self.damage_min[species_index, level_index]),
+            int(self.damage_max[species_index, level_index]),
+        )
+
+    def worst_matchups(self, level: int, count: int) -> list[tuple[str, float]]:
+        level_averages = self.long_term_average[:, self.levels.index(level)]
+        order = np.argsort(level_averages, kind="stable")[:count]
+        return [(self.species[index], float(level_averages[index])) for index in order.tolist()]
+
+
+@dataclass(frozen=True)
+class RollDistribution:
+    damage: np.ndarray
+    probability: np.ndarray
+    hit_weights: np.ndarray
+    accuracy_rate: np.ndarray
+
+
+@dataclass(frozen=True)
+class ThreatMatrix:
+    species: str
+    level: int
+    move_names: tuple[str, ...]
+    nicknames: tuple[str, ...]
+    long_term_average: np.ndarray
+    damage_min: np.ndarray
+    damage_max: np.ndarray
+    ko_probability: np.ndarray
+    valid: np.ndarray
+
+    def move_threats(self, nickname: str) -> list[tuple[float, float, str, int, int]]:
+        party_index = self.nicknames.index(nickname)
+        threats = [
+            (
+                float(self.ko_probability[move_index, party_index]),
+                float(self.long_term_average[move_index, party_index]),
+                self.move_names[move_index],
+                int(self.damage_min[move_index, party_index]),
+                int(self.damage_max[move_index, party_index]),
+            )
+            for move_index in np.flatnonzero(self.valid[:, party_index]).tolist()
+        ]
+        threats.sort(key=lambda x: (x[0], x[1]), reverse=True)
+        return threats
+
+    def ranked_threats(self, count: int | None = None) -> list[tuple[float, float, str, str, int, int]]:
+        move_indices, party_indices = np.nonzero(self.valid)
+        order = np.lexsort(
+            (
+                -self.long_term_average[move_indices, party_indices],
+                -self.ko_probability[move_indices, party_indices],
+            ),
+        )[:count]
+        return [
+            (
+                float(self.ko_probability[move_index, party_index]),
+                float(self.long_term_average[move_index, party_index]),
+                self.move_names[move_index],
+                self.nicknames[party_index],
+                int(self.damage_min[move_index, party_index]),
+                int(self.damage_max[move_index, party_index]),
+            )
+            for move_index, party_index in zip(
+                move_indices[order].tolist(),
+                party_indices[order].tolist(),
+                strict=True,
+            )
+        ]
+
+
+def _apply_additional_modifiers(
+    move: MoveArrays,
+    long_term_average: np.ndarray,
+    normal_damage: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    damage_min = np.floor(normal_damage * 217 / 255).astype(np.int64)
+    damage_max = normal_damage
+    is_multi_hit = move.has_effect(MoveEffect.MULTI_HIT)
+    damage_min = np.where(is_multi_hit, damage_min * 2, damage_min)
+    damage_max = np.where(is_multi_hit, damage_max * 5, damage_max)
+    long_term_average = np.where(is_multi_hit, long_term_average * 3, long_term_average)
+    is_double_attack = move.has_effect(MoveEffect.DOUBLE_ATTACK)
+    damage_min = np.where(is_double_attack, damage_min * 2, damage_min)
+    damage_max = np.where(is_double_attack, damage_max * 2, damage_max)
+    long_term_average = np.where(is_double_attack, long_term_average * 2, long_term_average)
+    is_flinch_10 = move.has_effect(MoveEffect.FLINCH_10)
+    long_term_average = np.where(is_flinch_10, long_term_average * 1.1, long_term_average)
+    is_flinch_30 = move.has_effect(MoveEffect.FLINCH_30)
+    long_term_average = np.where(is_flinch_30, long_term_average * 1.3, long_term_average)
+    return long_term_average, damage_min, damage_max
+
+
+def _calculate_damage_components(
+    attacker: AttackerArrays,
+    move: MoveArrays,
+    defender: DefenderArrays,
+    effects: tuple[bool | np.ndarray, bool | np.ndarray],
+    type_matrix: np.ndarray,
+    damaging: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    is_special = move.is_special
+    noncrit_attack = np.where(is_special, attacker.special, attacker.attack)
+    noncrit_defense = np.where(is_special, defender.special, defender.defense)
+    crit_attack = np.where(is_special, attacker.base_special, attacker.base_attack)
+    crit_defense = np.where(is_special, defender.base_special, defender.base_defense)
+    reflect_active, light_screen_active = effects
+    screened = (~is_special & reflect_active) | (is_special & light_screen_active)
+    noncrit_defense = np.where(screened, noncrit_defense * 2, noncrit_defense)
+    is_selfdestruct = move.has_effect(MoveEffect.SELFDESTRUCT)
+    noncrit_defense = np.where(is_selfdestruct, noncrit_defense // 2, noncrit_defense)
+    crit_defense = np.where(is_selfdestruct, crit_defense // 2, crit_defense)
+    overflow = (noncrit_attack > ONE_BYTE) | (noncrit_defense > ONE_BYTE)
+    noncrit_attack = np.where(overflow, noncrit_attack // 4, noncrit_attack)
+    noncrit_defense = np.where(overflow, noncrit_defense // 4, noncrit_defense)
+    divisible = (noncrit_defense != 0) & (crit_defense != 0)
+    noncrit_defense = np.where(damaging & divisible, noncrit_defense, 1)
+    crit_defense = np.where(damaging & divisible, crit_defense, 1)
+    stab = np.where((move.type_id == attacker.type1) | (move.type_id == attacker.type2), 1.5, 1.0)
+    type1_multi = type_matrix[move.type_id, defender.type1]
+    type2_multi = type_matrix[move.type_id, defender.type2]
+    level = attacker.level
+    normal_base = np.floor(2 * level / 5 + 2)
+    normal_damage = _compute_final_damage(
+        normal_base,
+        move.power,
+        noncrit_attack,
+        noncrit_defense,
+        stab,
+        type1_multi,
+        type2_multi,
+    )
+    critical_factor = (2 * level + 5) / (level + 5)
+    crit_base = np.floor(2 * level * critical_factor / 5 + 2)
+    crit_damage = _compute_final_damage(
+        crit_base,
+        move.power,
+        crit_attack,
+        crit_defense,
+        stab,
+        type1_multi,
+        type2_multi,
+    )
+    return normal_damage, crit_damage, divisible
+
+
+def _compute_final_damage(
+    base: np.ndarray,
+    power: np.ndarray,
+    attack: np.ndarray,
+    defense: np.ndarray,
+    stab: np.ndarray,
+    type1_multi: np.ndarray,
+    type2_multi: np.ndarray,
+) -> np.ndarray:
+    damage = np.floor(np.floor(base * power * attack / defense) / 50) + 2
+    damage = np.floor(damage * stab)
+    damage = np.floor(damage * type1_multi)
+    damage = np.floor(damage * type2_multi)
+    return np.maximum(1, damage).astype(np.int64)
+
+
+def _compute_hit_weights(move: MoveArrays, shape: tuple[int, ...]) -> np.ndarray:
+    single_hit, double_hit, multi_hit = (
+        np.array([weights.get(hits, 0.0) for hits in HIT_COUNTS.tolist()])
+        for weights in ({1: 1.0}, {2: 1.0}, MULTI_HIT_WEIGHTS)
+    )
+    hit_weights = np.where(move.has_effect(MoveEffect.DOUBLE_ATTACK)[..., np.newaxis], double_hit, single_hit)
+    hit_weights = np.where(move.has_effect(MoveEffect.MULTI_HIT)[..., np.newaxis], multi_hit, hit_weights)
+    return np.broadcast_to(hit_weights, (*shape, len(HIT_COUNTS)))
+
+
+def _compute_use_histogram(distribution: RollDistribution, hp: np.ndarray, width: int) -> np.ndarray:
+    shape = distribution.accuracy_rate.shape
+    accuracy_rate = np.minimum(distribution.accuracy_rate, 1.0)
+    total_damage = distribution.damage[..., np.newaxis, :] * HIT_COUNTS[:, np.newaxis]
+    weights = (
+        accuracy_rate[..., np.newaxis, np.newaxis]
+        * distribution.hit_weights[..., np.newaxis]
+        * distribution.probability[..., np.newaxis, :]
+    )
+    survives = (total_damage < hp[..., np.newaxis, np.newaxis]) & (weights > 0)
+    cell_count = int(np.prod(shape))
+    cells = np.arange(cell_count).reshape(shape)[..., np.newaxis, np.newaxis]
+    cells = np.broadcast_to(cells, survives.shape)
+    histogram = np.zeros(cell_count * width, dtype=np.float64)
+    np.add.at(histogram, cells[survives] * width + total_damage[survives], weights[survives])
+    histogram = histogram.reshape(*shape, width)
+    histogram[..., 0] += 1 - accuracy_rate * distribution.probability.sum(axis=-1)
+    return histogram
+
+
+def _roll_damage(damage: np.ndarray) -> np.ndarray:
+    damage = damage[..., np.newaxis]
+    return np.where(damage > 1, damage * DAMAGE_ROLLS // DAMAGE_ROLL_MAX, damage)
+
+
+def _select_best_moves(damage: DamageMatrix) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    long_term_average = np.where(damage.valid, damage.long_term_average, -np.inf)
+    best_pair = np.argmax(long_term_average, axis=0)
+    has_move = damage.valid.any(axis=0)
+    best_index = best_pair[np.newaxis, :]
+    return (
+        np.where(has_move, best_pair, -1),
+        np.where(has_move, np.take_along_axis(long_term_average, best_index, 0)[0], 0.0),
+        np.where(has_move, np.take_along_axis(damage.damage_min, best_index, 0)[0], 0),
+        np.where(has_move, np.take_along_axis(damage.damage_max, best_index, 0)[0], 0),
+    )
+
+
+def _compute_stat_value(base: np.ndarray, level: np.ndarray, dv: np.ndarray | int) -> np.ndarray:
+    return np.floor((np.asarray(base, dtype=np.int64) + dv) * 2 * np.asarray(level) / 100).astype(np.int64)
+
+
+def apply_stat_stages(stats: np.ndarray, stages: np.ndarray) -> np.ndarray:
+    multipliers = STAGE_MULTIPLIERS[np.asarray(stages) - POKEMON_STAT_STAGE_MIN]
+    return np.floor(np.asarray(stats) * multipliers).astype(np.int64)
+
+
+def as_columns(arrays: AttackerArrays | MoveArrays) -> AttackerArrays | MoveArrays:
+    return type(arrays)(*(np.asarray(getattr(arrays, field.name))[:, np.newaxis] for field in fields(arrays)))
+
+
+def build_attacker_row(
+    species_table: SpeciesStatTable,
+    species: str,
+    level: int,
+    dvs: dict[str, int],
+    stat_stages: tuple[int, int, int],
+) -> tuple[int, ...]:
+    species_id = species_table.species.id_of(species)
+    base_stats = np.array(
+        [species_table.stat(stat)[species_id] for stat in ("atk", "spe", "spd")],
+        dtype=np.int64,
+    )
+    stats = compute_stat(base_stats, level, np.array([dvs["Atk"], dvs["Spe"], dvs["Spd"]]))
+    modified_stats = apply_stat_stages(stats, np.array(stat_stages))
+    return (
+        level,
+        *modified_stats.tolist(),
+        *stats.tolist(),
+        int(species_table.type1[species_id]),
+        int(species_table.type2[species_id]),
+    )
+
+
+def build_dex_defender_arrays(species_table: SpeciesStatTable, level_values: np.ndarray) -> DefenderArrays:
+    defender_levels = np.asarray(level_values, dtype=np.int64)[np.newaxis, :]
+    defense = compute_stat(species_table.stat("def")[:, np.newaxis], defender_levels).ravel()
+    special = compute_stat(species_table.stat("spe")[:, np.newaxis], defender_levels).ravel()
+    return DefenderArrays(
+        compute_hp(species_table.stat("hp")[:, np.newaxis], defender_levels).ravel(),
+        defense,
+        special,
+        defense,
+        special,
+        np.repeat(species_table.type1.astype(np.int64), defender_levels.size),
+        np.repeat(species_table.type2.astype(np.int64), defender_levels.size),
+    )
+
+
+def build_move_arrays(
+    move_names: list[str],
+    move_records: dict[str, MoveRecord],
+    types: SymbolTable,
+) -> MoveArrays:
+    records = [move_records[name] for name in move_names]
+    return MoveArrays(
+        np.array([record.power for record in records], dtype=np.int64),
+        np.array([types.id_of(record.move_type) for record in records], dtype=np.int64),
+        np.array([record.accuracy for record in records], dtype=np.float64),
+        np.array([record.is_special for record in records], dtype=bool),
+        np.array([record.effects for record in records], dtype=np.int64),
+        np.array([record.static_min for record in records], dtype=np.int64),
+        np.array([record.static_min_level_multiplier for record in records], dtype=np.float64),
+        np.array([record.static_max for record in records], dtype=np.int64),
+        np.array([record.static_max_level_multiplier for record in records], dtype=np.float64),
+    )
+
+
+def build_party_defender_arrays(
+    species_table: SpeciesStatTable,
+    defenders: list[tuple[str, int, dict[str, int], tuple[int, int]]],
+) -> DefenderArrays:
+    species_ids = np.array(
+        [species_table.species.id_of(species) for species, *_ in defenders], dtype=np.int64
+    )
+    levels = np.array([level for _, level, _, _ in defenders], dtype=np.int64)
+    hp_dvs, def_dvs, spe_dvs = (
+        np.array([dvs[stat] for _, _, dvs, _ in defenders], dtype=np.int64) for stat in ("HP", "Def", "Spe")
+    )
+    stages = np.array([stat_stages for *_, stat_stages in defenders], dtype=np.int64).reshape(-1, 2)
+    defense = compute_stat(species_table.stat("def")[species_ids], levels, def_dvs)
+    special = compute_stat(species_table.stat("spe")[species_ids], levels, spe_dvs)
+    return DefenderArrays(
+        compute_hp(species_table.stat("hp")[species_ids], levels, hp_dvs),
+        apply_stat_stages(defense, stages[:, 0]),
+        apply_stat_stages(special, stages[:, 1]),
+        defense,
+        special,
+        species_table.type1[species_ids].astype(np.int64),
+        species_table.type2[species_ids].astype(np.int64),
+    )
+
+
+def calculate_damage_grid(
+    attacker: AttackerArrays,
+    move: MoveArrays,
+    species_table: SpeciesStatTable,
+    species: str,
+    level_values: np.ndarray,
+    stage_values: np.ndarray,
+    type_matrix: np.ndarray,
+) -> DamageGrid:
+    species_id = species_table.species.id_of(species)
+    levels = np.asarray(level_values, dtype=np.int64)
+    stages = np.asarray(stage_values, dtype=np.int64)
+    level_axis = levels[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis]
+    hp = compute_hp(species_table.stat("hp")[species_id], level_axis)
+    defense = compute_stat(species_table.stat("def")[species_id], level_axis)
+    special = compute_stat(species_table.stat("spe")[species_id], level_axis)
+    defender = DefenderArrays(
+        hp,
+        apply_stat_stages(defense, stages[np.newaxis, :, np.newaxis, np.newaxis, np.newaxis]),
+        apply_stat_stages(special, stages[np.newaxis, np.newaxis, :, np.newaxis, np.newaxis]),
+        defense,
+        special,
+        np.int64(species_table.type1[species_id]),
+        np.int64(species_table.type2[species_id]),
+    )
+    toggles = np.array([False, True])
+    effects = (
+        toggles[np.newaxis, np.newaxis, np.newaxis, :, np.newaxis],
+        toggles[np.newaxis, np.newaxis, np.newaxis, np.newaxis, :],
+    )
+    damage = calculate_damage_matrix(attacker, move, defender, effects, type_matrix)
+    shape = (len(levels), len(stages), len(stages), len(toggles), len(toggles))
+    return DamageGrid(
+        tuple(levels.tolist()),
+        tuple(stages.tolist()),
+        hp.ravel(),
+        np.broadcast_to(damage.long_term_average, shape),
+        np.broadcast_to(damage.damage_min, shape),
+        np.broadcast_to(damage.damage_max, shape),
+        np.broadcast_to(damage.valid, shape),
+    )
+
+
+def calculate_damage_matrix(
+    attacker: AttackerArrays,
+    move: MoveArrays,
+    defender: DefenderArrays,
+    effects: tuple[bool | np.ndarray, bool | np.ndarray],
+    type_matrix: np.ndarray,
+) -> DamageMatrix:
+    is_ohko = move.has_effect(MoveEffect.OHKO)
+    is_static = move.has_effect(MoveEffect.STATIC_DAMAGE) & ~is_ohko
+    damaging = ~is_ohko & ~is_static & (move.power != 0)
+    normal_damage, crit_damage, divisible = _calculate_damage_components(
+        attacker,
+        move,
+        defender,
+        effects,
+        type_matrix,
+        damaging,
+    )
+    crit_chance = np.where(
+        move.has_effect(MoveEffect.HIGH_CRIT),
+        np.maximum(255, 8 * (attacker.base_speed // 2)) / 256,
+        (attacker.speed // 2) / 256,
+    )
+    weighted_damage = (normal_damage * (1 - crit_chance) + crit_damage * crit_chance) * 235 / 255
+    accuracy_rate = np.where(move.has_effect(MoveEffect.SWIFT), 1.0, move.accuracy * 255 / 25600)
+    long_term_average, damage_min, damage_max = _apply_additional_modifiers(
+        move,
+        weighted_damage * accuracy_rate,
+        normal_damage,
+    )
+    special_accuracy_rate = move.accuracy * 255 / 25600
+    static_min = move.static_min + np.floor(attacker.level * move.static_min_level).astype(np.int64)
+    static_max = move.static_max + np.floor(attacker.level * move.static_max_level).astype(np.int64)
+    static_value = (static_min + static_max) / 2
+    long_term_average = np.where(is_static, static_value * special_accuracy_rate, long_term_average)
+    damage_min = np.where(is_static, static_min, damage_min)
+    damage_max = np.where(is_static, static_max, damage_max)
+    long_term_average = np.where(is_ohko, defender.hp * special_accuracy_rate, long_term_average)
+    damage_min = np.where(is_ohko, 0, damage_min)
+    damage_max = np.where(is_ohko, defender.hp, damage_max)
+    return DamageMatrix(
+        long_term_average,
+        damage_min,
+        damage_max,
+        normal_damage,
+        crit_damage,
+        crit_chance,
+        np.where(is_ohko | is_static, special_accuracy_rate, accuracy_rate),
+        np.broadcast_to((damaging & divisible) | is_ohko | is_static, long_term_average.shape),
+        np.broadcast_to(damaging & ~divisible, long_term_average.shape),
+    )
+
+
+def calculate_ko_probability(distribution: RollDistribution, hp: np.ndarray) -> np.ndarray:
+    hp = np.asarray(hp)[..., np.newaxis, np.newaxis]
+    total_damage = distribution.damage[..., np.newaxis, :] * HIT_COUNTS[:, np.newaxis]
+    knockout_probability = (distribution.probability[..., np.newaxis, :] * (total_damage >= hp)).sum(axis=-1)
+    return distribution.accuracy_rate * (knockout_probability * distribution.hit_weights).sum(axis=-1)
+
+
+def calculate_ko_turn_probabilities(
+    distribution: RollDistribution,
+    hp: np.ndarray,
+    max_turns: int = KO_TURN_LIMIT,
+) -> np.ndarray:
+    shape = distribution.accuracy_rate.shape
+    hp = np.broadcast_to(np.asarray(hp, dtype=np.int64), shape)
+    width = max(int(hp.max(initial=1)), 1)
+    histogram = _compute_use_histogram(distribution, hp, width)
+    alive = np.arange(width) < hp[..., np.newaxis]
+    fft_size = 1 << (2 * width - 1).bit_length()
+    use_spectrum = np.fft.rfft(histogram, fft_size)
+    survival = histogram
+    ko_probabilities = np.empty((*shape, max_turns), dtype=np.float64)
+    for turn in range(max_turns):
+        if turn:
+            survival = np.fft.irfft(np.fft.rfft(survival, fft_size) * use_spectrum, fft_size)[..., :width]
+            survival = np.where(alive, np.maximum(survival, 0.0), 0.0)
+        ko_probabilities[..., turn] = 1 - survival.sum(axis=-1)
+    ko_probabilities = np.clip(ko_probabilities, 0.0, 1.0)
+    return np.maximum.accumulate(ko_probabilities, axis=-1)
+
+
+def calculate_roll_distribution(damage: DamageMatrix, move: MoveArrays) -> RollDistribution:
+    shape = damage.long_term_average.shape
+    is_ohko = np.broadcast_to(move.has_effect(MoveEffect.OHKO), shape)[..., np.newaxis]
+    is_static = np.broadcast_to(move.has_effect(MoveEffect.STATIC_DAMAGE), shape)[..., np.newaxis] & ~is_ohko
+    damage_min = np.broadcast_to(damage.damage_min, shape)[..., np.newaxis]
+    damage_max = np.broadcast_to(damage.damage_max, shape)[..., np.newaxis]
+    static_span = np.where(is_static, damage_max - damage_min + 1, 1)
+    width = max(2 * len(DAMAGE_ROLLS), int(static_span.max(initial=1)))
+    padding = [(0, 0)] * len(shape) + [(0, width - 2 * len(DAMAGE_ROLLS))]
+    crit_chance = np.minimum(np.broadcast_to(damage.crit_chance, shape), ONE_BYTE / 256)[..., np.newaxis]
+    rolled_damage = np.pad(
+        np.concatenate(
+            [
+                _roll_damage(np.broadcast_to(damage.normal_damage, shape)),
+                _roll_damage(np.broadcast_to(damage.crit_damage, shape)),
+            ],
+            axis=-1,
+        ),
+        padding,
+    )
+    rolled_probability = np.pad(
+        np.concatenate(
+            [
+                np.broadcast_to((1 - crit_chance) / len(DAMAGE_ROLLS), (*shape, len(DAMAGE_ROLLS))),
+                np.broadcast_to(crit_chance / len(DAMAGE_ROLLS), (*shape, len(DAMAGE_ROLLS))),
+            ],
+            axis=-1,
+        ),
+        padding,
+    )
+    slots = np.arange(width)
+    static_probability = np.where(slots < static_span, 1 / static_span, 0.0)
+    ohko_probability = (slots == 0).astype(np.float64)
+    roll_damage = np.where(is_static, damage_min + slots, np.where(is_ohko, damage_max, rolled_damage))
+    roll_probability = np.where(is_ohko, ohko_probability, rolled_probability)
+    roll_probability = np.where(is_static, static_probability, roll_probability)
+    roll_probability = np.where(np.broadcast_to(damage.valid, shape)[..., np.newaxis], roll_probability, 0.0)
+    return RollDistribution(
+        roll_damage,
+        roll_probability,
+        _compute_hit_weights(move, shape),
+        np.broadcast_to(damage.accuracy_rate, shape),
+    )
+
+
+def calculate_threat_matrix(
+    attacker: AttackerArrays,
+    move: MoveArrays,
+    defender: DefenderArrays,
+    effects: tuple[bool, bool],
+    type_matrix: np.ndarray,
+) -> tuple[DamageMatrix, np.ndarray]:
+    move = as_columns(move)
+    damage = calculate_damage_matrix(as_columns(attacker), move, defender, effects, type_matrix)
+    distribution = calculate_roll_distribution(damage, move)
+    return damage, calculate_ko_probability(distribution, defender.hp)
+
+
+def calculate_dex_best_moves(
+    attacker: AttackerArrays,
+    move: MoveArrays,
+    species_table: SpeciesStatTable,
+    level_values: np.ndarray,
+    effects: tuple[bool, bool],
+    type_matrix: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    damage = calculate_damage_matrix(
+        as_columns(attacker),
+        as_columns(move),
+        build_dex_defender_arrays(species_table, level_values),
+        effects,
+        type_matrix,
+    )
+    shape = (len(species_table.species), len(level_values))
+    return tuple(array.reshape(shape) for array in _select_best_moves(damage))
+
+
+def compute_hp(base: np.ndarray, level: np.ndarray, dv: np.ndarray | int = 0) -> np.ndarray:
+    return _compute_stat_value(base, level, dv) + np.asarray(level, dtype=np.int64) + 10
+
+
+def compute_stat(base: np.ndarray, level: np.ndarray, dv: np.ndarray | int = 0) -> np.ndarray:
+    return _compute_stat_value(base, level, dv) + 5
@@ -1,33 +1,106 @@
-from typing import TYPE_CHECKING
+import logging
+from collections import OrderedDict
 
 from nuzlocke_tool.config import PathConfig
-from nuzlocke_tool.utils import load_yaml_file
+from nuzlocke_tool.constants import GENERATION_CACHE_LIMIT
+from nuzlocke_tool.models.models import GenerationData, LocationData, MoveData, PokemonData
+from nuzlocke_tool.models.tables import (
+    MoveRecord,
+    SpeciesStatTable,
+    SymbolTable,
+    SymbolTables,
+    TypeChart,
+    build_move_records,
+)
+from nuzlocke_tool.yaml_loader import load_yaml_file
 
-if TYPE_CHECKING:
-    from nuzlocke_tool.models import LocationData, MoveData, PokemonData
+LOGGER = logging.getLogger(__name__)
 
 
 class GameDataLoader:
-    def __init__(self) -> None:
+    def __init__(self, max_generations: int = GENERATION_CACHE_LIMIT) -> None:
+        self._active_generation: str | None = None
+        self._generations: OrderedDict[str, GenerationData] = OrderedDict()
+        self._max_generations = max(1, max_generations)
         self.location_data: dict[str, LocationData] = {}
-        self.move_data: dict[str, MoveData] = {}
-        self.pokemon_data: dict[str, PokemonData] = {}
+        self.location_symbols = SymbolTable()
 
-    def load_location_data(self) -> None:
-        self.location_data = load_yaml_file(PathConfig.locations_file())
+    @property
+    def active_data(self) -> GenerationData | None:
+        return self._generations.get(self._active_generation)
+
+    @property
+    def active_generation(self) -> str | None:
+        return self._active_generation
+
+    @property
+    def loaded_generations(self) -> list[str]:
+        return list(self._generations.keys())
+
+    @property
+    def move_data(self) -> dict[str, MoveData]:
+        return self.active_data.move_data if self.active_data else {}
+
+    @property
+    def move_records(self) -> dict[str, MoveRecord]:
+        return self.active_data.move_records if self.active_data else {}
+
+    @property
+    def pokemon_data(self) -> dict[str, PokemonData]:
+        return self.active_data.pokemon_data if self.active_data else {}
 
-    def load_move_data(self, generation: str) -> None:
+    @staticmethod
+    def _load_move_data(generation: str) -> dict[str, MoveData]:
         move_data_file = f"gen{generation}_moves.yaml"
         move_yaml_path = PathConfig.resources_folder() / move_data_file
         if not move_yaml_path.exists():
             err_msg = f"Move data file not found: {move_yaml_path}"
             raise FileNotFoundError(err_msg)
-        self.move_data = load_yaml_file(move_yaml_path)
+        return load_yaml_file(move_yaml_path)
 
-    def load_pokemon_data(self, generation: str) -> None:
+    @staticmethod
+    def _load_pokemon_data(generation: str) -> dict[str, PokemonData]:
         pokemon_data_file = f"gen{generation}_pokemon.yaml"
         pokemon_yaml_path = PathConfig.resources_folder() / pokemon_data_file
         if not pokemon_yaml_path.exists():
             err_msg = f"Pokemon data file not found: {pokemon_yaml_path}"
             raise FileNotFoundError(err_msg)
-        self.pokemon_data = load_yaml_file(pokemon_yaml_path)
+        return load_yaml_file(pokemon_yaml_path)
+
+    @staticmethod
+    def _load_type_data(generation: str) -> dict[str, dict[str, float]]:
+        type_data_file = f"gen{generation}_types.yaml"
+        type_yaml_path = PathConfig.resources_folder() / type_data_file
+        if not type_yaml_path.exists():
+            err_msg = f"Type data file not found: {type_yaml_path}"
+            raise FileNotFoundError(err_msg)
+        return load_yaml_file(type_yaml_path)
+
+    def load_generation(self, generation: str) -> GenerationData:
+        generation = str(generation)
+        if generation in self._generations:
+            self._generations.move_to_end(generation)
+            LOGGER.info("Using resident data for generation %s", generation)
+        else:
+            move_data = self._load_move_data(generation)
+            pokemon_data = self._load_pokemon_data(generation)
+            type_data = self._load_type_data(generation)
+            symbols = SymbolTables.from_game_data(move_data, pokemon_data, type_data)
+            self._generations[generation] = GenerationData(
+                move_data,
+                build_move_records(move_data),
+                pokemon_data,
+                symbols,
+                SpeciesStatTable.from_pokemon_data(pokemon_data, symbols),
+                TypeChart.from_type_data(type_data, symbols.types),
+            )
+            LOGGER.info("Loaded data for generation %s", generation)
+            while len(self._generations) > self._max_generations:
+                evicted_generation, _ = self._generations.popitem(last=False)
+                LOGGER.info("Evicted data for generation %s", evicted_generation)
+        self._active_generation = generation
+        return self._generations[generation]
+
+    def load_location_data(self) -> None:
+        self.location_data = load_yaml_file(PathConfig.locations_file())
+        self.location_symbols = SymbolTable(self.location_data.keys())
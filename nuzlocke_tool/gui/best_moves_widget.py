@@ -1,3 +1,7 @@
+import copy
+from collections.abc import Callable
+from functools import partial
+
 from PyQt6.QtWidgets import (
     QCheckBox,
     QCompleter,
@@ -5,6 +9,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QProgressBar,
     QPushButton,
     QSpinBox,
     QVBoxLayout,
@@ -12,11 +17,13 @@ from PyQt6.QtWidgets import (
 )
 
 from nuzlocke_tool.constants import (
-    ALIGN_CENTER,
-    ALIGN_H_CENTER,
-    ALIGN_TOP,
+    BEST_MOVE_RESULTS_LIMIT,
     BUTTON_CALC_MOVE,
+    BUTTON_WORST_MATCHUPS,
+    KO_THRESHOLD_PROBABILITY,
     LABEL_ATTACK,
+    LABEL_ATTACK_SHORT,
+    LABEL_CALCULATING,
     LABEL_CHECKBOX_LIGHT_SCREEN,
     LABEL_CHECKBOX_REFLECT,
     LABEL_DEFENDING_POKEMON,
@@ -24,60 +31,104 @@ from nuzlocke_tool.constants import (
     LABEL_LEVEL,
     LABEL_PARTY_MEMBER,
     LABEL_SPECIAL,
+    LABEL_SPECIAL_SHORT,
     LABEL_SPECIAL_STAGE,
     LABEL_SPEED,
     POKEMON_LEVEL_MAX,
     POKEMON_LEVEL_MIN,
     POKEMON_STAT_STAGE_MAX,
     POKEMON_STAT_STAGE_MIN,
+    WORST_MATCHUP_RESULTS_LIMIT,
 )
 from nuzlocke_tool.container import Container
+from nuzlocke_tool.damage import KoThreshold
+from nuzlocke_tool.gui.calculation_runner import CalculationRunner, ProgressCallback
+from nuzlocke_tool.gui.constants import ALIGN_CENTER, ALIGN_H_CENTER, ALIGN_TOP
 from nuzlocke_tool.models.models import GameState
 from nuzlocke_tool.models.view_models import BestMoveViewModel
+from nuzlocke_tool.repositories import MoveRepository
 from nuzlocke_tool.services.best_moves_service import BestMovesService
 from nuzlocke_tool.services.pokemon_service import PokemonService
 from nuzlocke_tool.utils import add_pokemon_image, clear_layout, clear_widget, load_pokemon_image
 
 
-class BestMovesToolWidget(QWidget):
-    def __init__(self, container: Container, parent: QWidget) -> None:
+class CalculationToolWidget(QWidget):
+    def __init__(
+        self,
+        container: Container,
+        parent: QWidget,
+        selector_label: str,
+        button_label: str,
+        stage_labels: tuple[str, ...],
+        view_model_factory: Callable[[], object],
+    ) -> None:
         super().__init__(parent)
+        self._button_label = button_label
         self._container = container
         self._game_state = self._container.game_state()
         self._best_moves_service = BestMovesService(self._container, self._game_state)
         self._pokemon_repository = self._container.pokemon_repository()
         self._pokemon_service = PokemonService(self._container, self._game_state)
-        self._view_model = BestMoveViewModel()
+        self._selector_label = selector_label
+        self._stage_labels = stage_labels
+        self._view_model_factory = view_model_factory
+        self._view_model = view_model_factory()
+        self._calculation_runner = CalculationRunner(self)
+        self._calculation_runner.failed.connect(self._on_calculation_failed)
+        self._calculation_runner.finished.connect(self._on_calculation_finished)
+        self._calculation_runner.progress.connect(self._on_calculation_progress)
+
+    def _add_result_labels(self, texts: list[str]) -> None:
+        for text in texts:
+            self._results_layout.addWidget(QLabel(text, self))
+
+    def _calculate(self) -> None:
+        raise NotImplementedError
+
+    def _create_stage_form(self) -> QFormLayout:
+        raise NotImplementedError
 
-    def _calculate_best_moves(self) -> None:
+    def _on_calculation_failed(self, error: str) -> None:
+        self._progress_bar.hide()
         clear_layout(self._results_layout)
-        self._view_model.defending_pokemon = self._pokemon_selector.text()
-        self._view_model.defending_level = self._level_spinner.value()
-        self._view_model.defense_stage = self._defense_spinner.value()
-        self._view_model.special_stage = self._special_spinner.value()
-        self._view_model.reflect_active = self._reflect_checkbox.isChecked()
-        self._view_model.light_screen_active = self._light_screen_checkbox.isChecked()
-        if not self._view_model.has_valid_defender:
-            self._results_layout.addWidget(QLabel(self._view_model.defender_display_text, self))
-            return
-        self._view_model.attacker_stages = []
-        for party_member, atk_spin, spe_spin, spd_spin in self._party_stage_spinboxes:
-            self._view_model.attacker_stages.append(
-                (party_member, atk_spin.value(), spe_spin.value(), spd_spin.value()),
-            )
-        defender_stats, move_results = self._best_moves_service.calculate_best_moves_for_target(
-            self._view_model.defending_pokemon,
-            self._view_model.defending_level,
-            (self._view_model.defense_stage, self._view_model.special_stage),
-            (self._view_model.reflect_active, self._view_model.light_screen_active),
-            self._view_model.attacker_stages,
-        )
-        if defender_stats:
-            self._view_model.defending_hp = defender_stats.get("hp")
-        self._view_model.move_results = move_results
-        self._results_layout.addWidget(QLabel(self._view_model.defender_display_text, self))
-        for result_text in self._view_model.formatted_results:
-            self._results_layout.addWidget(QLabel(result_text, self))
+        self._results_layout.addWidget(QLabel(error, self))
+
+    def _on_calculation_finished(self, result: object) -> None:
+        self._progress_bar.hide()
+        clear_layout(self._results_layout)
+        self._result_handler(result)
+
+    def _on_calculation_progress(self, completed: int, total: int) -> None:
+        self._progress_bar.setRange(0, total)
+        self._progress_bar.setValue(completed)
+
+    def _read_party_stages(self) -> list[tuple]:
+        return [
+            (copy.deepcopy(party_member), *(spin.value() for spin in spins))
+            for party_member, *spins in self._party_stage_spinboxes
+        ]
+
+    def _read_species(self) -> str:
+        species = self._pokemon_selector.text()
+        return species if species in self._pokemon_repository.get_all_species() else ""
+
+    def _show_message(self, text: str) -> None:
+        self._calculation_runner.cancel()
+        self._progress_bar.hide()
+        clear_layout(self._results_layout)
+        self._results_layout.addWidget(QLabel(text, self))
+
+    def _submit_calculation(
+        self,
+        calculation: Callable[[ProgressCallback], object],
+        result_handler: Callable[[object], None],
+    ) -> None:
+        self._result_handler = result_handler
+        clear_layout(self._results_layout)
+        self._results_layout.addWidget(QLabel(LABEL_CALCULATING, self))
+        self._progress_bar.setRange(0, 0)
+        self._progress_bar.show()
+        self._calculation_runner.submit(calculation)
 
     def _update_image(self, selected_pokemon: str) -> None:
         pixmap = load_pokemon_image(selected_pokemon)
@@ -92,7 +143,7 @@ class BestMovesToolWidget(QWidget):
             layout = self.layout()
         top_layout = QHBoxLayout()
         left_column = QVBoxLayout()
-        left_column.addWidget(QLabel(LABEL_DEFENDING_POKEMON, self), alignment=ALIGN_CENTER)
+        left_column.addWidget(QLabel(self._selector_label, self), alignment=ALIGN_CENTER)
         self._pokemon_selector = QLineEdit(self)
         pokemon_names = self._pokemon_repository.get_all_species()
         completer = QCompleter(pokemon_names, self)
@@ -102,16 +153,7 @@ class BestMovesToolWidget(QWidget):
         self._pokemon_image = add_pokemon_image(left_column, self._pokemon_selector.text(), self)
         left_column.addWidget(self._pokemon_image, alignment=ALIGN_TOP | ALIGN_H_CENTER)
         top_layout.addLayout(left_column, 1)
-        right_column = QFormLayout()
-        self._level_spinner = QSpinBox(self)
-        self._level_spinner.setRange(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX)
-        right_column.addRow(QLabel(LABEL_LEVEL, self), self._level_spinner)
-        self._defense_spinner = QSpinBox(self)
-        self._defense_spinner.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
-        right_column.addRow(QLabel(LABEL_DEFENSE_STAGE, self), self._defense_spinner)
-        self._special_spinner = QSpinBox(self)
-        self._special_spinner.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
-        right_column.addRow(QLabel(LABEL_SPECIAL_STAGE, self), self._special_spinner)
+        right_column = self._create_stage_form()
         checkboxes_layout = QHBoxLayout()
         self._light_screen_checkbox = QCheckBox(LABEL_CHECKBOX_LIGHT_SCREEN, self)
         checkboxes_layout.addWidget(self._light_screen_checkbox)
@@ -124,19 +166,25 @@ class BestMovesToolWidget(QWidget):
         self._party_stage_layout = QVBoxLayout(party_stage_widget)
         self.update_party_stage_section()
         layout.addWidget(party_stage_widget)
-        calculate_button = QPushButton(BUTTON_CALC_MOVE, self)
-        calculate_button.clicked.connect(self._calculate_best_moves)
-        layout.addWidget(calculate_button)
+        self._button_layout = QHBoxLayout()
+        calculate_button = QPushButton(self._button_label, self)
+        calculate_button.clicked.connect(self._calculate)
+        self._button_layout.addWidget(calculate_button)
+        layout.addLayout(self._button_layout)
+        self._progress_bar = QProgressBar(self)
+        self._progress_bar.hide()
+        layout.addWidget(self._progress_bar)
         results_area = QWidget(self)
         self._results_layout = QVBoxLayout(results_area)
         layout.addWidget(results_area)
         layout.addStretch()
 
     def set_state(self, game_state: GameState) -> None:
+        self._calculation_runner.cancel()
         self._best_moves_service = BestMovesService(self._container, game_state)
         self._game_state = game_state
         self._pokemon_service = PokemonService(self._container, game_state)
-        self._view_model = BestMoveViewModel()
+        self._view_model = self._view_model_factory()
         self.init_ui()
 
     def update_party_stage_section(self) -> None:
@@ -146,22 +194,175 @@ class BestMovesToolWidget(QWidget):
         self._party_stage_spinboxes = []
         header_layout = QHBoxLayout()
         header_layout.addWidget(QLabel(LABEL_PARTY_MEMBER, self), alignment=ALIGN_CENTER)
-        header_layout.addWidget(QLabel(LABEL_ATTACK, self), alignment=ALIGN_CENTER)
-        header_layout.addWidget(QLabel(LABEL_SPECIAL, self), alignment=ALIGN_CENTER)
-        header_layout.addWidget(QLabel(LABEL_SPEED, self), alignment=ALIGN_CENTER)
+        for stage_label in self._stage_labels:
+            header_layout.addWidget(QLabel(stage_label, self), alignment=ALIGN_CENTER)
         self._party_stage_layout.addLayout(header_layout)
         for party_member in self._pokemon_service.active_pokemon:
             row_layout = QHBoxLayout()
             member_label = QLabel(str(party_member), self)
             row_layout.addWidget(member_label)
-            atk_stage_spin = QSpinBox(self)
-            atk_stage_spin.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
-            row_layout.addWidget(atk_stage_spin)
-            spe_stage_spin = QSpinBox(self)
-            spe_stage_spin.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
-            row_layout.addWidget(spe_stage_spin)
-            spd_stage_spin = QSpinBox(self)
-            spd_stage_spin.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
-            row_layout.addWidget(spd_stage_spin)
+            stage_spins = []
+            for _ in self._stage_labels:
+                stage_spin = QSpinBox(self)
+                stage_spin.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
+                row_layout.addWidget(stage_spin)
+                stage_spins.append(stage_spin)
             self._party_stage_layout.addLayout(row_layout)
-            self._party_stage_spinboxes.append((party_member, atk_stage_spin, spe_stage_spin, spd_stage_spin))
+            self._party_stage_spinboxes.append((party_member, *stage_spins))
+
+
+class BestMovesToolWidget(CalculationToolWidget):
+    def __init__(self, container: Container, parent: QWidget) -> None:
+        super().__init__(
+            container,
+            parent,
+            LABEL_DEFENDING_POKEMON,
+            BUTTON_CALC_MOVE,
+            (LABEL_ATTACK, LABEL_SPECIAL, LABEL_SPEED),
+            BestMoveViewModel,
+        )
+        self._move_repository = self._container.move_repository()
+
+    @staticmethod
+    def _run_best_moves_calculation(
+        best_moves_service: BestMovesService,
+        move_repository: MoveRepository,
+        view_model: BestMoveViewModel,
+        progress: ProgressCallback,
+    ) -> tuple[
+        dict[str, str | int | list[str]],
+        list[tuple[float, str, str, int, int]],
+        list[tuple[str, KoThreshold, KoThreshold]],
+    ]:
+        stat_stages = (view_model.defense_stage, view_model.special_stage)
+        effects = (view_model.reflect_active, view_model.light_screen_active)
+        defender_stats, move_results = best_moves_service.calculate_best_moves_for_target(
+            view_model.defending_pokemon,
+            view_model.defending_level,
+            stat_stages,
+            effects,
+            view_model.attacker_stages,
+        )
+        top_results = move_results[:BEST_MOVE_RESULTS_LIMIT]
+        attackers = {
+            pokemon.nickname: (pokemon, tuple(stages)) for pokemon, *stages in view_model.attacker_stages
+        }
+        ko_thresholds = []
+        progress(0, len(top_results))
+        for i, (_, nickname, move_name, _, _) in enumerate(top_results, start=1):
+            pokemon, attacker_stages = attackers[nickname]
+            arguments = (
+                pokemon,
+                move_name,
+                attacker_stages,
+                view_model.defending_pokemon,
+                view_model.defending_level,
+                KO_THRESHOLD_PROBABILITY,
+                1,
+                stat_stages,
+                effects,
+            )
+            stat_label = (
+                LABEL_SPECIAL_SHORT
+                if move_repository.get_record(move_name).is_special
+                else LABEL_ATTACK_SHORT
+            )
+            ko_thresholds.append(
+                (
+                    stat_label,
+                    best_moves_service.solve_min_attack_stage(*arguments),
+                    best_moves_service.solve_min_level(*arguments),
+                ),
+            )
+            progress(i, len(top_results))
+        return defender_stats, move_results, ko_thresholds
+
+    @staticmethod
+    def _run_worst_matchups_calculation(
+        best_moves_service: BestMovesService,
+        view_model: BestMoveViewModel,
+        progress: ProgressCallback,
+    ) -> list[tuple[str, tuple[float, str, str, int, int] | None]]:
+        matchup_matrix = best_moves_service.calculate_matchup_matrix(
+            view_model.attacker_stages,
+            effects=(view_model.reflect_active, view_model.light_screen_active),
+            progress=progress,
+        )
+        return [
+            (species, matchup_matrix.best_move(species, view_model.defending_level))
+            for species, _ in matchup_matrix.worst_matchups(
+                view_model.defending_level,
+                WORST_MATCHUP_RESULTS_LIMIT,
+            )
+        ]
+
+    def _calculate(self) -> None:
+        self._view_model.defending_pokemon = self._read_species()
+        self._view_model.defending_level = self._level_spinner.value()
+        self._view_model.defense_stage = self._defense_spinner.value()
+        self._view_model.special_stage = self._special_spinner.value()
+        self._view_model.reflect_active = self._reflect_checkbox.isChecked()
+        self._view_model.light_screen_active = self._light_screen_checkbox.isChecked()
+        if not self._view_model.has_valid_defender:
+            self._show_message(self._view_model.defender_display_text)
+            return
+        self._view_model.attacker_stages = self._read_party_stages()
+        self._submit_calculation(
+            partial(
+                self._run_best_moves_calculation,
+                self._best_moves_service,
+                self._move_repository,
+                copy.copy(self._view_model),
+            ),
+            self._show_best_moves,
+        )
+
+    def _calculate_worst_matchups(self) -> None:
+        self._view_model.defending_level = self._level_spinner.value()
+        self._view_model.reflect_active = self._reflect_checkbox.isChecked()
+        self._view_model.light_screen_active = self._light_screen_checkbox.isChecked()
+        self._view_model.attacker_stages = self._read_party_stages()
+        self._submit_calculation(
+            partial(
+                self._run_worst_matchups_calculation, self._best_moves_service, copy.copy(self._view_model)
+            ),
+            self._show_worst_matchups,
+        )
+
+    def _create_stage_form(self) -> QFormLayout:
+        right_column = QFormLayout()
+        self._level_spinner = QSpinBox(self)
+        self._level_spinner.setRange(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX)
+        right_column.addRow(QLabel(LABEL_LEVEL, self), self._level_spinner)
+        self._defense_spinner = QSpinBox(self)
+        self._defense_spinner.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
+        right_column.addRow(QLabel(LABEL_DEFENSE_STAGE, self), self._defense_spinner)
+        self._special_spinner = QSpinBox(self)
+        self._special_spinner.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
+        right_column.addRow(QLabel(LABEL_SPECIAL_STAGE, self), self._special_spinner)
+        return right_column
+
+    def _show_best_moves(
+        self,
+        result: tuple[
+            dict[str, str | int | list[str]],
+            list[tuple[float, str, str, int, int]],
+            list[tuple[str, KoThreshold, KoThreshold]],
+        ],
+    ) -> None:
+        defender_stats, move_results, ko_thresholds = result
+        if defender_stats:
+            self._view_model.defending_hp = defender_stats.get("hp")
+        self._view_model.move_results = move_results
+        self._view_model.ko_thresholds = ko_thresholds
+        self._add_result_labels([self._view_model.defender_display_text, *self._view_model.formatted_results])
+
+    def _show_worst_matchups(self, result: list[tuple[str, tuple[float, str, str, int, int] | None]]) -> None:
+        self._view_model.worst_matchups = result
+        self._add_result_labels(self._view_model.formatted_worst_matchups)
+
+    def init_ui(self) -> None:
+        super().init_ui()
+        worst_matchups_button = QPushButton(BUTTON_WORST_MATCHUPS, self)
+        worst_matchups_button.clicked.connect(self._calculate_worst_matchups)
+        self._button_layout.addWidget(worst_matchups_button)
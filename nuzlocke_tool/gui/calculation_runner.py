@@ -0,0 +1,100 @@
+import logging
+import threading
+from collections.abc import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+LOGGER = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class CalculationCancelledError(Exception):
+    pass
+
+
+class CalculationSignals(QObject):
+    failed = pyqtSignal(int, str)
+    finished = pyqtSignal(int, object)
+    progress = pyqtSignal(int, int, int)
+
+
+class CalculationTask(QRunnable):
+    def __init__(
+        self,
+        request_id: int,
+        calculation: Callable[[ProgressCallback], object],
+        signals: CalculationSignals,
+    ) -> None:
+        super().__init__()
+        self._calculation = calculation
+        self._cancel_event = threading.Event()
+        self._request_id = request_id
+        self._signals = signals
+
+    def _report_progress(self, completed: int, total: int) -> None:
+        if self._cancel_event.is_set():
+            raise CalculationCancelledError
+        self._signals.progress.emit(self._request_id, completed, total)
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        try:
+            result = self._calculation(self._report_progress)
+        except CalculationCancelledError:
+            LOGGER.info("Calculation request %s cancelled", self._request_id)
+            return
+        except Exception as e:
+            LOGGER.exception("Calculation request %s failed", self._request_id)
+            self._signals.failed.emit(self._request_id, str(e))
+            return
+        if not self._cancel_event.is_set():
+            self._signals.finished.emit(self._request_id, result)
+
+
+class CalculationRunner(QObject):
+    failed = pyqtSignal(str)
+    finished = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, parent: QObject, thread_pool: QThreadPool | None = None) -> None:
+        super().__init__(parent)
+        self._active_task: CalculationTask | None = None
+        self._request_id = 0
+        self._signals = CalculationSignals(self)
+        self._signals.failed.connect(self._on_failed)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.progress.connect(self._on_progress)
+        self._thread_pool = thread_pool if thread_pool is not None else QThreadPool.globalInstance()
+
+    def _on_failed(self, request_id: int, error: str) -> None:
+        if request_id == self._request_id:
+            self._active_task = None
+            self.failed.emit(error)
+
+    def _on_finished(self, request_id: int, result: object) -> None:
+        if request_id == self._request_id:
+            self._active_task = None
+            self.finished.emit(result)
+
+    def _on_progress(self, request_id: int, completed: int, total: int) -> None:
+        if request_id == self._request_id:
+            self.progress.emit(completed, total)
+
+    @property
+    def is_running(self) -> bool:
+        return self._active_task is not None
+
+    def cancel(self) -> None:
+        if self._active_task is not None:
+            self._active_task.cancel()
+            self._active_task = None
+        self._request_id += 1
+
+    def submit(self, calculation: Callable[[ProgressCallback], object]) -> int:
+        self.cancel()
+        self._active_task = CalculationTask(self._request_id, calculation, self._signals)
+        self._thread_pool.start(self._active_task)
+        return self._request_id
@@ -23,7 +23,6 @@ from PyQt6.QtWidgets import (
 
 from nuzlocke_tool.command import EditPokemonCommand, UpdateMoveCommand
 from nuzlocke_tool.constants import (
-    ALIGN_CENTER,
     LABEL_DETERMINANT_VALUES_SHORT,
     LABEL_LEVEL,
     LABEL_MOVES,
@@ -45,10 +44,11 @@ from nuzlocke_tool.constants import (
     WIDGET_POKEMON_CARD_WIDTH,
 )
 from nuzlocke_tool.container import Container
+from nuzlocke_tool.gui.constants import ALIGN_CENTER
 from nuzlocke_tool.gui.dialogs import PokemonDialog
 from nuzlocke_tool.models.models import EventType, GameState, Pokemon, PokemonCardType, PokemonStatus
 from nuzlocke_tool.models.view_models import PokemonCardViewModel
-from nuzlocke_tool.services.game_service import GameService
+from nuzlocke_tool.services.operation_log import SaveOperation
 from nuzlocke_tool.services.pokemon_service import PokemonService
 from nuzlocke_tool.utils import add_pokemon_image, load_pokemon_image
 
@@ -68,7 +68,6 @@ class BasePokemonCardWidget(QWidget):
     ) -> None:
         super().__init__(parent)
         self._container = container
-        self._game_service = GameService(self._container)
         self._game_state = self._container.game_state()
         self._journal_service = self._container.journal_service_factory(self._game_state)
         self._pokemon = pokemon
@@ -251,7 +250,9 @@ class ActivePokemonCardWidget(BasePokemonCardWidget):
     def _on_level_changed(self, value: int) -> None:
         self._pokemon.level = value
         self._view_model.level = value
-        self._game_service.save_game(self._game_state)
+        self._save_service.defer(
+            self._game_state, SaveOperation.update_pokemon(self._game_state, self._pokemon)
+        )
 
     def _on_species_changed(self, index: int) -> None:
         new_species = self._species_widget.itemData(index)
@@ -270,7 +271,10 @@ class ActivePokemonCardWidget(BasePokemonCardWidget):
             self._view_model.image_path = new_view_model.image_path
             self._journal_service.add_evolved_entry(self._pokemon, current_species)
             LOGGER.info("Pokemon evolved from %s to %s", current_species, self._pokemon.species)
-            self._game_service.save_game(self._game_state)
+            self._save_service.record(
+                self._game_state,
+                SaveOperation.update_pokemon(self._game_state, self._pokemon),
+            )
             self._refresh_species()
             self._refresh_moves()
 
@@ -0,0 +1,9 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QDialogButtonBox
+
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+ALIGN_H_CENTER = Qt.AlignmentFlag.AlignHCenter
+ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft
+ALIGN_TOP = Qt.AlignmentFlag.AlignTop
+BUTTON_CANCEL = QDialogButtonBox.StandardButton.Cancel
+BUTTON_OK = QDialogButtonBox.StandardButton.Ok
@@ -18,8 +18,6 @@ from PyQt6.QtWidgets import (
 
 from nuzlocke_tool.config import PathConfig
 from nuzlocke_tool.constants import (
-    BUTTON_CANCEL,
-    BUTTON_OK,
     DIALOG_ADD_POKEMON_TITLE,
     DIALOG_FAILED_ENCOUNTER_TITLE,
     DIALOG_NEW_SESSION_TITLE,
@@ -58,8 +56,9 @@ from nuzlocke_tool.constants import (
     TOOLTIP_CHECKBOX_SUBREGIONS,
 )
 from nuzlocke_tool.container import Container
+from nuzlocke_tool.gui.constants import BUTTON_CANCEL, BUTTON_OK
 from nuzlocke_tool.models.models import FailedEncounter, Pokemon, PokemonStatus, RulesetData
-from nuzlocke_tool.utils import load_yaml_file
+from nuzlocke_tool.yaml_loader import load_yaml_file
 
 LOGGER = logging.getLogger(__name__)
 
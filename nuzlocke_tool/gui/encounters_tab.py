@@ -21,6 +21,7 @@ from nuzlocke_tool.container import Container
 from nuzlocke_tool.gui.dialogs import FailedEncounterDialog
 from nuzlocke_tool.models.models import EventType
 from nuzlocke_tool.models.view_models import EncounterViewModel
+from nuzlocke_tool.services.operation_log import SaveOperation
 
 
 class EncountersTab(QWidget):
@@ -42,7 +43,7 @@ class EncountersTab(QWidget):
             return
         failed_encounter = dialog.failed_encounter
         self._game_state.failed_encounters.append(failed_encounter)
-        self._save_service.save_session(self._game_state)
+        self._save_service.record(self._game_state, SaveOperation.add_failed_encounter(failed_encounter))
         self._event_manager.publish(EventType.FAILED_ENCOUNTER_ADDED, {"failed_encounter": failed_encounter})
         self.update_encounters()
         journal_service = self._container.journal_service_factory(self._game_state)
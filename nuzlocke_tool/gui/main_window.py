@@ -2,12 +2,13 @@ import logging
 from pathlib import Path
 
 from PyQt6.QtCore import QEvent, QObject, Qt, QTimer
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QCloseEvent
 from PyQt6.QtWidgets import (
     QComboBox,
     QDialog,
     QFileDialog,
     QGridLayout,
+    QInputDialog,
     QMainWindow,
     QMessageBox,
     QPushButton,
@@ -23,11 +24,12 @@ from nuzlocke_tool.command import AddPokemonCommand, CommandManager, TransferPok
 from nuzlocke_tool.config import PathConfig
 from nuzlocke_tool.constants import (
     ACTIVE_PARTY_LIMIT,
-    ALIGN_LEFT,
-    ALIGN_TOP,
     BUTTON_ADD_POKEMON,
+    DIALOG_LOAD_SESSION_TITLE,
+    LABEL_SAVE_FILE,
     LABEL_TOOL_BEST_MOVE,
     LABEL_TOOL_RANDOM_DECISION,
+    LABEL_TOOL_THREAT_ANALYSIS,
     MAIN_WINDOW_TITLE,
     MENU_ACTION_EXIT_NAME,
     MENU_ACTION_LOAD_NAME,
@@ -57,15 +59,26 @@ from nuzlocke_tool.gui.card_widgets import (
     BoxedPokemonCardWidget,
     DeadPokemonCardWidget,
 )
+from nuzlocke_tool.gui.constants import ALIGN_LEFT, ALIGN_TOP
 from nuzlocke_tool.gui.dialogs import NewSessionDialog, PokemonDialog
 from nuzlocke_tool.gui.encounters_tab import EncountersTab
 from nuzlocke_tool.gui.random_decision_widget import RandomDecisionToolWidget
-from nuzlocke_tool.models.models import EventType, GameState, Pokemon, PokemonCardType, PokemonStatus
+from nuzlocke_tool.gui.save_scheduler import SaveScheduler
+from nuzlocke_tool.gui.threat_analysis_widget import ThreatAnalysisToolWidget
+from nuzlocke_tool.models.models import (
+    EventType,
+    GameState,
+    Pokemon,
+    PokemonCardType,
+    PokemonStatus,
+    SaveBackend,
+)
 from nuzlocke_tool.models.view_models import GameStateViewModel, PokemonCardViewModel
 from nuzlocke_tool.services.game_service import GameService
 from nuzlocke_tool.services.pokemon_service import PokemonService
 from nuzlocke_tool.services.random_decision_service import RandomDecisionService
-from nuzlocke_tool.utils import clear_layout, load_yaml_file
+from nuzlocke_tool.utils import clear_layout
+from nuzlocke_tool.yaml_loader import load_yaml_file
 
 LOGGER = logging.getLogger(__name__)
 
@@ -91,6 +104,7 @@ class NuzlockeTrackerMainWindow(QMainWindow):
         self._journal_service = None
         self._pokemon_service = None
         self._save_service = self._container.save_service()
+        self._save_scheduler = SaveScheduler(self._save_service, self)
         self._create_menu()
         self._init_tabs()
         self._update_ui_from_viewmodel()
@@ -224,13 +238,15 @@ class NuzlockeTrackerMainWindow(QMainWindow):
         self._tools_tab.setEnabled(False)
         layout = QVBoxLayout(self._tools_tab)
         tool_selector = QComboBox(self._tools_tab)
-        tool_selector.addItems([LABEL_TOOL_RANDOM_DECISION, LABEL_TOOL_BEST_MOVE])
+        tool_selector.addItems([LABEL_TOOL_RANDOM_DECISION, LABEL_TOOL_BEST_MOVE, LABEL_TOOL_THREAT_ANALYSIS])
         layout.addWidget(tool_selector)
         tool_stack = QStackedWidget(self._tools_tab)
         self._random_decision_widget = RandomDecisionToolWidget(self._container, self._tools_tab)
         tool_stack.addWidget(self._random_decision_widget)
         self._best_moves_widget = BestMovesToolWidget(self._container, self._tools_tab)
         tool_stack.addWidget(self._best_moves_widget)
+        self._threat_analysis_widget = ThreatAnalysisToolWidget(self._container, self._tools_tab)
+        tool_stack.addWidget(self._threat_analysis_widget)
         tool_selector.currentIndexChanged.connect(tool_stack.setCurrentIndex)
         layout.addWidget(tool_stack)
         self._tools_tab.setLayout(layout)
@@ -299,6 +315,7 @@ class NuzlockeTrackerMainWindow(QMainWindow):
         if pokemon.status == PokemonStatus.ACTIVE:
             self._update_active_party_display()
             self._best_moves_widget.update_party_stage_section()
+            self._threat_analysis_widget.update_party_stage_section()
         elif pokemon.status == PokemonStatus.BOXED:
             self._update_boxed_pokemon_display()
         self._encounters_tab.update_encounters()
@@ -308,6 +325,7 @@ class NuzlockeTrackerMainWindow(QMainWindow):
         if pokemon.status == PokemonStatus.ACTIVE:
             self._update_active_party_display()
             self._best_moves_widget.update_party_stage_section()
+            self._threat_analysis_widget.update_party_stage_section()
         elif pokemon.status == PokemonStatus.BOXED:
             self._update_boxed_pokemon_display()
         elif pokemon.status == PokemonStatus.DEAD:
@@ -321,6 +339,7 @@ class NuzlockeTrackerMainWindow(QMainWindow):
         if PokemonStatus.ACTIVE in {previous_status, new_status}:
             self._update_active_party_display()
             self._best_moves_widget.update_party_stage_section()
+            self._threat_analysis_widget.update_party_stage_section()
         if PokemonStatus.BOXED in {previous_status, new_status}:
             self._update_boxed_pokemon_display()
         if PokemonStatus.DEAD in {previous_status, new_status}:
@@ -337,6 +356,7 @@ class NuzlockeTrackerMainWindow(QMainWindow):
         self._encounters_tab.update()
         self._random_decision_widget.set_state(self._container.game_state())
         self._best_moves_widget.set_state(self._container.game_state())
+        self._threat_analysis_widget.set_state(self._container.game_state())
 
     def _on_subtab_changed(self, index: int) -> None:
         subtabs = self.findChild(QTabWidget, "party_subtabs")
@@ -347,11 +367,22 @@ class NuzlockeTrackerMainWindow(QMainWindow):
         ):
             QTimer.singleShot(50, self._update_boxed_pokemon_display)
 
-    def _prompt_for_save_file(self) -> None:
+    def _prompt_for_save_file(self) -> Path | None:
+        if self._save_service.backend == SaveBackend.SQLITE:
+            save_files = [str(save_file) for save_file in self._save_service.list_sessions()]
+            save_file, accepted = QInputDialog.getItem(
+                self,
+                DIALOG_LOAD_SESSION_TITLE,
+                LABEL_SAVE_FILE,
+                save_files,
+                len(save_files) - 1,
+                editable=False,
+            )
+            return Path(save_file) if accepted and save_file else None
         folder = PathConfig.save_folder()
         file_path, _ = QFileDialog.getOpenFileName(
             self,
-            "Select Save File",
+            DIALOG_LOAD_SESSION_TITLE,
             str(folder),
             "Save Files (*.sav)",
         )
@@ -392,6 +423,7 @@ class NuzlockeTrackerMainWindow(QMainWindow):
             add_button.clicked.connect(self._add_active_pokemon)
             self._active_party_layout.addWidget(add_button)
         self._best_moves_widget.update_party_stage_section()
+        self._threat_analysis_widget.update_party_stage_section()
 
     def _update_boxed_pokemon_display(self) -> None:
         clear_layout(self._boxed_pokemon_layout)
@@ -469,6 +501,10 @@ class NuzlockeTrackerMainWindow(QMainWindow):
         else:
             self._rules_text.clear()
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self._save_scheduler.stop()
+        super().closeEvent(event)
+
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # noqa: N802
         if (
             obj == self._boxed_scroll_area.viewport() or obj == self._dead_scroll_area.viewport()
@@ -4,7 +4,6 @@ from PyQt6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidg
 
 from nuzlocke_tool.config import PathConfig
 from nuzlocke_tool.constants import (
-    ALIGN_CENTER,
     LABEL_DECISION_CINNABAR_ENCOUNTER,
     LABEL_DECISION_DOJO_GIFT,
     LABEL_DECISION_EEVEELUTION,
@@ -16,10 +15,12 @@ from nuzlocke_tool.constants import (
     STYLE_SHEET_LABEL_OUTCOME,
 )
 from nuzlocke_tool.container import Container
+from nuzlocke_tool.gui.constants import ALIGN_CENTER
 from nuzlocke_tool.models.models import EventType, GameState
 from nuzlocke_tool.models.view_models import DecisionViewModel
 from nuzlocke_tool.services.random_decision_service import RandomDecisionService
-from nuzlocke_tool.utils import clear_widget, load_yaml_file
+from nuzlocke_tool.utils import clear_widget
+from nuzlocke_tool.yaml_loader import load_yaml_file
 
 LOGGER = logging.getLogger(__name__)
 
@@ -0,0 +1,27 @@
+from PyQt6.QtCore import QObject, QTimer
+
+from nuzlocke_tool.constants import AUTOSAVE_DELAY
+from nuzlocke_tool.services.save_service import SaveService
+
+
+class SaveScheduler(QObject):
+    def __init__(self, save_service: SaveService, parent: QObject, delay: int = AUTOSAVE_DELAY) -> None:
+        super().__init__(parent)
+        self._save_service = save_service
+        self._timer = QTimer(self)
+        self._timer.setInterval(delay)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+        self._save_service.set_scheduler(self._timer.start)
+
+    def _on_timeout(self) -> None:
+        self._save_service.flush(compact=False)
+
+    def flush(self) -> bool:
+        self._timer.stop()
+        return self._save_service.flush()
+
+    def stop(self) -> None:
+        self.flush()
+        self._save_service.set_scheduler(None)
+        self._save_service.wait_for_writes()
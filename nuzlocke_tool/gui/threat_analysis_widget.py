@@ -0,0 +1,91 @@
+import copy
+from functools import partial
+
+from PyQt6.QtWidgets import QFormLayout, QLabel, QSpinBox, QWidget
+
+from nuzlocke_tool.constants import (
+    BUTTON_CALC_THREATS,
+    LABEL_ATTACK_STAGE,
+    LABEL_ATTACKING_POKEMON,
+    LABEL_DEFENSE,
+    LABEL_LEVEL,
+    LABEL_SPECIAL,
+    LABEL_SPECIAL_STAGE,
+    LABEL_SPEED_STAGE,
+    POKEMON_LEVEL_MAX,
+    POKEMON_LEVEL_MIN,
+    POKEMON_STAT_STAGE_MAX,
+    POKEMON_STAT_STAGE_MIN,
+)
+from nuzlocke_tool.container import Container
+from nuzlocke_tool.damage import ThreatMatrix
+from nuzlocke_tool.gui.best_moves_widget import CalculationToolWidget
+from nuzlocke_tool.gui.calculation_runner import ProgressCallback
+from nuzlocke_tool.models.view_models import ThreatAnalysisViewModel
+from nuzlocke_tool.services.best_moves_service import BestMovesService
+
+
+class ThreatAnalysisToolWidget(CalculationToolWidget):
+    def __init__(self, container: Container, parent: QWidget) -> None:
+        super().__init__(
+            container,
+            parent,
+            LABEL_ATTACKING_POKEMON,
+            BUTTON_CALC_THREATS,
+            (LABEL_DEFENSE, LABEL_SPECIAL),
+            ThreatAnalysisViewModel,
+        )
+
+    @staticmethod
+    def _run_threat_calculation(
+        best_moves_service: BestMovesService,
+        view_model: ThreatAnalysisViewModel,
+        progress: ProgressCallback,
+    ) -> ThreatMatrix:
+        progress(0, 1)
+        result = best_moves_service.calculate_threat_matrix(
+            view_model.attacking_pokemon,
+            view_model.attacking_level,
+            (view_model.attack_stage, view_model.special_stage, view_model.speed_stage),
+            (view_model.reflect_active, view_model.light_screen_active),
+            view_model.defender_stages,
+        )
+        progress(1, 1)
+        return result
+
+    def _calculate(self) -> None:
+        self._view_model.attacking_pokemon = self._read_species()
+        self._view_model.attacking_level = self._level_spinner.value()
+        self._view_model.attack_stage = self._attack_spinner.value()
+        self._view_model.special_stage = self._special_spinner.value()
+        self._view_model.speed_stage = self._speed_spinner.value()
+        self._view_model.reflect_active = self._reflect_checkbox.isChecked()
+        self._view_model.light_screen_active = self._light_screen_checkbox.isChecked()
+        if not self._view_model.has_valid_attacker:
+            self._show_message(self._view_model.attacker_display_text)
+            return
+        self._view_model.defender_stages = self._read_party_stages()
+        self._submit_calculation(
+            partial(self._run_threat_calculation, self._best_moves_service, copy.copy(self._view_model)),
+            self._show_threats,
+        )
+
+    def _create_stage_form(self) -> QFormLayout:
+        right_column = QFormLayout()
+        self._level_spinner = QSpinBox(self)
+        self._level_spinner.setRange(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX)
+        right_column.addRow(QLabel(LABEL_LEVEL, self), self._level_spinner)
+        self._attack_spinner = QSpinBox(self)
+        self._attack_spinner.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
+        right_column.addRow(QLabel(LABEL_ATTACK_STAGE, self), self._attack_spinner)
+        self._special_spinner = QSpinBox(self)
+        self._special_spinner.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
+        right_column.addRow(QLabel(LABEL_SPECIAL_STAGE, self), self._special_spinner)
+        self._speed_spinner = QSpinBox(self)
+        self._speed_spinner.setRange(POKEMON_STAT_STAGE_MIN, POKEMON_STAT_STAGE_MAX)
+        right_column.addRow(QLabel(LABEL_SPEED_STAGE, self), self._speed_spinner)
+        return right_column
+
+    def _show_threats(self, result: ThreatMatrix) -> None:
+        self._view_model.threats = result.ranked_threats()
+        self._add_result_labels([self._view_model.attacker_display_text, *self._view_model.formatted_results])
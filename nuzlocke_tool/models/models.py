@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import Enum, IntFlag, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, NotRequired, TypedDict
 
 if TYPE_CHECKING:
+    from nuzlocke_tool.models.tables import MoveRecord, SpeciesStatTable, SymbolTables, TypeChart
     from nuzlocke_tool.rules import RuleStrategy
 
 
@@ -11,10 +12,20 @@ class LocationData(TypedDict):
     games: list[str]
 
 
+class StaticDamageData(TypedDict):
+    min: int
+    max: int
+    min_level_multiplier: float
+    max_level_multiplier: float
+
+
 class MoveData(TypedDict):
     power: int
     move_type: str
     accuracy: int
+    category: str
+    effects: NotRequired[list[str]]
+    static_damage: NotRequired[StaticDamageData]
 
 
 class PokemonData(TypedDict):
@@ -33,6 +44,16 @@ class RulesetData(TypedDict):
     rules: list[str]
 
 
+class BattlePolicy(Enum):
+    BEST_MOVE = auto()
+    RANDOM_MOVE = auto()
+
+
+class DamageEngineType(Enum):
+    SCALAR = auto()
+    VECTORIZED = auto()
+
+
 class EventType(Enum):
     POKEMON_ADDED = auto()
     POKEMON_EDITED = auto()
@@ -45,6 +66,19 @@ class EventType(Enum):
     FAILED_ENCOUNTER_ADDED = auto()
 
 
+class MoveEffect(IntFlag):
+    NONE = 0
+    DOUBLE_ATTACK = auto()
+    FLINCH_10 = auto()
+    FLINCH_30 = auto()
+    HIGH_CRIT = auto()
+    MULTI_HIT = auto()
+    OHKO = auto()
+    SELFDESTRUCT = auto()
+    STATIC_DAMAGE = auto()
+    SWIFT = auto()
+
+
 class PokemonCardType(Enum):
     ACTIVE = "active"
     BOXED = "boxed"
@@ -57,6 +91,26 @@ class PokemonStatus(Enum):
     DEAD = auto()
 
 
+class SaveBackend(Enum):
+    FILE = auto()
+    SQLITE = auto()
+
+
+class SaveFormat(Enum):
+    BINARY = auto()
+    YAML = auto()
+
+
+class SaveOperationType(Enum):
+    ADD_FAILED_ENCOUNTER = auto()
+    ADD_POKEMON = auto()
+    LEARN_MOVE = auto()
+    MAKE_DECISION = auto()
+    REMOVE_POKEMON = auto()
+    TRANSFER_POKEMON = auto()
+    UPDATE_POKEMON = auto()
+
+
 @dataclass
 class Pokemon:
     nickname: str
@@ -79,6 +133,16 @@ class FailedEncounter:
     level: int
 
 
+@dataclass
+class GenerationData:
+    move_data: dict[str, MoveData]
+    move_records: dict[str, "MoveRecord"]
+    pokemon_data: dict[str, PokemonData]
+    symbols: "SymbolTables"
+    species_table: "SpeciesStatTable"
+    type_chart: "TypeChart"
+
+
 @dataclass
 class GameState:
     game: str
@@ -0,0 +1,189 @@
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Self
+
+import numpy as np
+
+from nuzlocke_tool.constants import MOVE_CATEGORY_SPECIAL
+from nuzlocke_tool.models.models import MoveData, MoveEffect, PokemonData
+
+STAT_ROWS = ("hp", "atk", "def", "spd", "spe")
+
+
+@dataclass(frozen=True)
+class MoveRecord:
+    power: int
+    move_type: str
+    accuracy: float
+    is_special: bool
+    effects: MoveEffect
+    static_min: int
+    static_max: int
+    static_min_level_multiplier: float
+    static_max_level_multiplier: float
+
+    @classmethod
+    def from_move_data(cls, move_name: str, move_data: MoveData) -> Self:
+        effects = MoveEffect.NONE
+        for effect in move_data.get("effects", []):
+            if effect.upper() not in MoveEffect.__members__:
+                err_msg = f"Unknown effect '{effect}' for move: {move_name}"
+                raise ValueError(err_msg)
+            effects |= MoveEffect[effect.upper()]
+        static_damage = move_data.get("static_damage", {})
+        return cls(
+            int(move_data["power"]),
+            move_data["type"],
+            float(move_data["accuracy"]),
+            move_data.get("category") == MOVE_CATEGORY_SPECIAL,
+            effects,
+            int(static_damage.get("min", 0)),
+            int(static_damage.get("max", 0)),
+            float(static_damage.get("min_level_multiplier", 0)),
+            float(static_damage.get("max_level_multiplier", 0)),
+        )
+
+    def has_effect(self, effect: MoveEffect) -> bool:
+        return bool(self.effects & effect)
+
+
+class SymbolTable:
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        for name in names:
+            self.intern(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(self._names)
+
+    def id_of(self, name: str) -> int:
+        return self._ids[name]
+
+    def ids_of(self, names: Iterable[str]) -> list[int]:
+        return [self._ids[name] for name in names]
+
+    def intern(self, name: str) -> int:
+        symbol_id = self._ids.get(name)
+        if symbol_id is None:
+            symbol_id = len(self._names)
+            name = sys.intern(name)
+            self._ids[name] = symbol_id
+            self._names.append(name)
+        return symbol_id
+
+    def name_of(self, symbol_id: int) -> str:
+        return self._names[symbol_id]
+
+
+@dataclass(frozen=True)
+class TypeChart:
+    types: SymbolTable
+    effectiveness: np.ndarray
+    dual_type_products: np.ndarray
+
+    @property
+    def no_type_id(self) -> int:
+        return len(self.types)
+
+    @classmethod
+    def from_type_data(cls, type_data: dict[str, dict[str, float]], types: SymbolTable) -> Self:
+        effectiveness = np.ones((len(types), len(types) + 1), dtype=np.float64)
+        for attack_type, matchups in type_data.items():
+            for defend_type, multiplier in matchups.items():
+                if attack_type in types and defend_type in types:
+                    effectiveness[types.id_of(attack_type), types.id_of(defend_type)] = multiplier
+        dual_type_products = effectiveness[:, :, np.newaxis] * effectiveness[:, np.newaxis, :]
+        effectiveness.flags.writeable = False
+        dual_type_products.flags.writeable = False
+        return cls(types, effectiveness, dual_type_products)
+
+    def type_id(self, type_name: str) -> int:
+        return self.types.id_of(type_name) if type_name in self.types else self.no_type_id
+
+
+@dataclass(frozen=True)
+class SymbolTables:
+    moves: SymbolTable
+    species: SymbolTable
+    types: SymbolTable
+
+    @classmethod
+    def from_game_data(
+        cls,
+        move_data: dict[str, MoveData],
+        pokemon_data: dict[str, PokemonData],
+        type_names: Iterable[str] = (),
+    ) -> Self:
+        moves = SymbolTable(move_data.keys())
+        species = SymbolTable(pokemon_data.keys())
+        types = SymbolTable(type_names)
+        for data in move_data.values():
+            types.intern(data["type"])
+        for data in pokemon_data.values():
+            for move in data["moves"]:
+                moves.intern(move)
+            for pokemon_type in data["type"]:
+                types.intern(pokemon_type)
+        return cls(moves, species, types)
+
+
+@dataclass(frozen=True)
+class SpeciesStatTable:
+    species: SymbolTable
+    types: SymbolTable
+    base_stats: np.ndarray
+    type_ids: np.ndarray
+    learnsets: tuple[frozenset[int], ...]
+
+    @property
+    def no_type_id(self) -> int:
+        return len(self.types)
+
+    @property
+    def type1(self) -> np.ndarray:
+        return self.type_ids[0]
+
+    @property
+    def type2(self) -> np.ndarray:
+        return self.type_ids[1]
+
+    @classmethod
+    def from_pokemon_data(cls, pokemon_data: dict[str, PokemonData], symbols: SymbolTables) -> Self:
+        species = symbols.species.names
+        no_type_id = len(symbols.types)
+        base_stats = np.array(
+            [[pokemon_data[name][stat] for name in species] for stat in STAT_ROWS],
+            dtype=np.int16,
+        )
+        type_ids = np.array(
+            [
+                [symbols.types.id_of(pokemon_data[name]["type"][0]) for name in species],
+                [
+                    symbols.types.id_of(pokemon_data[name]["type"][1])
+                    if len(pokemon_data[name]["type"]) > 1
+                    else no_type_id
+                    for name in species
+                ],
+            ],
+            dtype=np.int8,
+        )
+        base_stats.flags.writeable = False
+        type_ids.flags.writeable = False
+        learnsets = tuple(frozenset(symbols.moves.ids_of(pokemon_data[name]["moves"])) for name in species)
+        return cls(symbols.species, symbols.types, base_stats, type_ids, learnsets)
+
+    def stat(self, stat: str) -> np.ndarray:
+        return self.base_stats[STAT_ROWS.index(stat.lower())]
+
+
+def build_move_records(move_data: dict[str, MoveData]) -> dict[str, MoveRecord]:
+    return {move_name: MoveRecord.from_move_data(move_name, data) for move_name, data in move_data.items()}
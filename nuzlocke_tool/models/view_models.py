@@ -5,15 +5,23 @@ from typing import Self
 from PyQt6.QtGui import QColor
 
 from nuzlocke_tool.constants import (
+    BEST_MOVE_RESULTS_LIMIT,
+    KO_THRESHOLD_PROBABILITY,
+    LABEL_NO_ATTACKING_POKEMON,
     LABEL_NO_DEFENDING_POKEMON,
     LABEL_NO_MOVES,
+    LABEL_NO_OHKO,
+    LABEL_NO_THREATS,
     TAB_BOXED_NAME,
     TAB_DEAD_NAME,
     TAB_PARTY_NAME,
     TABLE_COLOR_BOXED,
     TABLE_COLOR_DEAD,
     TABLE_COLOR_PARTY,
+    THREAT_RESULTS_LIMIT,
+    WORST_MATCHUP_RESULTS_LIMIT,
 )
+from nuzlocke_tool.damage import KoThreshold
 from nuzlocke_tool.models.models import FailedEncounter, GameState, Pokemon, PokemonCardType, PokemonStatus
 from nuzlocke_tool.repositories import PokemonRepository
 from nuzlocke_tool.services.pokemon_service import PokemonService
@@ -30,7 +38,20 @@ class BestMoveViewModel:
     reflect_active: bool = False
     light_screen_active: bool = False
     move_results: list[tuple[float, str, str, int, int]] = field(default_factory=list)
+    ko_thresholds: list[tuple[str, KoThreshold, KoThreshold]] = field(default_factory=list)
     attacker_stages: list[tuple[Pokemon, int, int, int]] = field(default_factory=list)
+    worst_matchups: list[tuple[str, tuple[float, str, str, int, int] | None]] = field(default_factory=list)
+
+    @staticmethod
+    def _format_ko_threshold(stat_label: str, stage: KoThreshold, level: KoThreshold) -> str:
+        prefix = f"OHKO ({KO_THRESHOLD_PROBABILITY:.0%}+)"
+        if stage.found and level.found:
+            return f"{prefix} from {stage.value:+d} {stat_label} or level {level.value}"
+        if stage.found:
+            return f"{prefix} from {stage.value:+d} {stat_label}"
+        if level.found:
+            return f"{prefix} from level {level.value}"
+        return LABEL_NO_OHKO
 
     @property
     def defender_display_text(self) -> str:
@@ -45,9 +66,28 @@ class BestMoveViewModel:
         if not self.has_results:
             return [LABEL_NO_MOVES]
         results = []
-        for i, (lta, nickname, move_name, dmg_min, dmg_max) in enumerate(self.move_results[:5]):
-            results.append(
+        for i, (lta, nickname, move_name, dmg_min, dmg_max) in enumerate(
+            self.move_results[:BEST_MOVE_RESULTS_LIMIT],
+        ):
+            result_text = (
                 f"{i + 1}. {nickname}'s {move_name}: Damage Range = {dmg_min} - {dmg_max} (Long-Term "
+                f"Average = {lta:.1f})"
+            )
+            if i < len(self.ko_thresholds):
+                result_text += f" - {self._format_ko_threshold(*self.ko_thresholds[i])}"
+            results.append(result_text)
+        return results
+
+    @property
+    def formatted_worst_matchups(self) -> list[str]:
+        results = [f"Worst matchups at level {self.defending_level}"]
+        for i, (species, best_move) in enumerate(self.worst_matchups[:WORST_MATCHUP_RESULTS_LIMIT], start=1):
+            if best_move is None:
+                results.append(f"{i}. {species}: {LABEL_NO_MOVES}")
+                continue
+            lta, nickname, move_name, dmg_min, dmg_max = best_move
+            results.append(
+                f"{i}. {species}: {nickname}'s {move_name}, Damage Range = {dmg_min} - {dmg_max} (Long-Term "
                 f"Average = {lta:.1f})",
             )
         return results
@@ -259,3 +299,44 @@ class PokemonCardViewModel:
             (cls.from_pokemon(pokemon, pokemon_repository, card_type), pokemon)
             for pokemon in filtered_pokemon
         ]
+
+
+@dataclass
+class ThreatAnalysisViewModel:
+    attacking_pokemon: str = ""
+    attacking_level: int = 1
+    attack_stage: int = 0
+    special_stage: int = 0
+    speed_stage: int = 0
+    reflect_active: bool = False
+    light_screen_active: bool = False
+    threats: list[tuple[float, float, str, str, int, int]] = field(default_factory=list)
+    defender_stages: list[tuple[Pokemon, int, int]] = field(default_factory=list)
+
+    @property
+    def attacker_display_text(self) -> str:
+        if not self.has_valid_attacker:
+            return LABEL_NO_ATTACKING_POKEMON
+        return f"Threats from {self.attacking_pokemon} at level {self.attacking_level}"
+
+    @property
+    def formatted_results(self) -> list[str]:
+        if not self.has_results:
+            return [LABEL_NO_THREATS]
+        results = []
+        for i, (ko_chance, lta, move_name, nickname, dmg_min, dmg_max) in enumerate(
+            self.threats[:THREAT_RESULTS_LIMIT],
+        ):
+            results.append(
+                f"{i + 1}. {move_name} vs {nickname}: KO Chance = {ko_chance:.1%}, Damage Range = "
+                f"{dmg_min} - {dmg_max} (Long-Term Average = {lta:.1f})",
+            )
+        return results
+
+    @property
+    def has_results(self) -> bool:
+        return bool(self.threats)
+
+    @property
+    def has_valid_attacker(self) -> bool:
+        return bool(self.attacking_pokemon)
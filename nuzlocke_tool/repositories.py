@@ -1,24 +1,94 @@
+import bisect
+from collections import Counter
+
+import numpy as np
+
 from nuzlocke_tool.data_loader import GameDataLoader
-from nuzlocke_tool.models.models import MoveData, PokemonData
+from nuzlocke_tool.models.models import LocationData, MoveData, PokemonData
+from nuzlocke_tool.models.tables import MoveRecord, SpeciesStatTable, TypeChart
 
 
 class LocationRepository:
     def __init__(self, game_data_loader: GameDataLoader) -> None:
+        self._available: list[str] = []
+        self._available_key: tuple[str, bool] | None = None
+        self._encounter_counts: Counter[str] = Counter()
         self._game_data_loader = game_data_loader
+        self._index: dict[tuple[str, bool], tuple[str, ...]] = {}
+        self._index_sets: dict[tuple[str, bool], frozenset[str]] = {}
+        self._indexed_data: dict[str, LocationData] | None = None
+        self._tracked_encounters: list[str] | None = None
+
+    def _build_index(self) -> None:
+        location_data = self._game_data_loader.location_data
+        index = {}
+        for location, info in location_data.items():
+            region_type = info.get("type")
+            for sub_region_clause in (False, True):
+                if region_type not in {None, "Partial" if sub_region_clause else "Full"}:
+                    continue
+                for game in info["games"]:
+                    index.setdefault((game, sub_region_clause), []).append(location)
+        self._index = {key: tuple(locations) for key, locations in index.items()}
+        self._index_sets = {key: frozenset(locations) for key, locations in index.items()}
+        self._indexed_data = location_data
+        self._available_key = None
+
+    def _get_index_key(self, game: str, sub_region_clause: bool) -> tuple[str, bool]:
+        if self._indexed_data is not self._game_data_loader.location_data:
+            self._build_index()
+        return (game, sub_region_clause)
+
+    def add_encounter(self, location: str) -> None:
+        self._encounter_counts[location] += 1
+        if self._encounter_counts[location] > 1:
+            return
+        index = bisect.bisect_left(self._available, location)
+        if index < len(self._available) and self._available[index] == location:
+            del self._available[index]
 
     def get_available(self, game: str, sub_region_clause: bool, encounters: list[str]) -> list[str]:
-        all_locations = self.get_for_game(game, sub_region_clause)
-        available_locations = [loc for loc in all_locations if loc not in encounters]
-        available_locations.sort()
-        return available_locations
+        key = self._get_index_key(game, sub_region_clause)
+        if (
+            key != self._available_key
+            or encounters is not self._tracked_encounters
+            or Counter(encounters) != self._encounter_counts
+        ):
+            self.track_encounters(game, sub_region_clause, encounters)
+        return self._available.copy()
 
     def get_for_game(self, game: str, sub_region_clause: bool) -> list[str]:
-        region_type = "Partial" if sub_region_clause else "Full"
-        return [
-            location
-            for location, info in self._game_data_loader.location_data.items()
-            if (info.get("type") == region_type or info.get("type") is None) and game in info["games"]
-        ]
+        key = self._get_index_key(game, sub_region_clause)
+        return list(self._index.get(key, ()))
+
+    def get_location_id(self, location: str) -> int:
+        return self._game_data_loader.location_symbols.id_of(location)
+
+    def get_location_name(self, location_id: int) -> str:
+        return self._game_data_loader.location_symbols.name_of(location_id)
+
+    def has_location(self, game: str, sub_region_clause: bool, location: str) -> bool:
+        key = self._get_index_key(game, sub_region_clause)
+        return location in self._index_sets.get(key, frozenset())
+
+    def remove_encounter(self, location: str) -> None:
+        if not self._encounter_counts[location]:
+            return
+        self._encounter_counts[location] -= 1
+        if self._encounter_counts[location]:
+            return
+        del self._encounter_counts[location]
+        if self._available_key is not None and location in self._index_sets.get(self._available_key, ()):
+            bisect.insort(self._available, location)
+
+    def track_encounters(self, game: str, sub_region_clause: bool, encounters: list[str]) -> None:
+        key = self._get_index_key(game, sub_region_clause)
+        self._encounter_counts = Counter(encounters)
+        self._available = sorted(
+            location for location in self._index.get(key, ()) if location not in self._encounter_counts
+        )
+        self._available_key = key
+        self._tracked_encounters = encounters
 
 
 class MoveRepository:
@@ -28,6 +98,15 @@ class MoveRepository:
     def get_by_id(self, move: str) -> MoveData:
         return self._game_data_loader.move_data[move]
 
+    def get_move_id(self, move: str) -> int:
+        return self._game_data_loader.active_data.symbols.moves.id_of(move)
+
+    def get_move_name(self, move_id: int) -> str:
+        return self._game_data_loader.active_data.symbols.moves.name_of(move_id)
+
+    def get_record(self, move: str) -> MoveRecord:
+        return self._game_data_loader.move_records[move]
+
 
 class PokemonRepository:
     def __init__(self, game_data_loader: GameDataLoader) -> None:
@@ -39,6 +118,51 @@ class PokemonRepository:
     def get_all_species(self) -> list[str]:
         return list(self._game_data_loader.pokemon_data.keys())
 
+    def get_base_stats(self, stat: str) -> np.ndarray:
+        return self.get_species_table().stat(stat)
+
+    def get_move_ids_for_species(self, species: str) -> frozenset[int]:
+        return self.get_species_table().learnsets[self.get_species_id(species)]
+
     def get_moves_for_species(self, species: str) -> list[str]:
         pokemon_data = self._game_data_loader.pokemon_data.get(species, {})
         return pokemon_data.get("moves", [])
+
+    def get_species_id(self, species: str) -> int:
+        return self.get_species_table().species.id_of(species)
+
+    def get_species_name(self, species_id: int) -> str:
+        return self.get_species_table().species.name_of(species_id)
+
+    def get_species_table(self) -> SpeciesStatTable:
+        return self._game_data_loader.active_data.species_table
+
+    def get_type_id(self, pokemon_type: str) -> int:
+        return self._game_data_loader.active_data.symbols.types.id_of(pokemon_type)
+
+    def get_type_name(self, type_id: int) -> str:
+        return self._game_data_loader.active_data.symbols.types.name_of(type_id)
+
+
+class TypeRepository:
+    def __init__(self, game_data_loader: GameDataLoader) -> None:
+        self._game_data_loader = game_data_loader
+
+    def get_dual_type_product(self, attack_type: str, defend_types: list[str]) -> float:
+        type_chart = self.get_type_chart()
+        type1 = type_chart.type_id(defend_types[0])
+        type2 = type_chart.type_id(defend_types[1]) if len(defend_types) > 1 else type_chart.no_type_id
+        if attack_type not in type_chart.types:
+            return 1.0
+        return float(type_chart.dual_type_products[type_chart.types.id_of(attack_type), type1, type2])
+
+    def get_effectiveness(self, attack_type: str, defend_type: str) -> float:
+        type_chart = self.get_type_chart()
+        if attack_type not in type_chart.types:
+            return 1.0
+        return float(
+            type_chart.effectiveness[type_chart.types.id_of(attack_type), type_chart.type_id(defend_type)]
+        )
+
+    def get_type_chart(self) -> TypeChart:
+        return self._game_data_loader.active_data.type_chart
@@ -0,0 +1,174 @@
+import struct
+import sys
+
+import yaml
+
+from nuzlocke_tool.constants import SAVE_BINARY_MAGIC, SAVE_BINARY_VERSION
+from nuzlocke_tool.models.models import PokemonStatus, SaveFormat
+from nuzlocke_tool.models.tables import SymbolTable
+
+COUNT = struct.Struct("<I")
+DV = struct.Struct("<IB")
+FAILED_ENCOUNTER = struct.Struct("<IIH")
+HEADER = struct.Struct(f"<{len(SAVE_BINARY_MAGIC)}sHI")
+PAIR = struct.Struct("<II")
+POKEMON = struct.Struct("<IIHHIBBB")
+SESSION = struct.Struct("<IIBIIQ")
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _decode_symbols(payload: memoryview, count: int, offset: int) -> tuple[list[str], int]:
+    names = []
+    for _ in range(count):
+        (length,) = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        names.append(sys.intern(str(payload[offset : offset + length], "utf-8")))
+        offset += length
+    return names, offset
+
+
+def _encode_symbols(symbols: SymbolTable) -> bytes:
+    parts = []
+    for name in symbols.names:
+        encoded = name.encode()
+        parts.append(COUNT.pack(len(encoded)))
+        parts.append(encoded)
+    return b"".join(parts)
+
+
+def decode_binary(payload: bytes) -> dict:
+    view = memoryview(payload)
+    magic, version, symbol_count = HEADER.unpack_from(view, 0)
+    if magic != SAVE_BINARY_MAGIC:
+        err_msg = "Not a binary save file"
+        raise ValueError(err_msg)
+    if version != SAVE_BINARY_VERSION:
+        err_msg = f"Unsupported binary save version: {version}"
+        raise ValueError(err_msg)
+    names, offset = _decode_symbols(view, symbol_count, HEADER.size)
+    game, ruleset, sub_region_clause, journal_file, save_file, log_sequence = SESSION.unpack_from(
+        view, offset
+    )
+    offset += SESSION.size
+    (pokemon_count,) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    pokemon_list = []
+    for _ in range(pokemon_count):
+        nickname, species, level, caught_level, encountered, status, move_count, dv_count = (
+            POKEMON.unpack_from(
+                view,
+                offset,
+            )
+        )
+        offset += POKEMON.size
+        moves = [names[move] for move in struct.unpack_from(f"<{move_count}I", view, offset)]
+        offset += move_count * COUNT.size
+        dvs = {}
+        for _ in range(dv_count):
+            stat, value = DV.unpack_from(view, offset)
+            offset += DV.size
+            dvs[names[stat]] = value
+        pokemon_list.append(
+            {
+                "nickname": names[nickname],
+                "species": names[species],
+                "level": level,
+                "caught_level": caught_level,
+                "moves": moves,
+                "dvs": dvs,
+                "encountered": names[encountered],
+                "status": PokemonStatus(status).name,
+            },
+        )
+    (encounter_count,) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    encounters = [names[location] for location in struct.unpack_from(f"<{encounter_count}I", view, offset)]
+    offset += encounter_count * COUNT.size
+    (failed_count,) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    failed_encounters = []
+    for _ in range(failed_count):
+        location, species, level = FAILED_ENCOUNTER.unpack_from(view, offset)
+        offset += FAILED_ENCOUNTER.size
+        failed_encounters.append({"location": names[location], "species": names[species], "level": level})
+    (decision_count,) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    decisions = {}
+    for _ in range(decision_count):
+        key, outcome = PAIR.unpack_from(view, offset)
+        offset += PAIR.size
+        decisions[names[key]] = names[outcome]
+    return {
+        "game": names[game],
+        "ruleset": names[ruleset],
+        "sub_region_clause": bool(sub_region_clause),
+        "journal_file": names[journal_file],
+        "save_file": names[save_file],
+        "log_sequence": log_sequence,
+        "pokemon": pokemon_list,
+        "encounters": encounters,
+        "failed_encounters": failed_encounters,
+        "decisions": decisions,
+    }
+
+
+def decode_save(payload: bytes) -> dict:
+    if detect_save_format(payload) == SaveFormat.BINARY:
+        return decode_binary(payload)
+    return yaml.load(payload, Loader=YAML_LOADER)
+
+
+def detect_save_format(payload: bytes) -> SaveFormat:
+    return SaveFormat.BINARY if payload.startswith(SAVE_BINARY_MAGIC) else SaveFormat.YAML
+
+
+def encode_binary(data: dict) -> bytes:
+    symbols = SymbolTable()
+    intern = symbols.intern
+    parts = [
+        SESSION.pack(
+            intern(data["game"]),
+            intern(data["ruleset"]),
+            data["sub_region_clause"],
+            intern(data["journal_file"]),
+            intern(data["save_file"]),
+            data.get("log_sequence", 0),
+        ),
+        COUNT.pack(len(data["pokemon"])),
+    ]
+    for pokemon in data["pokemon"]:
+        moves = pokemon["moves"]
+        dvs = pokemon["dvs"]
+        parts.append(
+            POKEMON.pack(
+                intern(pokemon["nickname"]),
+                intern(pokemon["species"]),
+                pokemon["level"],
+                pokemon["caught_level"],
+                intern(pokemon["encountered"]),
+                PokemonStatus[pokemon["status"]].value,
+                len(moves),
+                len(dvs),
+            ),
+        )
+        parts.append(struct.pack(f"<{len(moves)}I", *map(intern, moves)))
+        parts.extend(DV.pack(intern(stat), value) for stat, value in dvs.items())
+    encounters = data["encounters"]
+    parts.append(COUNT.pack(len(encounters)))
+    parts.append(struct.pack(f"<{len(encounters)}I", *map(intern, encounters)))
+    parts.append(COUNT.pack(len(data["failed_encounters"])))
+    parts.extend(
+        FAILED_ENCOUNTER.pack(intern(failed["location"]), intern(failed["species"]), failed["level"])
+        for failed in data["failed_encounters"]
+    )
+    parts.append(COUNT.pack(len(data["decisions"])))
+    parts.extend(PAIR.pack(intern(key), intern(outcome)) for key, outcome in data["decisions"].items())
+    header = HEADER.pack(SAVE_BINARY_MAGIC, SAVE_BINARY_VERSION, len(symbols))
+    return header + _encode_symbols(symbols) + b"".join(parts)
+
+
+def encode_save(data: dict, save_format: SaveFormat) -> bytes:
+    if save_format == SaveFormat.BINARY:
+        return encode_binary(data)
+    return yaml.dump(data, Dumper=YAML_DUMPER).encode()
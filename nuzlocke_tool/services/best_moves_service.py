@@ -1,50 +1,80 @@
 import math
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+import numpy as np
 
 from nuzlocke_tool.constants import (
-    DOUBLE_ATTACK_MOVES,
-    FLINCH_10_MOVES,
-    FLINCH_30_MOVES,
-    HIGH_CRIT_MOVES,
-    MULTI_HIT_MOVES,
-    OHKO_MOVES,
+    KO_PROBABILITY_TOLERANCE,
+    KO_THRESHOLD_CACHE_LIMIT,
+    KO_TURN_LIMIT,
+    MATCHUP_CACHE_LIMIT,
+    MATCHUP_LEVEL_CHUNK,
     ONE_BYTE,
-    SELFDESTRUCT_MOVES,
-    SPECIAL_TYPES,
+    POKEMON_DV_MIN,
+    POKEMON_LEVEL_MAX,
+    POKEMON_LEVEL_MIN,
     STAT_STAGE_MULTIPLIER,
-    STATIC_DAMAGE_MOVES,
-    SWIFT_MOVES,
-    TYPE_CHART,
 )
 from nuzlocke_tool.container import Container
-from nuzlocke_tool.models.models import GameState, MoveData, Pokemon, PokemonData
+from nuzlocke_tool.damage import (
+    AttackerArrays,
+    DamageGrid,
+    DamageMatrix,
+    DefenderArrays,
+    KoThreshold,
+    MatchupMatrix,
+    MoveArrays,
+    ThreatMatrix,
+    build_attacker_row,
+    build_move_arrays,
+    build_party_defender_arrays,
+    calculate_damage_grid,
+    calculate_damage_matrix,
+    calculate_dex_best_moves,
+    calculate_ko_probability,
+    calculate_ko_turn_probabilities,
+    calculate_roll_distribution,
+    calculate_threat_matrix,
+)
+from nuzlocke_tool.models.models import DamageEngineType, GameState, MoveEffect, Pokemon, PokemonData
+from nuzlocke_tool.models.tables import MoveRecord, SymbolTable
 
 
 class BestMovesService:
     def __init__(self, container: Container, game_state: GameState) -> None:
         self._container = container
+        self._engine = DamageEngineType[self._container.config.damage_engine().upper()]
         self._game_state = game_state
         self._move_repository = self._container.move_repository()
         self._pokemon_repository = self._container.pokemon_repository()
+        self._stat_cache = self._container.stat_cache()
+        self._matchup_cache: OrderedDict[tuple, MatchupMatrix] = OrderedDict()
+        self._matchup_lock = threading.Lock()
+        self._threshold_cache: OrderedDict[tuple, KoThreshold] = OrderedDict()
+        self._threshold_lock = threading.Lock()
+        self._type_repository = self._container.type_repository()
 
     def _apply_additional_modifiers(
         self,
-        move_name: str,
+        move_record: MoveRecord,
         long_term_average: float,
         normal_damage: int,
     ) -> tuple[float, int, int]:
         damage_min = math.floor(normal_damage * 217 / 255)
         damage_max = normal_damage
-        if move_name in MULTI_HIT_MOVES:
+        if move_record.has_effect(MoveEffect.MULTI_HIT):
             damage_min *= 2
             damage_max *= 5
             long_term_average *= 3
-        if move_name in DOUBLE_ATTACK_MOVES:
+        if move_record.has_effect(MoveEffect.DOUBLE_ATTACK):
             damage_min *= 2
             damage_max *= 2
             long_term_average *= 2
-        if move_name in FLINCH_10_MOVES:
+        if move_record.has_effect(MoveEffect.FLINCH_10):
             long_term_average *= 1.1
-        if move_name in FLINCH_30_MOVES:
+        if move_record.has_effect(MoveEffect.FLINCH_30):
             long_term_average *= 1.3
         return (long_term_average, damage_min, damage_max)
 
@@ -55,16 +85,15 @@ class BestMovesService:
 
     def _calculate_damage_components(
         self,
-        move_name: str,
-        move_data: MoveData,
+        move_record: MoveRecord,
         party_member: Pokemon,
         attacker_stats: dict[str, int | list[str]],
         defender_stats: dict[str, str | int | list[str]],
         effects: tuple[bool, bool],
     ) -> tuple[int, int]:
-        move_type = move_data["type"]
-        is_special = move_type in SPECIAL_TYPES
-        move_power = int(move_data["power"])
+        move_type = move_record.move_type
+        is_special = move_record.is_special
+        move_power = move_record.power
         if is_special:
             noncrit_attack = attacker_stats["spe"]
             noncrit_defense = defender_stats["spe"]
@@ -80,17 +109,20 @@ class BestMovesService:
             noncrit_defense *= 2
         if is_special and light_screen_active:
             noncrit_defense *= 2
-        if move_name in SELFDESTRUCT_MOVES:
+        if move_record.has_effect(MoveEffect.SELFDESTRUCT):
             noncrit_defense = math.floor(noncrit_defense / 2)
             crit_defense = math.floor(crit_defense / 2)
         if noncrit_attack > ONE_BYTE or noncrit_defense > ONE_BYTE:
             noncrit_attack = math.floor(noncrit_attack / 4)
             noncrit_defense = math.floor(noncrit_defense / 4)
         stab = 1.5 if move_type in attacker_stats["types"] else 1.0
-        type_chart_for_move = TYPE_CHART[move_type]
         defender_types = defender_stats["types"]
-        type1_multi = type_chart_for_move.get(defender_types[0], 1)
-        type2_multi = type_chart_for_move.get(defender_types[1], 1) if len(defender_types) > 1 else 1
+        type1_multi = self._type_repository.get_effectiveness(move_type, defender_types[0])
+        type2_multi = (
+            self._type_repository.get_effectiveness(move_type, defender_types[1])
+            if len(defender_types) > 1
+            else 1
+        )
         normal_base = math.floor(2 * party_member.level / 5 + 2)
         normal_damage = self._compute_final_damage(
             normal_base,
@@ -114,6 +146,63 @@ class BestMovesService:
         )
         return normal_damage, crit_damage
 
+    def _calculate_matchup_matrix(
+        self,
+        attackers: list[tuple[Pokemon, int, int, int]],
+        levels: range,
+        effects: tuple[bool, bool],
+        progress: Callable[[int, int], None] | None,
+    ) -> MatchupMatrix:
+        species_table = self._pokemon_repository.get_species_table()
+        types = species_table.types
+        species = species_table.species.names
+        attacker_rows, nicknames, move_names = self._get_attacker_rows(attackers, types)
+        level_values = np.array(levels, dtype=np.int64)
+        shape = (len(species), len(level_values))
+        if not move_names or not len(level_values):
+            return MatchupMatrix(
+                species,
+                tuple(levels),
+                (),
+                (),
+                np.full(shape, -1, dtype=np.int64),
+                np.zeros(shape, dtype=np.float64),
+                np.zeros(shape, dtype=np.int64),
+                np.zeros(shape, dtype=np.int64),
+            )
+        move_records = {move_name: self._move_repository.get_record(move_name) for move_name in move_names}
+        attacker_arrays = AttackerArrays(*np.array(attacker_rows, dtype=np.int64).T)
+        move_arrays = build_move_arrays(move_names, move_records, types)
+        type_matrix = self._type_repository.get_type_chart().effectiveness
+        chunks = []
+        for start in range(0, len(level_values), MATCHUP_LEVEL_CHUNK):
+            chunk_levels = level_values[start : start + MATCHUP_LEVEL_CHUNK]
+            chunks.append(
+                calculate_dex_best_moves(
+                    attacker_arrays,
+                    move_arrays,
+                    species_table,
+                    chunk_levels,
+                    effects,
+                    type_matrix,
+                ),
+            )
+            if progress is not None:
+                progress(start + len(chunk_levels), len(level_values))
+        best_pair, long_term_average, damage_min, damage_max = (
+            np.concatenate(arrays, axis=1) for arrays in zip(*chunks, strict=True)
+        )
+        return MatchupMatrix(
+            species,
+            tuple(levels),
+            tuple(nicknames),
+            tuple(move_names),
+            best_pair,
+            long_term_average,
+            damage_min,
+            damage_max,
+        )
+
     def _calculate_move_damage(
         self,
         pokemon: Pokemon,
@@ -122,21 +211,14 @@ class BestMovesService:
         defender_stats: dict[str, str | int | list[str]],
         effects: tuple[bool, bool],
     ) -> tuple[float, int, int] | None:
-        move_data = self._move_repository.get_by_id(move_name)
-        special_damage_result = self._handle_special_damage_moves(
-            move_name,
-            move_data,
-            pokemon,
-            defender_stats,
-        )
+        move_record = self._move_repository.get_record(move_name)
+        special_damage_result = self._handle_special_damage_moves(move_record, pokemon, defender_stats)
         if special_damage_result:
             return special_damage_result
-        move_power = int(move_data["power"])
-        if move_power == 0:
+        if move_record.power == 0:
             return None
         normal_damage, crit_damage = self._calculate_damage_components(
-            move_name,
-            move_data,
+            move_record,
             pokemon,
             attacker_stats,
             defender_stats,
@@ -144,45 +226,124 @@ class BestMovesService:
         )
         crit_chance = (
             max(255, 8 * math.floor(attacker_stats["base_spd"] / 2)) / 256
-            if move_name in HIGH_CRIT_MOVES
+            if move_record.has_effect(MoveEffect.HIGH_CRIT)
             else math.floor(attacker_stats["spd"] / 2) / 256
         )
         weighted_damage = (normal_damage * (1 - crit_chance) + crit_damage * crit_chance) * 235 / 255
-        move_accuracy = float(move_data["accuracy"])
-        accuracy_rate = 1 if move_name in SWIFT_MOVES else move_accuracy * 255 / 25600
+        accuracy_rate = 1 if move_record.has_effect(MoveEffect.SWIFT) else move_record.accuracy * 255 / 25600
         long_term_average = weighted_damage * accuracy_rate
-        return self._apply_additional_modifiers(move_name, long_term_average, normal_damage)
+        return self._apply_additional_modifiers(move_record, long_term_average, normal_damage)
 
-    def _compute_base_stat(self, pokemon_data: PokemonData, stat: str, level: int, dv: int = 0) -> int:
-        base = pokemon_data[stat.lower()]
-        stat_value = math.floor((base + dv) * 2 * level / 100)
-        if stat == "hp":
-            stat_value += level + 10
-        else:
-            stat_value += 5
-        return stat_value
+    def _calculate_move_results_scalar(
+        self,
+        defender_stats: dict[str, str | int | list[str]],
+        effects: tuple[bool, bool],
+        attackers: list[tuple[Pokemon, int, int, int]],
+    ) -> list[tuple[float, str, str, int, int]]:
+        move_results = []
+        for pokemon, atk_stage, spe_stage, spd_stage in attackers:
+            attacker_stats = self._get_attacker_stats(pokemon, (atk_stage, spe_stage, spd_stage))
+            for move_name in pokemon.moves:
+                if not move_name:
+                    continue
+                move_damage = self._calculate_move_damage(
+                    pokemon,
+                    move_name,
+                    attacker_stats,
+                    defender_stats,
+                    effects,
+                )
+                if not move_damage:
+                    continue
+                long_term_avg, dmg_min, dmg_max = move_damage
+                move_results.append((long_term_avg, pokemon.nickname, move_name, dmg_min, dmg_max))
+        return move_results
 
-    def _compute_base_stat_with_dv(self, pokemon_data: PokemonData, stat: str, pokemon: Pokemon) -> int:
-        dv = pokemon.dvs[stat]
-        return self._compute_base_stat(pokemon_data, stat, pokemon.level, dv)
+    def _calculate_move_results_vectorized(
+        self,
+        defender_stats: dict[str, str | int | list[str]],
+        effects: tuple[bool, bool],
+        attackers: list[tuple[Pokemon, int, int, int]],
+    ) -> list[tuple[float, str, str, int, int]]:
+        target_damage = self._calculate_target_damage(defender_stats, effects, attackers)
+        if target_damage is None:
+            return []
+        damage, _, nicknames, move_names = target_damage
+        if damage.undefined.any():
+            err_msg = "division by zero"
+            raise ZeroDivisionError(err_msg)
+        return [
+            (long_term_avg, nickname, move_name, dmg_min, dmg_max)
+            for long_term_avg, nickname, move_name, dmg_min, dmg_max, valid in zip(
+                damage.long_term_average.tolist(),
+                nicknames,
+                move_names,
+                damage.damage_min.tolist(),
+                damage.damage_max.tolist(),
+                damage.valid.tolist(),
+                strict=True,
+            )
+            if valid
+        ]
 
-    def _compute_final_damage(
+    def _calculate_target_damage(
         self,
-        base: int,
-        power: int,
-        attack: int,
-        defense: int,
-        stab: float,
-        type1_multi: float,
-        type2_multi: float,
-    ) -> int:
-        damage = math.floor(math.floor(base * power * attack / defense) / 50) + 2
-        damage = math.floor(damage * stab)
-        damage = math.floor(damage * type1_multi)
-        damage = math.floor(damage * type2_multi)
-        return max(1, damage)
+        defender_stats: dict[str, str | int | list[str]],
+        effects: tuple[bool, bool],
+        attackers: list[tuple[Pokemon, int, int, int]],
+    ) -> tuple[DamageMatrix, MoveArrays, list[str], list[str]] | None:
+        types = self._pokemon_repository.get_species_table().types
+        attacker_rows, nicknames, move_names = self._get_attacker_rows(attackers, types)
+        if not move_names:
+            return None
+        move_records = {move_name: self._move_repository.get_record(move_name) for move_name in move_names}
+        move_arrays = build_move_arrays(move_names, move_records, types)
+        defender_type1, defender_type2 = self._get_type_ids(types, defender_stats["types"])
+        damage = calculate_damage_matrix(
+            AttackerArrays(*np.array(attacker_rows, dtype=np.int64).T),
+            move_arrays,
+            DefenderArrays(
+                np.int64(defender_stats["hp"]),
+                np.int64(defender_stats["def"]),
+                np.int64(defender_stats["spe"]),
+                np.int64(defender_stats["base_def"]),
+                np.int64(defender_stats["base_spe"]),
+                np.int64(defender_type1),
+                np.int64(defender_type2),
+            ),
+            effects,
+            self._type_repository.get_type_chart().effectiveness,
+        )
+        return damage, move_arrays, nicknames, move_names
 
-    def _get_attacker_stats(
+    def _calculate_threshold_ko_chance(
+        self,
+        pokemon: Pokemon,
+        move_name: str,
+        level: int,
+        attacker_stages: tuple[int, int, int],
+        defender: DefenderArrays,
+        effects: tuple[bool, bool],
+        turns: int,
+    ) -> float:
+        species_table = self._pokemon_repository.get_species_table()
+        attacker_row = build_attacker_row(species_table, pokemon.species, level, pokemon.dvs, attacker_stages)
+        move_arrays = build_move_arrays(
+            [move_name],
+            {move_name: self._move_repository.get_record(move_name)},
+            species_table.types,
+        )
+        damage = calculate_damage_matrix(
+            AttackerArrays(*np.array([attacker_row], dtype=np.int64).T),
+            move_arrays,
+            defender,
+            effects,
+            self._type_repository.get_type_chart().effectiveness,
+        )
+        distribution = calculate_roll_distribution(damage, move_arrays)
+        return float(calculate_ko_turn_probabilities(distribution, defender.hp, turns)[0, -1])
+
+    def _compute_attacker_stats(
         self,
         pokemon: Pokemon,
         stat_stages: tuple[int, int, int],
@@ -205,7 +366,20 @@ class BestMovesService:
             "types": pokemon_data["type"],
         }
 
-    def _get_defender_stats(
+    def _compute_base_stat(self, pokemon_data: PokemonData, stat: str, level: int, dv: int = 0) -> int:
+        base = pokemon_data[stat.lower()]
+        stat_value = math.floor((base + dv) * 2 * level / 100)
+        if stat == "hp":
+            stat_value += level + 10
+        else:
+            stat_value += 5
+        return stat_value
+
+    def _compute_base_stat_with_dv(self, pokemon_data: PokemonData, stat: str, pokemon: Pokemon) -> int:
+        dv = pokemon.dvs[stat]
+        return self._compute_base_stat(pokemon_data, stat, pokemon.level, dv)
+
+    def _compute_defender_stats(
         self,
         species: str,
         level: int,
@@ -229,33 +403,185 @@ class BestMovesService:
             "types": defending_pokemon["type"],
         }
 
+    def _compute_final_damage(
+        self,
+        base: int,
+        power: int,
+        attack: int,
+        defense: int,
+        stab: float,
+        type1_multi: float,
+        type2_multi: float,
+    ) -> int:
+        damage = math.floor(math.floor(base * power * attack / defense) / 50) + 2
+        damage = math.floor(damage * stab)
+        damage = math.floor(damage * type1_multi)
+        damage = math.floor(damage * type2_multi)
+        return max(1, damage)
+
+    def _get_attacker_rows(
+        self,
+        attackers: list[tuple[Pokemon, int, int, int]],
+        types: SymbolTable,
+    ) -> tuple[list[tuple[int, ...]], list[str], list[str]]:
+        attacker_rows = []
+        nicknames = []
+        move_names = []
+        for pokemon, atk_stage, spe_stage, spd_stage in attackers:
+            attacker_stats = self._get_attacker_stats(pokemon, (atk_stage, spe_stage, spd_stage))
+            type1, type2 = self._get_type_ids(types, attacker_stats["types"])
+            attacker_row = (
+                pokemon.level,
+                attacker_stats["atk"],
+                attacker_stats["spe"],
+                attacker_stats["spd"],
+                attacker_stats["base_atk"],
+                attacker_stats["base_spe"],
+                attacker_stats["base_spd"],
+                type1,
+                type2,
+            )
+            for move_name in pokemon.moves:
+                if not move_name:
+                    continue
+                attacker_rows.append(attacker_row)
+                nicknames.append(pokemon.nickname)
+                move_names.append(move_name)
+        return attacker_rows, nicknames, move_names
+
+    def _get_attacker_stats(
+        self,
+        pokemon: Pokemon,
+        stat_stages: tuple[int, int, int],
+    ) -> dict[str, int | list[str]]:
+        key = (
+            "attacker",
+            self._container.game_data_loader().active_generation,
+            pokemon.species,
+            pokemon.level,
+            tuple(sorted(pokemon.dvs.items())),
+            tuple(stat_stages),
+        )
+        return self._stat_cache.get_or_compute(
+            key,
+            lambda: self._compute_attacker_stats(pokemon, stat_stages),
+        )
+
+    def _get_defender_stats(
+        self,
+        species: str,
+        level: int,
+        stat_stages: tuple[int, int],
+    ) -> dict[str, str | int | list[str]]:
+        key = (
+            "defender",
+            self._container.game_data_loader().active_generation,
+            species,
+            level,
+            (),
+            tuple(stat_stages),
+        )
+        return self._stat_cache.get_or_compute(
+            key,
+            lambda: self._compute_defender_stats(species, level, stat_stages),
+        )
+
+    def _get_party_fingerprint(
+        self,
+        attackers: list[tuple[Pokemon, int, int, int]],
+        levels: range,
+        effects: tuple[bool, bool],
+    ) -> tuple:
+        party = tuple(
+            (
+                pokemon.nickname,
+                pokemon.species,
+                pokemon.level,
+                tuple(pokemon.moves),
+                tuple(sorted(pokemon.dvs.items())),
+                tuple(stat_stages),
+            )
+            for pokemon, *stat_stages in attackers
+        )
+        generation = self._container.game_data_loader().active_generation
+        return generation, party, (levels.start, levels.stop, levels.step), tuple(effects)
+
+    def _get_threshold(
+        self,
+        key: tuple,
+        values: list[int],
+        ko_chance: Callable[[int], float],
+        probability: float,
+    ) -> KoThreshold:
+        with self._threshold_lock:
+            if key in self._threshold_cache:
+                self._threshold_cache.move_to_end(key)
+                return self._threshold_cache[key]
+        threshold = self._search_threshold(values, ko_chance, probability)
+        with self._threshold_lock:
+            self._threshold_cache[key] = threshold
+            if len(self._threshold_cache) > KO_THRESHOLD_CACHE_LIMIT:
+                self._threshold_cache.popitem(last=False)
+        return threshold
+
+    def _get_threshold_defender(
+        self,
+        species: str,
+        level: int,
+        stat_stages: tuple[int, int],
+    ) -> DefenderArrays:
+        dvs = dict.fromkeys(("HP", "Def", "Spe"), POKEMON_DV_MIN)
+        return build_party_defender_arrays(
+            self._pokemon_repository.get_species_table(),
+            [(species, level, dvs, stat_stages)],
+        )
+
+    @staticmethod
+    def _get_type_ids(types: SymbolTable, pokemon_types: list[str]) -> tuple[int, int]:
+        type1 = types.id_of(pokemon_types[0])
+        type2 = types.id_of(pokemon_types[1]) if len(pokemon_types) > 1 else len(types)
+        return type1, type2
+
     def _handle_special_damage_moves(
         self,
-        move_name: str,
-        move_data: MoveData,
+        move_record: MoveRecord,
         party_member: Pokemon,
         defender_stats: dict[str, str | int | list[str]],
     ) -> tuple[float, int, int] | None:
-        if move_name in OHKO_MOVES:
-            move_accuracy = float(move_data["accuracy"])
-            accuracy_rate = move_accuracy * 255 / 25600
+        if move_record.has_effect(MoveEffect.OHKO):
+            accuracy_rate = move_record.accuracy * 255 / 25600
             return (defender_stats["hp"] * accuracy_rate, 0, defender_stats["hp"])
-        if move_name in STATIC_DAMAGE_MOVES:
-            if move_name == "Sonicboom":
-                static_val = damage_min = damage_max = 20
-            elif move_name == "Dragon Rage":
-                static_val = damage_min = damage_max = 40
-            elif move_name in {"Night Shade", "Seismic Toss"}:
-                static_val = damage_min = damage_max = party_member.level
-            elif move_name == "Psywave":
-                damage_min = 1
-                damage_max = math.floor(party_member.level * 1.5)
-                static_val = (damage_min + damage_max) / 2
-            move_accuracy = float(move_data["accuracy"])
-            accuracy_rate = move_accuracy * 255 / 25600
+        if move_record.has_effect(MoveEffect.STATIC_DAMAGE):
+            damage_min = move_record.static_min + math.floor(
+                party_member.level * move_record.static_min_level_multiplier,
+            )
+            damage_max = move_record.static_max + math.floor(
+                party_member.level * move_record.static_max_level_multiplier,
+            )
+            static_val = (damage_min + damage_max) / 2
+            accuracy_rate = move_record.accuracy * 255 / 25600
             return (static_val * accuracy_rate, damage_min, damage_max)
         return None
 
+    @staticmethod
+    def _search_threshold(
+        values: list[int],
+        ko_chance: Callable[[int], float],
+        probability: float,
+    ) -> KoThreshold:
+        chances = {}
+        low, high = 0, len(values)
+        while low < high:
+            middle = (low + high) // 2
+            chances[middle] = ko_chance(values[middle])
+            if chances[middle] + KO_PROBABILITY_TOLERANCE >= probability:
+                high = middle
+            else:
+                low = middle + 1
+        if low == len(values):
+            return KoThreshold(None, chances.get(low - 1, 0.0), len(chances))
+        return KoThreshold(values[low], chances[low], len(chances))
+
     def calculate_best_moves_for_target(
         self,
         species: str,
@@ -263,28 +589,246 @@ class BestMovesService:
         stat_stages: tuple[int, int],
         effects: tuple[bool, bool],
         attackers: list[tuple[Pokemon, int, int, int]],
+        engine: DamageEngineType | None = None,
     ) -> tuple[dict[str, str | int | list[str]], list[tuple[float, str, str, int, int]]]:
         if not species:
             return {}, []
         defender_stats = self._get_defender_stats(species, level, stat_stages)
         if not defender_stats:
             return {}, []
-        move_results = []
-        for pokemon, atk_stage, spe_stage, spd_stage in attackers:
-            attacker_stats = self._get_attacker_stats(pokemon, (atk_stage, spe_stage, spd_stage))
-            for move_name in pokemon.moves:
-                if not move_name:
-                    continue
-                move_damage = self._calculate_move_damage(
-                    pokemon,
-                    move_name,
-                    attacker_stats,
-                    defender_stats,
-                    effects,
-                )
-                if not move_damage:
-                    continue
-                long_term_avg, dmg_min, dmg_max = move_damage
-                move_results.append((long_term_avg, pokemon.nickname, move_name, dmg_min, dmg_max))
+        if (engine or self._engine) == DamageEngineType.VECTORIZED:
+            move_results = self._calculate_move_results_vectorized(defender_stats, effects, attackers)
+        else:
+            move_results = self._calculate_move_results_scalar(defender_stats, effects, attackers)
         move_results.sort(key=lambda x: x[0], reverse=True)
         return defender_stats, move_results
+
+    def calculate_damage_grid(
+        self,
+        pokemon: Pokemon,
+        move_name: str,
+        attacker_stages: tuple[int, int, int],
+        species: str,
+        levels: range = range(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX + 1),
+    ) -> DamageGrid:
+        species_table = self._pokemon_repository.get_species_table()
+        attacker_row = build_attacker_row(
+            species_table,
+            pokemon.species,
+            pokemon.level,
+            pokemon.dvs,
+            attacker_stages,
+        )
+        move_records = {move_name: self._move_repository.get_record(move_name)}
+        return calculate_damage_grid(
+            AttackerArrays(*np.array(attacker_row, dtype=np.int64)),
+            build_move_arrays([move_name], move_records, species_table.types),
+            species_table,
+            species,
+            np.array(levels, dtype=np.int64),
+            np.array(sorted(STAT_STAGE_MULTIPLIER), dtype=np.int64),
+            self._type_repository.get_type_chart().effectiveness,
+        )
+
+    def calculate_ko_chances_for_target(
+        self,
+        species: str,
+        level: int,
+        stat_stages: tuple[int, int],
+        effects: tuple[bool, bool],
+        attackers: list[tuple[Pokemon, int, int, int]],
+    ) -> tuple[dict[str, str | int | list[str]], list[tuple[float, str, str]]]:
+        if not species:
+            return {}, []
+        defender_stats = self._get_defender_stats(species, level, stat_stages)
+        target_damage = self._calculate_target_damage(defender_stats, effects, attackers)
+        if target_damage is None:
+            return defender_stats, []
+        damage, move_arrays, nicknames, move_names = target_damage
+        distribution = calculate_roll_distribution(damage, move_arrays)
+        ko_probabilities = calculate_ko_probability(distribution, defender_stats["hp"])
+        ko_results = [
+            (ko_probability, nickname, move_name)
+            for ko_probability, nickname, move_name, valid in zip(
+                ko_probabilities.tolist(),
+                nicknames,
+                move_names,
+                damage.valid.tolist(),
+                strict=True,
+            )
+            if valid
+        ]
+        ko_results.sort(key=lambda x: x[0], reverse=True)
+        return defender_stats, ko_results
+
+    def calculate_matchup_matrix(
+        self,
+        attackers: list[tuple[Pokemon, int, int, int]],
+        levels: range = range(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX + 1),
+        effects: tuple[bool, bool] = (False, False),
+        progress: Callable[[int, int], None] | None = None,
+    ) -> MatchupMatrix:
+        fingerprint = self._get_party_fingerprint(attackers, levels, effects)
+        with self._matchup_lock:
+            if fingerprint in self._matchup_cache:
+                self._matchup_cache.move_to_end(fingerprint)
+                return self._matchup_cache[fingerprint]
+        matchup_matrix = self._calculate_matchup_matrix(attackers, levels, effects, progress)
+        with self._matchup_lock:
+            self._matchup_cache[fingerprint] = matchup_matrix
+            if len(self._matchup_cache) > MATCHUP_CACHE_LIMIT:
+                self._matchup_cache.popitem(last=False)
+        return matchup_matrix
+
+    def calculate_threat_matrix(
+        self,
+        species: str,
+        level: int,
+        stat_stages: tuple[int, int, int],
+        effects: tuple[bool, bool],
+        defenders: list[tuple[Pokemon, int, int]],
+    ) -> ThreatMatrix:
+        species_table = self._pokemon_repository.get_species_table()
+        move_records = self._container.game_data_loader().move_records
+        learnset = self._pokemon_repository.get_by_id(species)["moves"] if species else []
+        move_names = tuple(move_name for move_name in learnset if move_name in move_records)
+        nicknames = tuple(pokemon.nickname for pokemon, _, _ in defenders)
+        shape = (len(move_names), len(nicknames))
+        if not move_names or not nicknames:
+            return ThreatMatrix(
+                species,
+                level,
+                move_names,
+                nicknames,
+                np.zeros(shape, dtype=np.float64),
+                np.zeros(shape, dtype=np.int64),
+                np.zeros(shape, dtype=np.int64),
+                np.zeros(shape, dtype=np.float64),
+                np.zeros(shape, dtype=bool),
+            )
+        dvs = dict.fromkeys(("Atk", "Spe", "Spd"), POKEMON_DV_MIN)
+        attacker_row = build_attacker_row(species_table, species, level, dvs, stat_stages)
+        defender_arrays = build_party_defender_arrays(
+            species_table,
+            [
+                (pokemon.species, pokemon.level, pokemon.dvs, (def_stage, spe_stage))
+                for pokemon, def_stage, spe_stage in defenders
+            ],
+        )
+        damage, ko_probability = calculate_threat_matrix(
+            AttackerArrays(*np.array([attacker_row] * len(move_names), dtype=np.int64).T),
+            build_move_arrays(list(move_names), move_records, species_table.types),
+            defender_arrays,
+            effects,
+            self._type_repository.get_type_chart().effectiveness,
+        )
+        return ThreatMatrix(
+            species,
+            level,
+            move_names,
+            nicknames,
+            damage.long_term_average,
+            damage.damage_min,
+            damage.damage_max,
+            ko_probability,
+            damage.valid,
+        )
+
+    def calculate_turns_to_ko_for_target(
+        self,
+        species: str,
+        level: int,
+        stat_stages: tuple[int, int],
+        effects: tuple[bool, bool],
+        attackers: list[tuple[Pokemon, int, int, int]],
+        max_turns: int = KO_TURN_LIMIT,
+    ) -> tuple[dict[str, str | int | list[str]], list[tuple[tuple[float, ...], str, str]]]:
+        if not species:
+            return {}, []
+        defender_stats = self._get_defender_stats(species, level, stat_stages)
+        target_damage = self._calculate_target_damage(defender_stats, effects, attackers)
+        if target_damage is None:
+            return defender_stats, []
+        damage, move_arrays, nicknames, move_names = target_damage
+        distribution = calculate_roll_distribution(damage, move_arrays)
+        turn_probabilities = calculate_ko_turn_probabilities(distribution, defender_stats["hp"], max_turns)
+        turn_results = [
+            (tuple(probabilities), nickname, move_name)
+            for probabilities, nickname, move_name, valid in zip(
+                turn_probabilities.tolist(),
+                nicknames,
+                move_names,
+                damage.valid.tolist(),
+                strict=True,
+            )
+            if valid
+        ]
+        turn_results.sort(key=lambda x: x[0], reverse=True)
+        return defender_stats, turn_results
+
+    def solve_min_attack_stage(
+        self,
+        pokemon: Pokemon,
+        move_name: str,
+        attacker_stages: tuple[int, int, int],
+        species: str,
+        level: int,
+        probability: float,
+        turns: int = 1,
+        stat_stages: tuple[int, int] = (0, 0),
+        effects: tuple[bool, bool] = (False, False),
+    ) -> KoThreshold:
+        stage_index = 1 if self._move_repository.get_record(move_name).is_special else 0
+        defender = self._get_threshold_defender(species, level, stat_stages)
+
+        def ko_chance(stage: int) -> float:
+            stages = list(attacker_stages)
+            stages[stage_index] = stage
+            return self._calculate_threshold_ko_chance(
+                pokemon,
+                move_name,
+                pokemon.level,
+                tuple(stages),
+                defender,
+                effects,
+                turns,
+            )
+
+        fingerprint = self._get_party_fingerprint(
+            [(pokemon, *attacker_stages)],
+            range(pokemon.level, pokemon.level + 1),
+            effects,
+        )
+        key = (fingerprint, "stage", move_name, species, level, tuple(stat_stages), probability, turns)
+        stages = sorted(STAT_STAGE_MULTIPLIER)
+        return self._get_threshold(key, stages, ko_chance, probability)
+
+    def solve_min_level(
+        self,
+        pokemon: Pokemon,
+        move_name: str,
+        attacker_stages: tuple[int, int, int],
+        species: str,
+        level: int,
+        probability: float,
+        turns: int = 1,
+        stat_stages: tuple[int, int] = (0, 0),
+        effects: tuple[bool, bool] = (False, False),
+    ) -> KoThreshold:
+        defender = self._get_threshold_defender(species, level, stat_stages)
+
+        def ko_chance(attacker_level: int) -> float:
+            return self._calculate_threshold_ko_chance(
+                pokemon,
+                move_name,
+                attacker_level,
+                attacker_stages,
+                defender,
+                effects,
+                turns,
+            )
+
+        levels = range(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX + 1)
+        fingerprint = self._get_party_fingerprint([(pokemon, *attacker_stages)], levels, effects)
+        key = (fingerprint, "level", move_name, species, level, tuple(stat_stages), probability, turns)
+        return self._get_threshold(key, list(levels), ko_chance, probability)
@@ -4,7 +4,7 @@ from nuzlocke_tool.config import PathConfig
 from nuzlocke_tool.container import Container
 from nuzlocke_tool.models.models import EventType, GameState
 from nuzlocke_tool.rules import RuleStrategyFactory
-from nuzlocke_tool.utils import load_yaml_file
+from nuzlocke_tool.yaml_loader import load_yaml_file
 
 
 class GameService:
@@ -28,9 +28,9 @@ class GameService:
         return journal_file
 
     def new_game(self, game: str, ruleset: str, generation: str, sub_region_clause: bool) -> None:
+        self._save_service.flush()
         game_data_loader = self._container.game_data_loader()
-        game_data_loader.load_pokemon_data(generation)
-        game_data_loader.load_move_data(generation)
+        game_data_loader.load_generation(generation)
         journal_file = self._create_journal_file(game, ruleset)
         save_file = self._save_service.create_save_file(game, ruleset)
         game_state = self._container.game_state()
@@ -43,15 +43,19 @@ class GameService:
         game_state.encounters = []
         game_state.failed_encounters = []
         game_state.decisions = {}
+        self._container.location_repository().track_encounters(game, sub_region_clause, [])
         rule_strategy = RuleStrategyFactory.create_strategy(ruleset)
         game_state.rule_strategy = rule_strategy
         journal_service = self._container.journal_service_factory(game_state)
         journal_service.add_new_session_entry(game, ruleset)
         if sub_region_clause:
             journal_service.add_clause_entry("Sub-Region")
+        self._save_service.save_session(game_state)
         self._container.event_manager().publish(EventType.SESSION_CREATED)
 
     def load_game(self, save_path: Path) -> None:
+        self._save_service.flush()
+        self._save_service.wait_for_writes()
         loaded_state = self._save_service.load_session(save_path)
         game_state = self._container.game_state()
         game_state.game = loaded_state.game
@@ -63,15 +67,20 @@ class GameService:
         game_state.encounters = loaded_state.encounters
         game_state.failed_encounters = loaded_state.failed_encounters
         game_state.decisions = loaded_state.decisions
+        self._container.location_repository().track_encounters(
+            game_state.game,
+            game_state.sub_region_clause,
+            game_state.encounters,
+        )
         versions = load_yaml_file(PathConfig.versions_file())
         version_info = versions[game_state.game]
         generation = version_info["generation"]
         game_data_loader = self._container.game_data_loader()
-        game_data_loader.load_pokemon_data(generation)
-        game_data_loader.load_move_data(generation)
+        game_data_loader.load_generation(generation)
         rule_strategy = RuleStrategyFactory.create_strategy(game_state.ruleset)
         game_state.rule_strategy = rule_strategy
         self._container.event_manager().publish(EventType.SESSION_LOADED)
 
     def save_game(self, game_state: GameState) -> None:
-        self._save_service.save_session(game_state)
+        if not self._save_service.flush():
+            self._save_service.save_session(game_state)
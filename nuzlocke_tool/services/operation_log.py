@@ -0,0 +1,135 @@
+import json
+import logging
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Self
+
+from nuzlocke_tool.models.models import FailedEncounter, GameState, Pokemon, PokemonStatus, SaveOperationType
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _get_pokemon_index(game_state: GameState, pokemon: Pokemon) -> int:
+    for i, party_member in enumerate(game_state.pokemon):
+        if party_member is pokemon:
+            return i
+    err_msg = f"Pokemon {pokemon.nickname} is not part of the session"
+    raise ValueError(err_msg)
+
+
+def get_log_path(save_file: Path) -> Path:
+    return save_file.with_name(f"{save_file.name}.oplog")
+
+
+def pokemon_from_dict(pokemon_dict: dict) -> Pokemon:
+    pokemon_dict = dict(pokemon_dict)
+    status_str = pokemon_dict.pop("status")
+    pokemon_dict["species"] = sys.intern(pokemon_dict["species"])
+    pokemon_dict["moves"] = [sys.intern(move) for move in pokemon_dict["moves"]]
+    pokemon_dict["encountered"] = sys.intern(pokemon_dict["encountered"])
+    return Pokemon(**pokemon_dict, status=PokemonStatus[status_str])
+
+
+def pokemon_to_dict(pokemon: Pokemon) -> dict:
+    pokemon_dict = {k: v for k, v in asdict(pokemon).items() if k != "status"}
+    pokemon_dict["status"] = pokemon.status.name
+    return pokemon_dict
+
+
+def read_log_entries(log_file: Path, after: int = 0) -> list[tuple[int, "SaveOperation"]]:
+    if not log_file.exists():
+        return []
+    entries = []
+    with log_file.open("r") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                sequence, operation = SaveOperation.from_entry(json.loads(line))
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                LOGGER.warning("Skipped unreadable entry in %s at line %s: %s", log_file, line_number, e)
+                continue
+            if sequence > after:
+                entries.append((sequence, operation))
+    return entries
+
+
+@dataclass(frozen=True)
+class SaveOperation:
+    kind: SaveOperationType
+    payload: dict
+
+    @classmethod
+    def add_failed_encounter(cls, failed_encounter: FailedEncounter) -> Self:
+        return cls(SaveOperationType.ADD_FAILED_ENCOUNTER, {"failed_encounter": asdict(failed_encounter)})
+
+    @classmethod
+    def add_pokemon(cls, pokemon: Pokemon) -> Self:
+        return cls(SaveOperationType.ADD_POKEMON, {"pokemon": pokemon_to_dict(pokemon)})
+
+    @classmethod
+    def from_entry(cls, entry: dict) -> tuple[int, Self]:
+        payload = dict(entry)
+        sequence = int(payload.pop("seq"))
+        return sequence, cls(SaveOperationType[payload.pop("op")], payload)
+
+    @classmethod
+    def learn_move(cls, game_state: GameState, pokemon: Pokemon, slot: int) -> Self:
+        return cls(
+            SaveOperationType.LEARN_MOVE,
+            {"index": _get_pokemon_index(game_state, pokemon), "slot": slot, "move": pokemon.moves[slot]},
+        )
+
+    @classmethod
+    def make_decision(cls, key: str, outcome: str) -> Self:
+        return cls(SaveOperationType.MAKE_DECISION, {"key": key, "outcome": outcome})
+
+    @classmethod
+    def remove_pokemon(cls, game_state: GameState, pokemon: Pokemon) -> Self:
+        return cls(SaveOperationType.REMOVE_POKEMON, {"index": _get_pokemon_index(game_state, pokemon)})
+
+    @classmethod
+    def transfer_pokemon(cls, game_state: GameState, pokemon: Pokemon) -> Self:
+        return cls(
+            SaveOperationType.TRANSFER_POKEMON,
+            {"index": _get_pokemon_index(game_state, pokemon), "status": pokemon.status.name},
+        )
+
+    @classmethod
+    def update_pokemon(cls, game_state: GameState, pokemon: Pokemon) -> Self:
+        return cls(
+            SaveOperationType.UPDATE_POKEMON,
+            {"index": _get_pokemon_index(game_state, pokemon), "pokemon": pokemon_to_dict(pokemon)},
+        )
+
+    def apply(self, game_state: GameState) -> None:
+        payload = self.payload
+        match self.kind:
+            case SaveOperationType.ADD_FAILED_ENCOUNTER:
+                game_state.failed_encounters.append(FailedEncounter(**payload["failed_encounter"]))
+            case SaveOperationType.ADD_POKEMON:
+                pokemon = pokemon_from_dict(payload["pokemon"])
+                game_state.pokemon.append(pokemon)
+                game_state.encounters.append(pokemon.encountered)
+            case SaveOperationType.LEARN_MOVE:
+                game_state.pokemon[payload["index"]].moves[payload["slot"]] = sys.intern(payload["move"])
+            case SaveOperationType.MAKE_DECISION:
+                game_state.decisions[payload["key"]] = payload["outcome"]
+            case SaveOperationType.REMOVE_POKEMON:
+                pokemon = game_state.pokemon.pop(payload["index"])
+                if not any(p.encountered == pokemon.encountered for p in game_state.pokemon):
+                    game_state.encounters.remove(pokemon.encountered)
+            case SaveOperationType.TRANSFER_POKEMON:
+                game_state.pokemon[payload["index"]].status = PokemonStatus[payload["status"]]
+            case SaveOperationType.UPDATE_POKEMON:
+                game_state.pokemon[payload["index"]] = pokemon_from_dict(payload["pokemon"])
+
+    def supersedes(self, other: Self) -> bool:
+        return (
+            self.kind == other.kind == SaveOperationType.UPDATE_POKEMON
+            and self.payload["index"] == other.payload["index"]
+        )
+
+    def to_entry(self, sequence: int) -> str:
+        return json.dumps({"seq": sequence, "op": self.kind.name, **self.payload}, separators=(",", ":"))
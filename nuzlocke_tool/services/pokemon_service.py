@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from nuzlocke_tool.constants import ACTIVE_PARTY_LIMIT, TAB_BOXED_NAME, TAB_DEAD_NAME, TAB_PARTY_NAME
 from nuzlocke_tool.models.models import EventType, GameState, Pokemon, PokemonStatus
+from nuzlocke_tool.services.operation_log import SaveOperation
 
 if TYPE_CHECKING:
     from nuzlocke_tool.container import Container
@@ -17,6 +18,7 @@ class PokemonService:
         self._event_manager = self._container.event_manager()
         self._game_state = game_state
         self._journal_service = self._container.journal_service_factory(self._game_state)
+        self._location_repository = self._container.location_repository()
         self._pokemon_repository = self._container.pokemon_repository()
         self._save_service = self._container.save_service()
 
@@ -53,14 +55,15 @@ class PokemonService:
                 return False
         self._game_state.pokemon.append(pokemon)
         self._game_state.encounters.append(pokemon.encountered)
-        self._save_service.save_session(self._game_state)
+        self._location_repository.add_encounter(pokemon.encountered)
+        self._save_service.record(self._game_state, SaveOperation.add_pokemon(pokemon))
         self._journal_service.add_capture_entry(pokemon)
         self._event_manager.publish(EventType.POKEMON_ADDED, {"pokemon": pokemon})
         return True
 
     def edit_pokemon(self, pokemon: Pokemon, current_species: str) -> bool:
         pokemon_data = self._pokemon_repository.get_by_id(current_species)
-        self._save_service.save_session(self._game_state)
+        self._save_service.record(self._game_state, SaveOperation.update_pokemon(self._game_state, pokemon))
         if "evolve" in pokemon_data and pokemon.species in pokemon_data["evolve"]:
             self._journal_service.add_evolved_entry(pokemon, current_species)
         self._event_manager.publish(EventType.POKEMON_EDITED, {"pokemon": pokemon})
@@ -69,7 +72,9 @@ class PokemonService:
     def learn_move(self, pokemon: Pokemon, index: int, new_move: str) -> bool:
         old_move = pokemon.moves[index] if index < len(pokemon.moves) else ""
         pokemon.moves[index] = new_move
-        self._save_service.save_session(self._game_state)
+        self._save_service.record(
+            self._game_state, SaveOperation.learn_move(self._game_state, pokemon, index)
+        )
         if old_move == "":
             self._journal_service.add_learn_move_entry(pokemon.nickname, new_move)
             LOGGER.info("Pokemon %s learned move: %s", pokemon.nickname, new_move)
@@ -83,10 +88,12 @@ class PokemonService:
         return True
 
     def remove_pokemon(self, pokemon: Pokemon) -> bool:
+        operation = SaveOperation.remove_pokemon(self._game_state, pokemon)
         self._game_state.pokemon.remove(pokemon)
         if not any(p.encountered == pokemon.encountered for p in self._game_state.pokemon):
             self._game_state.encounters.remove(pokemon.encountered)
-        self._save_service.save_session(self._game_state)
+            self._location_repository.remove_encounter(pokemon.encountered)
+        self._save_service.record(self._game_state, operation)
         self._event_manager.publish(EventType.POKEMON_REMOVED, {"pokemon": pokemon})
         return True
 
@@ -103,7 +110,7 @@ class PokemonService:
                 return False
         original_status = pokemon.status
         pokemon.status = target_status
-        self._save_service.save_session(self._game_state)
+        self._save_service.record(self._game_state, SaveOperation.transfer_pokemon(self._game_state, pokemon))
         if target_status == PokemonStatus.DEAD:
             self._journal_service.add_dead_entry(pokemon)
         else:
@@ -2,6 +2,7 @@ import random
 
 from nuzlocke_tool.container import Container
 from nuzlocke_tool.models.models import EventType, GameState
+from nuzlocke_tool.services.operation_log import SaveOperation
 
 
 class RandomDecisionService:
@@ -15,7 +16,7 @@ class RandomDecisionService:
     def make_decision(self, decision_key: str, decision_options: list[str], display_name: str) -> str:
         outcome = random.choice(decision_options)
         self._game_state.decisions[decision_key] = outcome
-        self._save_service.save_session(self._game_state)
+        self._save_service.record(self._game_state, SaveOperation.make_decision(decision_key, outcome))
         self._journal_service.add_decision_entry(display_name, outcome)
         self._event_manager.publish(
             EventType.DECISION_MADE,
@@ -1,20 +1,85 @@
 import logging
+import sys
+import threading
+from collections.abc import Callable
 from dataclasses import asdict
 from pathlib import Path
 
-import yaml
-
 from nuzlocke_tool.config import PathConfig
-from nuzlocke_tool.models.models import FailedEncounter, GameState, Pokemon, PokemonStatus
+from nuzlocke_tool.constants import SAVE_BACKUP_COUNT, SAVE_LOG_COMPACT_LIMIT
+from nuzlocke_tool.models.models import FailedEncounter, GameState, SaveBackend, SaveFormat
+from nuzlocke_tool.save_codec import decode_save, detect_save_format
+from nuzlocke_tool.services.operation_log import (
+    SaveOperation,
+    get_log_path,
+    pokemon_from_dict,
+    read_log_entries,
+)
+from nuzlocke_tool.services.save_writer import SaveWriter, SaveWriterStats
 
 LOGGER = logging.getLogger(__name__)
 
 
 class SaveService:
+    def __init__(
+        self,
+        backup_count: int = SAVE_BACKUP_COUNT,
+        compact_limit: int = SAVE_LOG_COMPACT_LIMIT,
+        save_format: SaveFormat = SaveFormat.YAML,
+        writer: SaveWriter | None = None,
+    ) -> None:
+        self._compact_limit = compact_limit
+        self._deferred: tuple[GameState, SaveOperation] | None = None
+        self._lock = threading.Lock()
+        self._log_entries = 0
+        self._log_sequence = 0
+        self._log_state: GameState | None = None
+        self._pending_state: GameState | None = None
+        self._save_format = save_format
+        self._scheduler: Callable[[], None] | None = None
+        self._writer = SaveWriter(backup_count) if writer is None else writer
+
     def _append_entry(self, entry: str) -> None:
         with self._journal_file.open("a") as f:
             f.write(f"{entry}\n")
 
+    def _record_deferred(self) -> None:
+        with self._lock:
+            deferred = self._deferred
+            self._deferred = None
+        if deferred is not None:
+            self._record_operation(*deferred)
+
+    def _record_operation(self, game_state: GameState, operation: SaveOperation) -> None:
+        with self._lock:
+            self._log_sequence += 1
+            self._log_entries += 1
+            self._log_state = game_state
+            self._writer.append(get_log_path(game_state.save_file), operation.to_entry(self._log_sequence))
+            compact = self._log_entries >= self._compact_limit
+        if compact:
+            self.request_save(game_state)
+
+    @property
+    def backend(self) -> SaveBackend:
+        return SaveBackend.FILE
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._pending_state is not None or self._deferred is not None
+
+    @property
+    def log_entries(self) -> int:
+        return self._log_entries
+
+    @property
+    def save_format(self) -> SaveFormat:
+        return self._save_format
+
+    @property
+    def writer_stats(self) -> SaveWriterStats:
+        return self._writer.stats
+
     @staticmethod
     def create_save_file(game: str, ruleset: str) -> Path:
         folder = PathConfig.save_folder()
@@ -29,23 +94,97 @@ class SaveService:
         LOGGER.info("Created new save file: %s", save_file)
         return save_file
 
-    @staticmethod
-    def load_session(filepath: Path) -> GameState:
-        with filepath.open("r") as f:
-            data = yaml.safe_load(f)
+    def convert_session(self, filepath: Path, save_format: SaveFormat, target: Path | None = None) -> Path:
+        game_state = self.load_session(filepath)
+        game_state.save_file = filepath if target is None else target
+        failures = self._writer.stats.failures
+        self.set_save_format(save_format)
+        self.save_session(game_state)
+        self.wait_for_writes()
+        if self._writer.stats.failures > failures:
+            err_msg = f"Unable to convert {filepath}: {self._writer.stats.last_error}"
+            raise OSError(err_msg)
+        return game_state.save_file
+
+    def defer(self, game_state: GameState, operation: SaveOperation) -> None:
+        with self._lock:
+            previous = self._deferred
+            self._deferred = None
+            scheduler = self._scheduler
+        if previous is not None and not (previous[0] is game_state and operation.supersedes(previous[1])):
+            self._record_operation(*previous)
+        with self._lock:
+            self._deferred = (game_state, operation)
+        if scheduler is None:
+            self._record_deferred()
+            return
+        scheduler()
+
+    def flush(self, *, compact: bool = True) -> bool:
+        self._record_deferred()
+        with self._lock:
+            game_state = self._pending_state
+            if game_state is None and compact and self._log_entries:
+                game_state = self._log_state
+            self._pending_state = None
+        if game_state is None:
+            return False
+        self.save_session(game_state)
+        return True
+
+    def list_sessions(self) -> list[Path]:
+        return sorted(PathConfig.save_folder().glob("*.sav"))
+
+    def load_session(self, filepath: Path) -> GameState:
+        payload = filepath.read_bytes()
+        data = decode_save(payload)
+        log_sequence = data.pop("log_sequence", 0)
         data["journal_file"] = Path(data["journal_file"])
         data["save_file"] = Path(data["save_file"])
-        pokemon_list = []
-        for pokemon_dict in data["pokemon"]:
-            status_str = pokemon_dict.pop("status")
-            pokemon = Pokemon(**pokemon_dict, status=PokemonStatus[status_str])
-            pokemon_list.append(pokemon)
-        data["pokemon"] = pokemon_list
+        data["pokemon"] = [pokemon_from_dict(pokemon_dict) for pokemon_dict in data["pokemon"]]
+        data["encounters"] = [sys.intern(location) for location in data["encounters"]]
         data["failed_encounters"] = [
             FailedEncounter(**failed_dict) for failed_dict in data["failed_encounters"]
         ]
-        LOGGER.info("Game loaded from %s", filepath)
-        return GameState(**data)
+        game_state = GameState(**data)
+        replayed = 0
+        for sequence, operation in read_log_entries(get_log_path(filepath), log_sequence):
+            try:
+                operation.apply(game_state)
+            except (IndexError, KeyError, TypeError, ValueError) as e:
+                LOGGER.warning("Stopped replaying %s at entry %s: %s", filepath, sequence, e)
+                break
+            log_sequence = sequence
+            replayed += 1
+        save_format = detect_save_format(payload)
+        with self._lock:
+            self._log_entries = replayed
+            self._log_sequence = log_sequence
+            self._log_state = game_state if replayed else None
+            self._save_format = save_format
+        LOGGER.info(
+            "Game loaded from %s (%s) with %s logged operations",
+            filepath,
+            save_format.name,
+            replayed,
+        )
+        return game_state
+
+    def record(self, game_state: GameState, operation: SaveOperation) -> None:
+        self._record_deferred()
+        self._record_operation(game_state, operation)
+
+    def request_save(self, game_state: GameState) -> None:
+        with self._lock:
+            previous_state = self._pending_state
+            self._pending_state = game_state
+            scheduler = self._scheduler
+        if previous_state is not None and previous_state is not game_state:
+            self.save_session(previous_state)
+        if scheduler is None:
+            self.flush()
+            return
+        scheduler()
 
     def save_session(self, game_state: GameState) -> None:
         game_state_dict = asdict(game_state)
@@ -58,6 +197,23 @@ class SaveService:
             pokemon_dict["status"] = pokemon["status"].name
             pokemon_list.append(pokemon_dict)
         game_state_dict["pokemon"] = pokemon_list
-        with game_state.save_file.open("w") as f:
-            yaml.dump(game_state_dict, f)
-        LOGGER.info("Game saved to %s", game_state.save_file)
+        with self._lock:
+            game_state_dict["log_sequence"] = self._log_sequence
+            self._log_entries = 0
+            self._writer.submit(
+                game_state.save_file,
+                game_state_dict,
+                get_log_path(game_state.save_file),
+                self._save_format,
+            )
+
+    def set_save_format(self, save_format: SaveFormat) -> None:
+        with self._lock:
+            self._save_format = save_format
+
+    def set_scheduler(self, scheduler: Callable[[], None] | None) -> None:
+        with self._lock:
+            self._scheduler = scheduler
+
+    def wait_for_writes(self, timeout: float | None = None) -> bool:
+        return self._writer.wait(timeout)
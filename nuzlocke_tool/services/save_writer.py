@@ -0,0 +1,180 @@
+import logging
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import yaml
+
+from nuzlocke_tool.constants import SAVE_BACKUP_COUNT
+from nuzlocke_tool.models.models import SaveFormat
+from nuzlocke_tool.save_codec import encode_save
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SaveJob:
+    path: Path
+    snapshot: dict | None = None
+    entry: str | None = None
+    log_path: Path | None = None
+    save_format: SaveFormat = SaveFormat.YAML
+
+
+@dataclass(frozen=True)
+class SaveWriterStats:
+    writes: int = 0
+    appends: int = 0
+    failures: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+    last_error: str | None = None
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.writes if self.writes else 0.0
+
+
+class SaveWriter:
+    _write_errors: tuple[type[Exception], ...] = (OSError, ValueError, struct.error, yaml.YAMLError)
+
+    def __init__(self, backup_count: int = SAVE_BACKUP_COUNT) -> None:
+        self._backup_count = backup_count
+        self._condition = threading.Condition()
+        self._pending: deque[SaveJob] = deque()
+        self._stats = SaveWriterStats()
+        self._thread: threading.Thread | None = None
+        self._writing = False
+
+    @staticmethod
+    def _append_entry(path: Path, entry: str) -> None:
+        with path.open("a+b") as f:
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(f"{entry}\n".encode())
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _backup_path(path: Path, index: int) -> Path:
+        return path.with_name(f"{path.name}.{index}")
+
+    def _enqueue(self, job: SaveJob) -> None:
+        with self._condition:
+            if job.snapshot is not None:
+                self._pending = deque(
+                    pending
+                    for pending in self._pending
+                    if pending.snapshot is None or pending.path != job.path
+                )
+            self._pending.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _record(self, job: SaveJob, latency: float, error: str | None) -> None:
+        if error is not None:
+            self._stats = replace(self._stats, failures=self._stats.failures + 1, last_error=error)
+        elif job.snapshot is None:
+            self._stats = replace(self._stats, appends=self._stats.appends + 1)
+        else:
+            self._stats = replace(
+                self._stats,
+                writes=self._stats.writes + 1,
+                last_latency=latency,
+                max_latency=max(self._stats.max_latency, latency),
+                total_latency=self._stats.total_latency + latency,
+            )
+
+    def _rotate_backups(self, path: Path) -> None:
+        if self._backup_count <= 0 or not path.exists() or path.stat().st_size == 0:
+            return
+        for i in range(self._backup_count - 1, 0, -1):
+            older = self._backup_path(path, i)
+            if older.exists():
+                older.replace(self._backup_path(path, i + 1))
+        shutil.copy2(path, self._backup_path(path, 1))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: bool(self._pending))
+                job = self._pending.popleft()
+                self._writing = True
+            start = time.perf_counter()
+            error = None
+            try:
+                self._run_job(job)
+            except self._write_errors as e:
+                LOGGER.exception("Failed to write %s", job.path)
+                error = f"{type(e).__name__}: {e}"
+            with self._condition:
+                self._record(job, time.perf_counter() - start, error)
+                self._writing = False
+                self._condition.notify_all()
+
+    def _run_job(self, job: SaveJob) -> None:
+        if job.snapshot is None:
+            self._append_entry(job.path, job.entry)
+            return
+        self._write_atomic(job.path, encode_save(job.snapshot, job.save_format))
+        LOGGER.info("Game saved to %s", job.path)
+        if job.log_path is not None and job.log_path.exists():
+            with job.log_path.open("w") as f:
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _sync_directory(folder: Path) -> None:
+        if os.name != "posix":
+            return
+        fd = os.open(folder, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _write_atomic(self, path: Path, payload: bytes) -> None:
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            self._rotate_backups(path)
+            temp_path.replace(path)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+        self._sync_directory(path.parent)
+
+    @property
+    def stats(self) -> SaveWriterStats:
+        with self._condition:
+            return self._stats
+
+    def append(self, path: Path, entry: str) -> None:
+        self._enqueue(SaveJob(path, entry=entry))
+
+    def submit(
+        self,
+        path: Path,
+        snapshot: dict,
+        log_path: Path | None = None,
+        save_format: SaveFormat = SaveFormat.YAML,
+    ) -> None:
+        self._enqueue(SaveJob(path, snapshot=snapshot, log_path=log_path, save_format=save_format))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout)
@@ -0,0 +1,399 @@
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+from nuzlocke_tool.config import PathConfig
+from nuzlocke_tool.models.models import (
+    FailedEncounter,
+    GameState,
+    Pokemon,
+    PokemonStatus,
+    SaveBackend,
+    SaveFormat,
+    SaveOperationType,
+)
+from nuzlocke_tool.services.operation_log import SaveOperation, pokemon_from_dict, pokemon_to_dict
+from nuzlocke_tool.services.save_service import SaveService
+from nuzlocke_tool.services.save_writer import SaveJob, SaveWriter
+
+LOGGER = logging.getLogger(__name__)
+CLEAR_RUN = (
+    "DELETE FROM pokemon WHERE run_id = ?",
+    "DELETE FROM encounters WHERE run_id = ?",
+    "DELETE FROM failed_encounters WHERE run_id = ?",
+    "DELETE FROM decisions WHERE run_id = ?",
+)
+INSERT_POKEMON = (
+    "INSERT INTO pokemon (run_id, position, nickname, species, level, caught_level, moves, dvs, encountered, "
+    "status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    save_file TEXT NOT NULL UNIQUE,
+    game TEXT NOT NULL,
+    ruleset TEXT NOT NULL,
+    run_number INTEGER NOT NULL,
+    sub_region_clause INTEGER NOT NULL DEFAULT 0,
+    journal_file TEXT,
+    UNIQUE (game, ruleset, run_number)
+);
+CREATE TABLE IF NOT EXISTS pokemon (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    nickname TEXT NOT NULL,
+    species TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    caught_level INTEGER NOT NULL,
+    moves TEXT NOT NULL,
+    dvs TEXT NOT NULL,
+    encountered TEXT NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pokemon_run_position ON pokemon (run_id, position);
+CREATE INDEX IF NOT EXISTS pokemon_run_status ON pokemon (run_id, status);
+CREATE INDEX IF NOT EXISTS pokemon_status_species ON pokemon (status, species);
+CREATE TABLE IF NOT EXISTS encounters (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    location TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS encounters_run_location ON encounters (run_id, location);
+CREATE TABLE IF NOT EXISTS failed_encounters (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    location TEXT NOT NULL,
+    species TEXT NOT NULL,
+    level INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS failed_encounters_run ON failed_encounters (run_id);
+CREATE TABLE IF NOT EXISTS decisions (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    PRIMARY KEY (run_id, key)
+);
+"""
+
+
+def _apply_operation(connection: sqlite3.Connection, run_id: int, operation: SaveOperation) -> None:
+    payload = operation.payload
+    match operation.kind:
+        case SaveOperationType.ADD_FAILED_ENCOUNTER:
+            failed = payload["failed_encounter"]
+            connection.execute(
+                "INSERT INTO failed_encounters (run_id, location, species, level) VALUES (?, ?, ?, ?)",
+                (run_id, failed["location"], failed["species"], failed["level"]),
+            )
+        case SaveOperationType.ADD_POKEMON:
+            pokemon_dict = payload["pokemon"]
+            (position,) = connection.execute(
+                "SELECT COUNT(*) FROM pokemon WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+            connection.execute(INSERT_POKEMON, (run_id, position, *_pokemon_to_row(pokemon_dict)))
+            connection.execute(
+                "INSERT INTO encounters (run_id, location) VALUES (?, ?)",
+                (run_id, pokemon_dict["encountered"]),
+            )
+        case SaveOperationType.LEARN_MOVE:
+            connection.execute(
+                "UPDATE pokemon SET moves = json_set(moves, ?, ?) WHERE run_id = ? AND position = ?",
+                (f"$[{payload['slot']}]", payload["move"], run_id, payload["index"]),
+            )
+        case SaveOperationType.MAKE_DECISION:
+            connection.execute(
+                "INSERT INTO decisions (run_id, key, outcome) VALUES (?, ?, ?) "
+                "ON CONFLICT (run_id, key) DO UPDATE SET outcome = excluded.outcome",
+                (run_id, payload["key"], payload["outcome"]),
+            )
+        case SaveOperationType.REMOVE_POKEMON:
+            row = connection.execute(
+                "SELECT encountered FROM pokemon WHERE run_id = ? AND position = ?",
+                (run_id, payload["index"]),
+            ).fetchone()
+            if row is None:
+                err_msg = f"No Pokemon at position {payload['index']}"
+                raise IndexError(err_msg)
+            connection.execute(
+                "DELETE FROM pokemon WHERE run_id = ? AND position = ?",
+                (run_id, payload["index"]),
+            )
+            connection.execute(
+                "UPDATE pokemon SET position = position - 1 WHERE run_id = ? AND position > ?",
+                (run_id, payload["index"]),
+            )
+            connection.execute(
+                "DELETE FROM encounters WHERE id = ("
+                "SELECT id FROM encounters WHERE run_id = ? AND location = ? ORDER BY id LIMIT 1"
+                ") AND NOT EXISTS (SELECT 1 FROM pokemon WHERE run_id = ? AND encountered = ?)",
+                (run_id, row[0], run_id, row[0]),
+            )
+        case SaveOperationType.TRANSFER_POKEMON:
+            connection.execute(
+                "UPDATE pokemon SET status = ? WHERE run_id = ? AND position = ?",
+                (payload["status"], run_id, payload["index"]),
+            )
+        case SaveOperationType.UPDATE_POKEMON:
+            connection.execute(
+                "UPDATE pokemon SET nickname = ?, species = ?, level = ?, caught_level = ?, moves = ?, "
+                "dvs = ?, encountered = ?, status = ? WHERE run_id = ? AND position = ?",
+                (*_pokemon_to_row(payload["pokemon"]), run_id, payload["index"]),
+            )
+
+
+def _get_run_id(connection: sqlite3.Connection, save_file: Path) -> int:
+    row = connection.execute("SELECT id FROM runs WHERE save_file = ?", (save_file.name,)).fetchone()
+    if row is None:
+        err_msg = f"No saved run named {save_file.name}"
+        raise FileNotFoundError(err_msg)
+    return row[0]
+
+
+def _pokemon_from_row(row: tuple) -> Pokemon:
+    nickname, species, level, caught_level, moves, dvs, encountered, status = row
+    return pokemon_from_dict(
+        {
+            "nickname": nickname,
+            "species": species,
+            "level": level,
+            "caught_level": caught_level,
+            "moves": json.loads(moves),
+            "dvs": json.loads(dvs),
+            "encountered": encountered,
+            "status": status,
+        },
+    )
+
+
+def _pokemon_to_row(pokemon_dict: dict) -> tuple:
+    return (
+        pokemon_dict["nickname"],
+        pokemon_dict["species"],
+        pokemon_dict["level"],
+        pokemon_dict["caught_level"],
+        json.dumps(pokemon_dict["moves"]),
+        json.dumps(pokemon_dict["dvs"]),
+        pokemon_dict["encountered"],
+        pokemon_dict["status"],
+    )
+
+
+def _write_snapshot(connection: sqlite3.Connection, run_id: int, snapshot: dict) -> None:
+    connection.execute(
+        "UPDATE runs SET game = ?, ruleset = ?, sub_region_clause = ?, journal_file = ? WHERE id = ?",
+        (*snapshot["run"], run_id),
+    )
+    for statement in CLEAR_RUN:
+        connection.execute(statement, (run_id,))
+    connection.executemany(
+        INSERT_POKEMON,
+        [(run_id, position, *row) for position, row in enumerate(snapshot["pokemon"])],
+    )
+    connection.executemany(
+        "INSERT INTO encounters (run_id, location) VALUES (?, ?)",
+        [(run_id, location) for location in snapshot["encounters"]],
+    )
+    connection.executemany(
+        "INSERT INTO failed_encounters (run_id, location, species, level) VALUES (?, ?, ?, ?)",
+        [(run_id, *row) for row in snapshot["failed_encounters"]],
+    )
+    connection.executemany(
+        "INSERT INTO decisions (run_id, key, outcome) VALUES (?, ?, ?)",
+        [(run_id, *decision) for decision in snapshot["decisions"]],
+    )
+
+
+class SqliteSaveWriter(SaveWriter):
+    _write_errors = (IndexError, KeyError, OSError, ValueError, sqlite3.Error)
+
+    def __init__(
+        self, connection: sqlite3.Connection, connection_lock: threading.Lock, database: Path
+    ) -> None:
+        super().__init__(0)
+        self._connection = connection
+        self._connection_lock = connection_lock
+        self._database = database
+
+    def _run_job(self, job: SaveJob) -> None:
+        with self._connection_lock, self._connection:
+            run_id = _get_run_id(self._connection, job.path)
+            if job.snapshot is None:
+                _, operation = SaveOperation.from_entry(json.loads(job.entry))
+                _apply_operation(self._connection, run_id, operation)
+                return
+            _write_snapshot(self._connection, run_id, job.snapshot)
+        LOGGER.info("Game saved to run %s in %s", job.path, self._database)
+
+
+class SqliteSaveService(SaveService):
+    def __init__(self, database: Path | None = None) -> None:
+        self._connection_lock = threading.Lock()
+        self._database = PathConfig.save_database() if database is None else database
+        self._connection = sqlite3.connect(self._database, check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._failures_seen = 0
+        super().__init__(writer=SqliteSaveWriter(self._connection, self._connection_lock, self._database))
+
+    def _record_operation(self, game_state: GameState, operation: SaveOperation) -> None:
+        with self._lock:
+            self._log_sequence += 1
+            self._log_state = game_state
+            self._writer.append(game_state.save_file, operation.to_entry(self._log_sequence))
+        if self._take_failures():
+            self.request_save(game_state)
+
+    def _take_failures(self) -> bool:
+        failures = self._writer.stats.failures
+        with self._lock:
+            new_failures = failures > self._failures_seen
+            self._failures_seen = failures
+        return new_failures
+
+    @property
+    def backend(self) -> SaveBackend:
+        return SaveBackend.SQLITE
+
+    def convert_session(self, filepath: Path, save_format: SaveFormat, target: Path | None = None) -> Path:
+        game_state = self.load_session(filepath)
+        game_state.save_file = (
+            PathConfig.save_folder() / game_state.save_file.name if target is None else target
+        )
+        exporter = SaveService(save_format=save_format)
+        exporter.save_session(game_state)
+        exporter.wait_for_writes()
+        if exporter.writer_stats.failures:
+            err_msg = f"Unable to convert {filepath}: {exporter.writer_stats.last_error}"
+            raise OSError(err_msg)
+        return game_state.save_file
+
+    def count_pokemon_by_status(self) -> dict[str, dict[PokemonStatus, int]]:
+        with self._connection_lock:
+            rows = self._connection.execute(
+                "SELECT runs.save_file, pokemon.status, COUNT(*) FROM pokemon "
+                "JOIN runs ON runs.id = pokemon.run_id GROUP BY pokemon.run_id, pokemon.status "
+                "ORDER BY runs.id",
+            ).fetchall()
+        counts: dict[str, dict[PokemonStatus, int]] = {}
+        for save_file, status, count in rows:
+            counts.setdefault(save_file, {})[PokemonStatus[status]] = count
+        return counts
+
+    def create_save_file(self, game: str, ruleset: str) -> Path:
+        with self._connection_lock, self._connection:
+            (save_file,) = self._connection.execute(
+                "INSERT INTO runs (save_file, game, ruleset, run_number) "
+                "SELECT ?1 || '_' || ?2 || '_' || next_number || '.sav', ?1, ?2, next_number FROM ("
+                "SELECT COALESCE(MAX(run_number), 0) + 1 AS next_number FROM runs "
+                "WHERE game = ?1 AND ruleset = ?2"
+                ") RETURNING save_file",
+                (game, ruleset),
+            ).fetchone()
+        LOGGER.info("Created new run %s in %s", save_file, self._database)
+        return Path(save_file)
+
+    def find_pokemon(
+        self,
+        species: str | None = None,
+        status: PokemonStatus | None = None,
+    ) -> list[tuple[Path, Pokemon]]:
+        with self._connection_lock:
+            rows = self._connection.execute(
+                "SELECT runs.save_file, pokemon.nickname, pokemon.species, pokemon.level, "
+                "pokemon.caught_level, pokemon.moves, pokemon.dvs, pokemon.encountered, pokemon.status "
+                "FROM pokemon "
+                "JOIN runs ON runs.id = pokemon.run_id "
+                "WHERE (?1 IS NULL OR pokemon.status = ?1) AND (?2 IS NULL OR pokemon.species = ?2) "
+                "ORDER BY runs.id, pokemon.position",
+                (None if status is None else status.name, species),
+            ).fetchall()
+        return [(Path(row[0]), _pokemon_from_row(row[1:])) for row in rows]
+
+    def flush(self, *, compact: bool = True) -> bool:
+        if compact and self.wait_for_writes() and self._take_failures():
+            with self._lock:
+                if self._pending_state is None:
+                    self._pending_state = self._log_state
+        return super().flush(compact=compact)
+
+    def import_session(self, filepath: Path) -> Path:
+        game_state = SaveService().load_session(filepath)
+        game_state.save_file = self.create_save_file(game_state.game, game_state.ruleset)
+        failures = self._writer.stats.failures
+        self.save_session(game_state)
+        self.wait_for_writes()
+        if self._writer.stats.failures > failures:
+            err_msg = f"Unable to import {filepath}: {self._writer.stats.last_error}"
+            raise OSError(err_msg)
+        return game_state.save_file
+
+    def list_sessions(self) -> list[Path]:
+        with self._connection_lock:
+            rows = self._connection.execute("SELECT save_file FROM runs ORDER BY id").fetchall()
+        return [Path(save_file) for (save_file,) in rows]
+
+    def load_session(self, filepath: Path) -> GameState:
+        with self._connection_lock:
+            connection = self._connection
+            run_id = _get_run_id(connection, filepath)
+            game, ruleset, sub_region_clause, journal_file, save_file = connection.execute(
+                "SELECT game, ruleset, sub_region_clause, journal_file, save_file FROM runs WHERE id = ?",
+                (run_id,),
+            ).fetchone()
+            pokemon_rows = connection.execute(
+                "SELECT nickname, species, level, caught_level, moves, dvs, encountered, status FROM pokemon "
+                "WHERE run_id = ? ORDER BY position",
+                (run_id,),
+            ).fetchall()
+            encounter_rows = connection.execute(
+                "SELECT location FROM encounters WHERE run_id = ? ORDER BY id",
+                (run_id,),
+            ).fetchall()
+            failed_rows = connection.execute(
+                "SELECT location, species, level FROM failed_encounters WHERE run_id = ? ORDER BY id",
+                (run_id,),
+            ).fetchall()
+            decision_rows = connection.execute(
+                "SELECT key, outcome FROM decisions WHERE run_id = ? ORDER BY rowid",
+                (run_id,),
+            ).fetchall()
+        with self._lock:
+            self._log_entries = 0
+            self._log_state = None
+        LOGGER.info("Game loaded from run %s in %s", save_file, self._database)
+        return GameState(
+            game,
+            ruleset,
+            bool(sub_region_clause),
+            None if journal_file is None else Path(journal_file),
+            Path(save_file),
+            [_pokemon_from_row(row) for row in pokemon_rows],
+            [sys.intern(location) for (location,) in encounter_rows],
+            [FailedEncounter(*row) for row in failed_rows],
+            dict(decision_rows),
+        )
+
+    def save_session(self, game_state: GameState) -> None:
+        snapshot = {
+            "run": (
+                game_state.game,
+                game_state.ruleset,
+                game_state.sub_region_clause,
+                None if game_state.journal_file is None else str(game_state.journal_file),
+            ),
+            "pokemon": [_pokemon_to_row(pokemon_to_dict(pokemon)) for pokemon in game_state.pokemon],
+            "encounters": list(game_state.encounters),
+            "failed_encounters": [
+                (failed.location, failed.species, failed.level) for failed in game_state.failed_encounters
+            ],
+            "decisions": list(game_state.decisions.items()),
+        }
+        with self._lock:
+            self._log_entries = 0
+            self._writer.submit(game_state.save_file, snapshot)
@@ -0,0 +1,45 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from nuzlocke_tool.constants import STAT_CACHE_LIMIT
+
+
+class StatCache:
+    def __init__(self, max_entries: int = STAT_CACHE_LIMIT) -> None:
+        self._entries: OrderedDict[tuple, dict[str, str | int | list[str]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(
+        self,
+        key: tuple,
+        compute: Callable[[], dict[str, str | int | list[str]]],
+    ) -> dict[str, str | int | list[str]]:
+        with self._lock:
+            stats = self._entries.get(key)
+            if stats is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return stats.copy()
+            self.misses += 1
+        stats = compute()
+        with self._lock:
+            self._entries[key] = stats
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return stats.copy()
+
+    def invalidate(self, species: str | None = None) -> None:
+        with self._lock:
+            if species is None:
+                self._entries.clear()
+                return
+            stale_keys = [key for key in self._entries if key[2] == species]
+            for key in stale_keys:
+                del self._entries[key]
@@ -0,0 +1,299 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Self
+
+import numpy as np
+
+from nuzlocke_tool.constants import (
+    BATTLE_TURN_LIMIT,
+    POKEMON_DV_MAX,
+    POKEMON_DV_MIN,
+    SIMULATION_TRIAL_CHUNK,
+    SIMULATION_TRIALS,
+)
+from nuzlocke_tool.damage import (
+    HIT_COUNTS,
+    AttackerArrays,
+    as_columns,
+    build_attacker_row,
+    build_move_arrays,
+    build_party_defender_arrays,
+    calculate_damage_matrix,
+    calculate_roll_distribution,
+)
+from nuzlocke_tool.models.models import BattlePolicy, MoveEffect, Pokemon
+from nuzlocke_tool.sweep import SweepTables
+
+
+@dataclass(frozen=True)
+class BattleReport:
+    trials: int
+    wins: int
+    losses: int
+    unresolved: int
+    expected_hp_remaining: float
+    expected_defender_hp_remaining: float
+    mean_turns: float
+    dv_samples: int
+    simulations_per_second: float
+
+    @property
+    def win_probability(self) -> float:
+        return self.wins / self.trials if self.trials else 0.0
+
+
+@dataclass(frozen=True)
+class BattleSide:
+    hp: int
+    speed: int
+    move_cdf: np.ndarray
+    accuracy_rate: np.ndarray
+    roll_damage: np.ndarray
+    roll_cdf: np.ndarray
+    hit_cdf: np.ndarray
+    faints_user: np.ndarray
+
+
+@dataclass(frozen=True)
+class BattleTally:
+    trials: int
+    wins: int
+    losses: int
+    hp_remaining: int
+    defender_hp_remaining: int
+    turns: int
+
+
+@dataclass(frozen=True)
+class Combatant:
+    species: str
+    level: int
+    dvs: dict[str, int] | None
+    moves: tuple[str, ...]
+    attack_stages: tuple[int, int, int] = (0, 0, 0)
+    defense_stages: tuple[int, int] = (0, 0)
+
+    @classmethod
+    def from_pokemon(
+        cls,
+        pokemon: Pokemon,
+        attack_stages: tuple[int, int, int] = (0, 0, 0),
+        defense_stages: tuple[int, int] = (0, 0),
+    ) -> Self:
+        moves = tuple(move for move in pokemon.moves if move)
+        return cls(pokemon.species, pokemon.level, dict(pokemon.dvs), moves, attack_stages, defense_stages)
+
+    @classmethod
+    def wild(cls, species: str, level: int, moves: tuple[str, ...]) -> Self:
+        return cls(species, level, None, moves)
+
+    def with_sampled_dvs(self, rng: np.random.Generator) -> Self:
+        if self.dvs is not None:
+            return self
+        stats = ("Atk", "Def", "Spd", "Spe")
+        dvs = dict(
+            zip(stats, rng.integers(POKEMON_DV_MIN, POKEMON_DV_MAX + 1, len(stats)).tolist(), strict=True)
+        )
+        dvs["HP"] = sum((dv & 1) << shift for dv, shift in zip(dvs.values(), (3, 2, 1, 0), strict=True))
+        return replace(self, dvs=dvs)
+
+
+def _sample_index(rng: np.random.Generator, cdf: np.ndarray) -> np.ndarray:
+    draws = rng.random(len(cdf))[:, np.newaxis]
+    return np.minimum((draws >= cdf).sum(axis=-1), cdf.shape[-1] - 1)
+
+
+def _sample_attack(side: BattleSide, rng: np.random.Generator, trials: int) -> tuple[np.ndarray, np.ndarray]:
+    move_index = _sample_index(rng, np.broadcast_to(side.move_cdf, (trials, len(side.move_cdf))))
+    hit = rng.random(trials) < side.accuracy_rate[move_index]
+    roll_index = _sample_index(rng, side.roll_cdf[move_index])
+    hit_index = _sample_index(rng, side.hit_cdf[move_index])
+    damage = side.roll_damage[move_index, roll_index] * HIT_COUNTS[hit_index]
+    return np.where(hit, damage, 0), side.faints_user[move_index]
+
+
+def _select_moves(long_term_average: np.ndarray, valid: np.ndarray, policy: BattlePolicy) -> np.ndarray:
+    if policy == BattlePolicy.RANDOM_MOVE:
+        weights = np.ones(len(valid), dtype=np.float64)
+    else:
+        weights = np.zeros(len(valid), dtype=np.float64)
+        if valid.any():
+            weights[int(np.argmax(np.where(valid, long_term_average, -np.inf)))] = 1.0
+        else:
+            weights[:] = 1.0
+    return np.cumsum(weights / weights.sum())
+
+
+def build_battle_side(
+    tables: SweepTables,
+    user: Combatant,
+    target: Combatant,
+    policy: BattlePolicy,
+) -> BattleSide:
+    species_table = tables.species_table
+    user_row = build_attacker_row(species_table, user.species, user.level, user.dvs, user.attack_stages)
+    user_hp = build_party_defender_arrays(
+        species_table,
+        [(user.species, user.level, user.dvs, user.defense_stages)],
+    ).hp
+    target_arrays = build_party_defender_arrays(
+        species_table,
+        [(target.species, target.level, target.dvs, target.defense_stages)],
+    )
+    moves = [move for move in user.moves if move in tables.move_records] or [None]
+    move_arrays = build_move_arrays(
+        [move for move in moves if move is not None],
+        tables.move_records,
+        species_table.types,
+    )
+    if moves == [None]:
+        return BattleSide(
+            int(user_hp[0]),
+            user_row[3],
+            np.ones(1, dtype=np.float64),
+            np.zeros(1, dtype=np.float64),
+            np.zeros((1, 1), dtype=np.int64),
+            np.ones((1, 1), dtype=np.float64),
+            np.ones((1, 1), dtype=np.float64),
+            np.zeros(1, dtype=bool),
+        )
+    move_columns = as_columns(move_arrays)
+    damage = calculate_damage_matrix(
+        as_columns(AttackerArrays(*np.array([user_row] * len(moves), dtype=np.int64).T)),
+        move_columns,
+        target_arrays,
+        (False, False),
+        tables.type_matrix,
+    )
+    distribution = calculate_roll_distribution(damage, move_columns)
+    valid = damage.valid[:, 0]
+    roll_probability = distribution.probability[:, 0]
+    roll_total = roll_probability.sum(axis=-1, keepdims=True)
+    roll_probability = np.divide(
+        roll_probability,
+        roll_total,
+        out=np.zeros_like(roll_probability),
+        where=roll_total > 0,
+    )
+    return BattleSide(
+        int(user_hp[0]),
+        user_row[3],
+        _select_moves(damage.long_term_average[:, 0], valid, policy),
+        np.where(valid, np.minimum(distribution.accuracy_rate[:, 0], 1.0), 0.0),
+        distribution.damage[:, 0],
+        np.cumsum(roll_probability, axis=-1),
+        np.cumsum(distribution.hit_weights[:, 0], axis=-1),
+        move_arrays.has_effect(MoveEffect.SELFDESTRUCT),
+    )
+
+
+def simulate_battle_chunk(
+    attacker: BattleSide,
+    defender: BattleSide,
+    trials: int,
+    seed: np.random.SeedSequence,
+    turn_limit: int = BATTLE_TURN_LIMIT,
+) -> BattleTally:
+    rng = np.random.default_rng(seed)
+    attacker_hp = np.full(trials, attacker.hp, dtype=np.int64)
+    defender_hp = np.full(trials, defender.hp, dtype=np.int64)
+    turns = np.zeros(trials, dtype=np.int64)
+    for _ in range(turn_limit):
+        active = (attacker_hp > 0) & (defender_hp > 0)
+        if not active.any():
+            break
+        turns += active
+        speed_tie = rng.integers(2, size=trials, dtype=bool)
+        attacker_first = (attacker.speed > defender.speed) | ((attacker.speed == defender.speed) & speed_tie)
+        attacker_damage, attacker_faints = _sample_attack(attacker, rng, trials)
+        defender_damage, defender_faints = _sample_attack(defender, rng, trials)
+        first = active & attacker_first
+        defender_hp = np.where(first, defender_hp - attacker_damage, defender_hp)
+        attacker_hp = np.where(first & attacker_faints, 0, attacker_hp)
+        second = first & (defender_hp > 0) & (attacker_hp > 0)
+        attacker_hp = np.where(second, attacker_hp - defender_damage, attacker_hp)
+        defender_hp = np.where(second & defender_faints, 0, defender_hp)
+        first = active & ~attacker_first
+        attacker_hp = np.where(first, attacker_hp - defender_damage, attacker_hp)
+        defender_hp = np.where(first & defender_faints, 0, defender_hp)
+        second = first & (attacker_hp > 0) & (defender_hp > 0)
+        defender_hp = np.where(second, defender_hp - attacker_damage, defender_hp)
+        attacker_hp = np.where(second & attacker_faints, 0, attacker_hp)
+    attacker_hp = np.maximum(attacker_hp, 0)
+    defender_hp = np.maximum(defender_hp, 0)
+    return BattleTally(
+        trials,
+        int(((defender_hp == 0) & (attacker_hp > 0)).sum()),
+        int((attacker_hp == 0).sum()),
+        int(attacker_hp.sum()),
+        int(defender_hp.sum()),
+        int(turns.sum()),
+    )
+
+
+class BattleSimulator:
+    def __init__(self, tables: SweepTables, max_workers: int | None = None) -> None:
+        self._max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self._tables = tables
+
+    def run(
+        self,
+        matchups: list[tuple[Combatant, Combatant]],
+        trials: int = SIMULATION_TRIALS,
+        seed: int = 0,
+        policies: tuple[BattlePolicy, BattlePolicy] = (BattlePolicy.BEST_MOVE, BattlePolicy.RANDOM_MOVE),
+        chunk_size: int = SIMULATION_TRIAL_CHUNK,
+    ) -> list[BattleReport]:
+        if trials <= 0:
+            err_msg = f"Simulation needs a positive number of trials, got {trials}"
+            raise ValueError(err_msg)
+        attacker_policy, defender_policy = policies
+        chunk_trials = [min(chunk_size, trials - start) for start in range(0, trials, chunk_size)]
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = []
+            for (attacker, defender), matchup_seed in zip(
+                matchups,
+                np.random.SeedSequence(seed).spawn(len(matchups)),
+                strict=True,
+            ):
+                matchup_futures = []
+                for count, chunk_seed in zip(
+                    chunk_trials, matchup_seed.spawn(len(chunk_trials)), strict=True
+                ):
+                    dv_rng = np.random.default_rng(chunk_seed.spawn(1)[0])
+                    chunk_attacker = attacker.with_sampled_dvs(dv_rng)
+                    chunk_defender = defender.with_sampled_dvs(dv_rng)
+                    matchup_futures.append(
+                        executor.submit(
+                            simulate_battle_chunk,
+                            build_battle_side(self._tables, chunk_attacker, chunk_defender, attacker_policy),
+                            build_battle_side(self._tables, chunk_defender, chunk_attacker, defender_policy),
+                            count,
+                            chunk_seed,
+                        ),
+                    )
+                futures.append(matchup_futures)
+            tallies = [[future.result() for future in matchup_futures] for matchup_futures in futures]
+        simulations_per_second = len(matchups) * trials / (time.perf_counter() - start)
+        reports = []
+        for (attacker, defender), matchup_tallies in zip(matchups, tallies, strict=True):
+            total = sum(tally.trials for tally in matchup_tallies)
+            wins = sum(tally.wins for tally in matchup_tallies)
+            losses = sum(tally.losses for tally in matchup_tallies)
+            reports.append(
+                BattleReport(
+                    total,
+                    wins,
+                    losses,
+                    total - wins - losses,
+                    sum(tally.hp_remaining for tally in matchup_tallies) / total,
+                    sum(tally.defender_hp_remaining for tally in matchup_tallies) / total,
+                    sum(tally.turns for tally in matchup_tallies) / total,
+                    len(matchup_tallies) if attacker.dvs is None or defender.dvs is None else 0,
+                    simulations_per_second,
+                ),
+            )
+        return reports
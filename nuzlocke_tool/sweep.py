@@ -0,0 +1,162 @@
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import Self
+
+import numpy as np
+
+from nuzlocke_tool.constants import POKEMON_LEVEL_MAX, POKEMON_LEVEL_MIN, SWEEP_LEVEL_CHUNK
+from nuzlocke_tool.damage import (
+    AttackerArrays,
+    build_attacker_row,
+    build_move_arrays,
+    calculate_dex_best_moves,
+)
+from nuzlocke_tool.models.models import GenerationData, Pokemon, PokemonData
+from nuzlocke_tool.models.tables import MoveRecord, SpeciesStatTable
+
+_WORKER_STATE: dict[str, "SweepTables"] = {}
+
+
+@dataclass(frozen=True)
+class SweepAttacker:
+    nickname: str
+    species: str
+    level: int
+    dvs: dict[str, int]
+    moves: tuple[str, ...]
+    stat_stages: tuple[int, int, int] = (0, 0, 0)
+
+    @classmethod
+    def from_pokemon(cls, pokemon: Pokemon, stat_stages: tuple[int, int, int] = (0, 0, 0)) -> Self:
+        moves = tuple(move for move in pokemon.moves if move)
+        return cls(pokemon.nickname, pokemon.species, pokemon.level, dict(pokemon.dvs), moves, stat_stages)
+
+
+@dataclass(frozen=True)
+class SweepChunk:
+    attacker_index: int
+    levels: tuple[int, ...]
+    best_move: np.ndarray
+    long_term_average: np.ndarray
+    damage_min: np.ndarray
+    damage_max: np.ndarray
+
+
+@dataclass(frozen=True)
+class SweepTables:
+    species_table: SpeciesStatTable
+    move_records: dict[str, MoveRecord]
+    type_matrix: np.ndarray
+
+    @classmethod
+    def from_generation_data(cls, generation_data: GenerationData) -> Self:
+        return cls(
+            generation_data.species_table,
+            generation_data.move_records,
+            generation_data.type_chart.effectiveness,
+        )
+
+
+def _initialize_worker(tables: SweepTables) -> None:
+    _WORKER_STATE["tables"] = tables
+
+
+def _run_worker_chunk(
+    attacker_index: int,
+    attacker: SweepAttacker,
+    levels: tuple[int, ...],
+    effects: tuple[bool, bool],
+) -> SweepChunk:
+    return calculate_sweep_chunk(_WORKER_STATE["tables"], attacker_index, attacker, levels, effects)
+
+
+def calculate_sweep_chunk(
+    tables: SweepTables,
+    attacker_index: int,
+    attacker: SweepAttacker,
+    levels: tuple[int, ...],
+    effects: tuple[bool, bool],
+) -> SweepChunk:
+    moves = [move for move in attacker.moves if move in tables.move_records]
+    shape = (len(tables.species_table.species), len(levels))
+    if not moves:
+        return SweepChunk(
+            attacker_index,
+            levels,
+            np.full(shape, -1, dtype=np.int64),
+            np.zeros(shape, dtype=np.float64),
+            np.zeros(shape, dtype=np.int64),
+            np.zeros(shape, dtype=np.int64),
+        )
+    attacker_row = build_attacker_row(
+        tables.species_table,
+        attacker.species,
+        attacker.level,
+        attacker.dvs,
+        attacker.stat_stages,
+    )
+    best_move, long_term_average, damage_min, damage_max = calculate_dex_best_moves(
+        AttackerArrays(*np.array([attacker_row] * len(moves), dtype=np.int64).T),
+        build_move_arrays(moves, tables.move_records, tables.species_table.types),
+        tables.species_table,
+        np.array(levels, dtype=np.int64),
+        effects,
+        tables.type_matrix,
+    )
+    move_indices = np.array([attacker.moves.index(move) for move in moves], dtype=np.int64)
+    best_move = np.where(best_move >= 0, move_indices[np.maximum(best_move, 0)], -1)
+    return SweepChunk(attacker_index, levels, best_move, long_term_average, damage_min, damage_max)
+
+
+def expand_evolutions(
+    attackers: Iterable[SweepAttacker],
+    pokemon_data: dict[str, PokemonData],
+) -> list[SweepAttacker]:
+    expanded = []
+    for attacker in attackers:
+        pending = [attacker.species]
+        seen = set()
+        while pending:
+            species = pending.pop(0)
+            if species in seen or species not in pokemon_data:
+                continue
+            seen.add(species)
+            expanded.append(replace(attacker, species=species))
+            pending.extend(pokemon_data[species].get("evolve", []))
+    return expanded
+
+
+class SweepRunner:
+    def __init__(self, tables: SweepTables, max_workers: int | None = None) -> None:
+        self._max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self._tables = tables
+
+    def run(
+        self,
+        attackers: list[SweepAttacker],
+        levels: range = range(POKEMON_LEVEL_MIN, POKEMON_LEVEL_MAX + 1),
+        effects: tuple[bool, bool] = (False, False),
+        chunk_size: int = SWEEP_LEVEL_CHUNK,
+    ) -> Iterator[SweepChunk]:
+        level_values = tuple(levels)
+        level_chunks = [
+            level_values[start : start + chunk_size] for start in range(0, len(level_values), chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_initialize_worker,
+            initargs=(self._tables,),
+        ) as executor:
+            futures = [
+                executor.submit(_run_worker_chunk, attacker_index, attacker, chunk_levels, effects)
+                for attacker_index, attacker in enumerate(attackers)
+                for chunk_levels in level_chunks
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
@@ -1,8 +1,3 @@
-import logging
-from pathlib import Path
-from typing import Any
-
-import yaml
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import QLabel, QLayout, QWidget
@@ -10,8 +5,6 @@ from PyQt6.QtWidgets import QLabel, QLayout, QWidget
 from nuzlocke_tool.config import PathConfig
 from nuzlocke_tool.constants import IMAGE_SIZE_POKEMON
 
-LOGGER = logging.getLogger(__name__)
-
 
 def add_pokemon_image(layout: QLayout, species: str, parent: QWidget) -> QLabel:
     pixmap = load_pokemon_image(species)
@@ -51,10 +44,3 @@ def load_pokemon_image(species: str) -> QPixmap:
     filename = get_image_filename(species)
     image_path = f"{PathConfig.images_folder()!s}/{filename}.png"
     return QPixmap(image_path)
-
-
-def load_yaml_file(file_path: Path) -> dict[str, Any]:
-    with file_path.open("r") as f:
-        data = yaml.safe_load(f)
-    LOGGER.info("Loaded YAML file: %s", str(file_path))
-    return data
@@ -0,0 +1,63 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from nuzlocke_tool.config import PathConfig
+from nuzlocke_tool.constants import YAML_CACHE_PATH_HASH_LENGTH, YAML_CACHE_VERSION
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _read_yaml_cache(cache_file: Path, digest: str) -> dict[str, Any] | None:
+    if not cache_file.exists():
+        return None
+    try:
+        with cache_file.open("rb") as f:
+            version, cached_digest, data = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        LOGGER.warning("Discarding unreadable YAML cache: %s", str(cache_file))
+        return None
+    if version != YAML_CACHE_VERSION or cached_digest != digest:
+        return None
+    return data
+
+
+def _write_yaml_cache(cache_file: Path, digest: str, data: dict[str, Any]) -> None:
+    try:
+        fd, temp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.name}.", suffix=".tmp")
+    except OSError:
+        LOGGER.warning("Unable to write YAML cache: %s", str(cache_file))
+        return
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((YAML_CACHE_VERSION, digest, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(cache_file)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        LOGGER.warning("Unable to write YAML cache: %s", str(cache_file))
+
+
+def get_yaml_cache_file(file_path: Path) -> Path:
+    path_hash = hashlib.sha256(str(file_path.resolve()).encode()).hexdigest()[:YAML_CACHE_PATH_HASH_LENGTH]
+    return PathConfig.cache_folder() / f"{file_path.stem}-{path_hash}.pickle"
+
+
+def load_yaml_file(file_path: Path) -> dict[str, Any]:
+    source = file_path.read_bytes()
+    digest = hashlib.sha256(source).hexdigest()
+    cache_file = get_yaml_cache_file(file_path)
+    data = _read_yaml_cache(cache_file, digest)
+    if data is not None:
+        LOGGER.info("Loaded cached YAML file: %s", str(file_path))
+        return data
+    data = yaml.safe_load(source)
+    _write_yaml_cache(cache_file, digest, data)
+    LOGGER.info("Loaded YAML file: %s", str(file_path))
+    return data